@@ -0,0 +1,89 @@
+"""
+Async benchmark: concurrent requests sustained by one process.
+
+Spawns C concurrent client coroutines, each issuing R requests (70% get,
+20% paged list, 10% add) against one AsyncTodoManager, and reports
+requests per second and p50/p99 latency. Runs both an in-memory manager
+(called inline) and a journal-backed one (called on the bounded pool).
+
+Usage:
+    python benchmarks/bench_async.py [--clients 100,1000,10000] [--requests 20]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from todo_app.async_manager import AsyncTodoManager
+from todo_app.concurrency import ThreadSafeTodoManager
+from todo_app.storage import JournalStorage
+
+SEED_TASKS = 10_000
+
+
+async def client(
+    manager: AsyncTodoManager, requests: int, seed: int, latencies: list[float]
+) -> None:
+    """Issue requests against the manager, recording each latency."""
+    rng = random.Random(seed)
+    for _ in range(requests):
+        roll = rng.random()
+        began = time.perf_counter()
+        if roll < 0.7:
+            await manager.get_task(rng.randint(1, SEED_TASKS))
+        elif roll < 0.9:
+            await manager.list_tasks(limit=20, after_id=rng.randint(1, SEED_TASKS))
+        else:
+            await manager.add_task(title="New task")
+        latencies.append(time.perf_counter() - began)
+
+
+async def run(manager: AsyncTodoManager, clients: int, requests: int) -> str:
+    """Run one load level and return a formatted result line."""
+    latencies: list[float] = []
+    began = time.perf_counter()
+    await asyncio.gather(
+        *(client(manager, requests, seed, latencies) for seed in range(clients))
+    )
+    elapsed = time.perf_counter() - began
+    cuts = statistics.quantiles(latencies, n=100)
+    return (
+        f"{clients:6d} clients : {len(latencies) / elapsed:10,.0f} req/s  "
+        f"p50 {cuts[49] * 1e3:7.3f} ms  p99 {cuts[98] * 1e3:7.3f} ms"
+    )
+
+
+async def bench(
+    label: str, manager: ThreadSafeTodoManager, levels: list[int], requests: int
+) -> None:
+    """Seed the manager and run every load level against it."""
+    manager.import_tasks({"title": f"Task {i}"} for i in range(SEED_TASKS))
+    async with AsyncTodoManager(manager) as async_manager:
+        print(f"{label} (offload={async_manager.offload})")
+        for clients in levels:
+            print("  " + await run(async_manager, clients, requests))
+
+
+def main() -> None:
+    """Run the benchmark for an in-memory and a journal-backed manager."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--clients", default="100,1000,10000", help="Comma-separated client counts"
+    )
+    parser.add_argument("--requests", type=int, default=20, help="Requests per client")
+    args = parser.parse_args()
+    levels = [int(n) for n in args.clients.split(",")]
+
+    asyncio.run(bench("In-memory", ThreadSafeTodoManager(), levels, args.requests))
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = JournalStorage(os.path.join(tmp, "bench.journal"), fsync="batch")
+        manager = ThreadSafeTodoManager(storage)
+        asyncio.run(bench("Journal, fsync=batch", manager, levels, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Daemon benchmark: per-call latency of local vs. forwarded CLI commands.
+
+Times N `todo add` processes run locally against a journal (each replays
+the journal on startup) and N forwarded to a `todo serve` daemon holding
+the same tasks in memory, plus the raw socket round trip a forwarded call
+adds on top of interpreter startup.
+
+Usage:
+    python benchmarks/bench_daemon.py [--calls 200] [--seed 10000]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from todo_app import daemon
+from todo_app.manager import TodoManager
+from todo_app.storage import JournalStorage
+
+
+def time_calls(env: dict[str, str], calls: int) -> list[float]:
+    """Run `todo add` in a new process per call and return each latency."""
+    latencies = []
+    for i in range(calls):
+        began = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "todo_app.cli", "add", f"Task {i}"],
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        latencies.append(time.perf_counter() - began)
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    """Print the p50 and p99 of a latency sample in milliseconds."""
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{label:24s}: p50 {cuts[49] * 1e3:8.3f} ms  p99 {cuts[98] * 1e3:8.3f} ms")
+
+
+def wait_for_socket(path: str, timeout: float = 10.0) -> None:
+    """Block until the daemon accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            daemon.request(path, {"argv": ["list", "--limit", "1"]})
+            return
+        except Exception:
+            time.sleep(0.05)
+    raise RuntimeError(f"daemon did not start on {path}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=10_000, help="tasks preloaded")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        journal = os.path.join(directory, "todo.journal")
+        socket_path = os.path.join(directory, "todo.sock")
+        manager = TodoManager(storage=JournalStorage(journal))
+        for i in range(args.seed):
+            manager.add_task(title=f"Seed {i}")
+        manager.close()
+
+        env = dict(os.environ, TODO_JOURNAL=journal)
+        env.pop(daemon.SOCKET_ENV, None)
+        report("local (journal replay)", time_calls(env, args.calls))
+
+        server = subprocess.Popen(
+            [sys.executable, "-m", "todo_app.cli", "serve", "--socket", socket_path],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            wait_for_socket(socket_path)
+            report(
+                "forwarded (process)",
+                time_calls(dict(env, TODO_SOCKET=socket_path), args.calls),
+            )
+
+            latencies = []
+            for i in range(args.calls):
+                began = time.perf_counter()
+                daemon.request(socket_path, {"argv": ["add", f"Raw {i}"]})
+                latencies.append(time.perf_counter() - began)
+            report("forwarded (round trip)", latencies)
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
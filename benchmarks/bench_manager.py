@@ -0,0 +1,311 @@
+"""
+Manager benchmark suite: throughput, latency and memory per operation.
+
+For each task count, builds a TodoManager holding that many tasks (every
+third one completed) and times individual calls of every core operation,
+reporting ops/s, p50/p99 latency and the tracemalloc peak of a separate
+traced pass. Results can be saved as a JSON baseline and compared against
+one; the run exits with status 1 if any metric regresses by more than the
+tolerance.
+
+Usage:
+    python benchmarks/bench_manager.py [--sizes 1000,10000,100000] [--ops 2000]
+    python benchmarks/bench_manager.py --sizes 1000000,10000000  # needs GBs of RAM
+    python benchmarks/bench_manager.py --save benchmarks/baselines/manager.json
+    python benchmarks/bench_manager.py --compare benchmarks/baselines/manager.json \\
+        [--tolerance 0.25]
+
+Baselines are machine-specific: record one on the machine that compares.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from todo_app.manager import TodoManager
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_OPS = 2_000
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25
+PAGE_SIZE = 100
+
+# Metric -> True if higher is better
+METRICS = {"ops_per_sec": True, "p50_us": False, "p99_us": False, "peak_kb": False}
+
+# Absolute changes below these are noise, whatever the relative change
+NOISE_FLOOR = {"ops_per_sec": 0.0, "p50_us": 1.0, "p99_us": 5.0, "peak_kb": 16.0}
+
+# Given a populated manager, its size and an RNG, returns a zero-argument call
+Operation = Callable[[TodoManager, int, random.Random], Callable[[], Any]]
+
+
+def _add(manager: TodoManager, size: int, rng: random.Random) -> Callable[[], Any]:
+    """Add a new task."""
+    return lambda: manager.add_task(title="Benchmark")
+
+
+def _get(manager: TodoManager, size: int, rng: random.Random) -> Callable[[], Any]:
+    """Get a random existing task."""
+    return lambda: manager.get_task(rng.randint(1, size))
+
+
+def _list_page(status: str) -> Operation:
+    """Return an operation fetching one page of tasks after a random ID."""
+
+    def operation(
+        manager: TodoManager, size: int, rng: random.Random
+    ) -> Callable[[], Any]:
+        return lambda: manager.list_tasks(
+            status, limit=PAGE_SIZE, after_id=rng.randrange(size)
+        )
+
+    return operation
+
+
+def _sorted_page(sort: str) -> Operation:
+    """Return an operation fetching one page in an order after a random task."""
+
+    def operation(
+        manager: TodoManager, size: int, rng: random.Random
+    ) -> Callable[[], Any]:
+        return lambda: manager.list_tasks(
+            sort=sort, limit=PAGE_SIZE, after_id=rng.randint(1, size)
+        )
+
+    return operation
+
+
+def _count(manager: TodoManager, size: int, rng: random.Random) -> Callable[[], Any]:
+    """Count pending tasks."""
+    return lambda: manager.count_tasks("pending")
+
+
+def _update(manager: TodoManager, size: int, rng: random.Random) -> Callable[[], Any]:
+    """Rename a random existing task."""
+    return lambda: manager.update_task(rng.randint(1, size), title="Renamed")
+
+
+def _delete(manager: TodoManager, size: int, rng: random.Random) -> Callable[[], Any]:
+    """Delete existing tasks in random order (each ID once)."""
+    task_ids = [task.id for task in manager.iter_tasks()]
+    rng.shuffle(task_ids)
+    return lambda: manager.delete_task(task_ids.pop())
+
+
+# Run in this order; delete_task runs last so the others see every task
+OPERATIONS: dict[str, Operation] = {
+    "add_task": _add,
+    "get_task": _get,
+    "list_tasks[all]": _list_page("all"),
+    "list_tasks[pending]": _list_page("pending"),
+    "list_tasks[completed]": _list_page("completed"),
+    "list_tasks[-created]": _sorted_page("-created"),
+    "list_tasks[title]": _sorted_page("title"),
+    "count_tasks[pending]": _count,
+    "update_task": _update,
+    "delete_task": _delete,
+}
+
+
+def calibrate() -> float:
+    """
+    Return the best time (seconds) of a fixed pure-Python reference workload.
+
+    Baselines store this so comparisons can scale timings by the current
+    machine's speed instead of mistaking a slower CPU for a regression.
+    """
+    best = float("inf")
+    for _ in range(5):
+        began = time.perf_counter()
+        table: dict[int, str] = {}
+        for i in range(200_000):
+            table[i] = str(i)
+        sorted(table.values())
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def populate(size: int) -> TodoManager:
+    """Return a manager holding size tasks, every third one completed."""
+    manager = TodoManager()
+    for i in range(size):
+        task = manager.add_task(title=f"Task {i}", description="Benchmark task")
+        if i % 3 == 0:
+            manager.mark_complete(task.id)
+    return manager
+
+
+def measure(
+    manager: TodoManager, operation: Operation, size: int, ops: int, repeat: int
+) -> dict[str, float]:
+    """
+    Time ops calls individually, then trace memory over a shorter pass.
+
+    Timing is repeated and each metric keeps its best round, which filters
+    out interference from the rest of the machine.
+    """
+    call = operation(manager, size, random.Random(size))
+    clock = time.perf_counter_ns
+    rounds = []
+    for _ in range(repeat):
+        latencies = []
+        gc.collect()
+        for _ in range(ops):
+            began = clock()
+            call()
+            latencies.append(clock() - began)
+        rounds.append((sum(latencies), statistics.quantiles(latencies, n=100)))
+
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in range(max(ops // 10, 1)):
+        call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(ops / (min(total for total, _ in rounds) / 1e9), 1),
+        "p50_us": round(min(cuts[49] for _, cuts in rounds) / 1e3, 3),
+        "p99_us": round(min(cuts[98] for _, cuts in rounds) / 1e3, 3),
+        "peak_kb": round((peak - start) / 1024, 1),
+    }
+
+
+def run(
+    sizes: list[int], ops: int, repeat: int
+) -> dict[str, dict[str, dict[str, float]]]:
+    """Benchmark every operation at every size."""
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for size in sizes:
+        began = time.perf_counter()
+        manager = populate(size)
+        print(f"\n{size:,} tasks (built in {time.perf_counter() - began:.1f} s)")
+        print(
+            f"{'operation':24s} {'ops/s':>12s} {'p50 us':>9s} {'p99 us':>9s} "
+            f"{'peak KB':>9s}"
+        )
+        results[str(size)] = {}
+        for name, operation in OPERATIONS.items():
+            metrics = measure(manager, operation, size, ops, repeat)
+            results[str(size)][name] = metrics
+            print(
+                f"{name:24s} {metrics['ops_per_sec']:12,.0f} "
+                f"{metrics['p50_us']:9.2f} {metrics['p99_us']:9.2f} "
+                f"{metrics['peak_kb']:9.1f}"
+            )
+        del manager
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, dict[str, float]]],
+    baseline: dict[str, dict[str, dict[str, float]]],
+    tolerance: float,
+    speed: float = 1.0,
+) -> list[str]:
+    """
+    Return one message per metric that regressed beyond tolerance.
+
+    Sizes and operations missing from either side are skipped.
+
+    Args:
+        results: Metrics of this run
+        baseline: Metrics of the baseline run
+        tolerance: Allowed relative regression per metric
+        speed: This machine's calibration time divided by the baseline's;
+            baseline timings are scaled by it before comparing
+    """
+    regressions = []
+    for size, operations in results.items():
+        for name, metrics in operations.items():
+            expected = baseline.get(size, {}).get(name)
+            if expected is None:
+                continue
+            for metric, higher_is_better in METRICS.items():
+                if metric not in expected:
+                    continue
+                old, new = expected[metric], metrics[metric]
+                if metric == "ops_per_sec":
+                    old /= speed
+                elif metric != "peak_kb":
+                    old *= speed
+                if abs(new - old) <= NOISE_FLOOR[metric]:
+                    continue
+                if higher_is_better:
+                    regressed = new < old * (1 - tolerance)
+                else:
+                    regressed = new > old * (1 + tolerance)
+                if regressed:
+                    change = (new - old) / old * 100 if old else float("inf")
+                    regressions.append(
+                        f"{int(size):>11,} {name:24s} {metric:12s} "
+                        f"{old:12,.2f} -> {new:12,.2f} ({change:+.0f}%)"
+                    )
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="Comma-separated task counts (default: 1000,10000,100000)",
+    )
+    parser.add_argument("--ops", type=int, default=DEFAULT_OPS, help="Calls per round")
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help="Timing rounds (best wins)"
+    )
+    parser.add_argument("--save", metavar="PATH", help="Write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Baseline to compare to")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed relative regression per metric (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    calibration = calibrate()
+    results = run(sizes, args.ops, args.repeat)
+
+    if args.save:
+        document = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "ops": args.ops,
+            "repeat": args.repeat,
+            "calibration_s": round(calibration, 6),
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as fp:
+            json.dump(document, fp, indent=2)
+            fp.write("\n")
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+        speed = calibration / baseline.get("calibration_s", calibration)
+        print(f"\nMachine speed vs. baseline: {1 / speed:.2f}x")
+        regressions = compare(results, baseline["results"], args.tolerance, speed)
+        if regressions:
+            print(f"\n{len(regressions)} regressions beyond {args.tolerance:.0%}:")
+            print("\n".join(regressions))
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
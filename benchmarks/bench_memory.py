@@ -0,0 +1,92 @@
+"""
+Memory benchmark: bytes per task.
+
+Compares the slotted Task model against the previous plain-dataclass layout
+(a per-instance __dict__), both as bare objects and stored in a TodoManager,
+and against the array-backed ColumnarTaskStore.
+
+Usage:
+    python benchmarks/bench_memory.py [--tasks N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from todo_app.columnar import ColumnarTaskStore
+from todo_app.manager import TodoManager
+from todo_app.models import Task
+
+
+@dataclass
+class LegacyTask:
+    """Task layout before __slots__ (same fields, per-instance __dict__)."""
+
+    id: int
+    title: str
+    description: str = ""
+    completed: bool = False
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+def measure(build: Callable[[int], Any], count: int) -> float:
+    """Return traced bytes allocated per item by build(count)."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build(count)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return (after - before) / count
+
+
+def build_objects(task_class: type) -> Callable[[int], list[Any]]:
+    """Return a builder creating count bare task objects."""
+
+    def build(count: int) -> list[Any]:
+        return [task_class(id=i, title=f"Task {i}") for i in range(1, count + 1)]
+
+    return build
+
+
+def build_manager(count: int) -> TodoManager:
+    """Create a TodoManager holding count tasks."""
+    manager = TodoManager()
+    manager.import_tasks({"title": f"Task {i}"} for i in range(count))
+    return manager
+
+
+def build_columnar(count: int) -> ColumnarTaskStore:
+    """Create a ColumnarTaskStore holding count tasks."""
+    store = ColumnarTaskStore()
+    for i in range(count):
+        store.add_task(title=f"Task {i}")
+    return store
+
+
+def main() -> None:
+    """Run the benchmark and print bytes per task."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000, help="Tasks to create")
+    args = parser.parse_args()
+
+    legacy = measure(build_objects(LegacyTask), args.tasks)
+    slotted = measure(build_objects(Task), args.tasks)
+    managed = measure(build_manager, args.tasks)
+    columnar = measure(build_columnar, args.tasks)
+
+    print(f"Tasks: {args.tasks:,}")
+    print(f"  LegacyTask (__dict__) objects : {legacy:8.1f} bytes/task")
+    print(f"  Task (__slots__) objects      : {slotted:8.1f} bytes/task")
+    print(f"  Saving                        : {(1 - slotted / legacy):8.1%}")
+    print(f"  TodoManager incl. indexes     : {managed:8.1f} bytes/task")
+    print(f"  ColumnarTaskStore             : {columnar:8.1f} bytes/task")
+
+
+if __name__ == "__main__":
+    main()
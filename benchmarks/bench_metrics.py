@@ -0,0 +1,77 @@
+"""
+Instrumentation overhead benchmark.
+
+Times get_task, list_tasks and update_task on a plain manager and on an
+instrumented one holding the same tasks, and reports the overhead per call.
+
+Usage:
+    python benchmarks/bench_metrics.py [--tasks 100000] [--calls 50000]
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from todo_app.manager import TodoManager
+from todo_app.metrics import instrument
+
+
+def populate(size: int) -> TodoManager:
+    """Return a manager holding size tasks, every third one completed."""
+    manager = TodoManager()
+    for i in range(size):
+        task = manager.add_task(title=f"Task {i}")
+        if i % 3 == 0:
+            manager.mark_complete(task.id)
+    return manager
+
+
+def best_time(call: Callable[[int], Any], ids: list[int], repeat: int = 3) -> float:
+    """Return the best total seconds of call(task_id) over ids."""
+    best = float("inf")
+    for _ in range(repeat):
+        began = time.perf_counter()
+        for task_id in ids:
+            call(task_id)
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--calls", type=int, default=50_000)
+    args = parser.parse_args()
+
+    plain = populate(args.tasks)
+    instrumented = populate(args.tasks)
+    metrics = instrument(instrumented)
+    rng = random.Random(0)
+    ids = [rng.randint(1, args.tasks) for _ in range(args.calls)]
+
+    cases: dict[str, Callable[[TodoManager], Callable[[int], Any]]] = {
+        "get_task": lambda manager: manager.get_task,
+        "list_tasks[pending]": lambda manager: (
+            lambda task_id: manager.list_tasks("pending", limit=20, after_id=task_id)
+        ),
+        "update_task": lambda manager: (
+            lambda task_id: manager.update_task(task_id, title="Renamed")
+        ),
+    }
+    for label, bind in cases.items():
+        off = best_time(bind(plain), ids)
+        on = best_time(bind(instrumented), ids)
+        extra = (on - off) / len(ids) * 1e9
+        print(
+            f"{label:24s}: off {off / len(ids) * 1e9:7.0f} ns  "
+            f"on {on / len(ids) * 1e9:7.0f} ns  (+{extra:.0f} ns, "
+            f"{(on - off) / off:+.1%})"
+        )
+    print(f"\nRecorded {sum(metrics.calls.values()):,} calls")
+
+
+if __name__ == "__main__":
+    main()
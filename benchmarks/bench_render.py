@@ -0,0 +1,88 @@
+"""
+Rendering benchmark: per-task print() vs. chunked render_tasks().
+
+Writes N tasks to a file the way `todo list` used to (two print() calls per
+task) and with render_tasks() in each format, reporting elapsed time and the
+number of write() calls reaching the text stream.
+
+Usage:
+    python benchmarks/bench_render.py [--tasks 100000]
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+from collections.abc import Callable
+
+from todo_app.manager import TodoManager
+from todo_app.models import Task
+from todo_app.render import RENDER_FORMATS, render_tasks
+
+
+class CountingWriter(io.TextIOWrapper):
+    """Text file that counts write() calls."""
+
+    writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def print_per_task(tasks: list[Task], fp: CountingWriter) -> None:
+    """Render tasks with print() calls, as cmd_list did before render.py."""
+    for task in tasks:
+        status = "✓" if task.completed else "☐"
+        print(f"[{task.id}] {status} {task.title}", file=fp)
+        if task.description:
+            print(f"    {task.description}", file=fp)
+
+
+def measure(path: str, render: Callable[[CountingWriter], None]) -> tuple[float, int]:
+    """Run render against a fresh file and return (seconds, write calls)."""
+    with open(path, "wb") as raw:
+        fp = CountingWriter(raw, encoding="utf-8")
+        began = time.perf_counter()
+        render(fp)
+        fp.flush()
+        elapsed = time.perf_counter() - began
+        fp.detach()
+    return elapsed, fp.writes
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    args = parser.parse_args()
+
+    manager = TodoManager()
+    for i in range(args.tasks):
+        task = manager.add_task(title=f"Task {i}", description=f"Details {i}")
+        if i % 3 == 0:
+            manager.mark_complete(task.id)
+    tasks = manager.list_tasks()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "out.txt")
+        cases: dict[str, Callable[[CountingWriter], None]] = {
+            "print() per task": lambda fp: print_per_task(tasks, fp)
+        }
+        for format in RENDER_FORMATS:
+            cases[f"render_tasks {format}"] = (
+                lambda fp, format=format: render_tasks(tasks, fp, format)
+            )
+
+        for label, render in cases.items():
+            elapsed, writes = measure(path, render)
+            size = os.path.getsize(path) / 1e6
+            print(
+                f"{label:20s}: {elapsed * 1e3:8.1f} ms  {writes:8,d} writes  "
+                f"{size:6.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+SSE load test: thousands of idle /events subscribers on one worker.
+
+Builds the web app the way a gunicorn worker does, with its EventServer
+enabled (EVENTS_PORT, see gunicorn.conf.py), opens many /events
+connections to it, then measures the process CPU time while they sit
+idle, the number of threads they take, and the time until every
+subscriber has received a change made through the API.
+
+Usage:
+    python benchmarks/bench_sse.py [--clients 2000] [--idle 5] [--changes 5]
+
+Each connection takes two file descriptors (client and server side); raise
+`ulimit -n` for more than a few hundred clients.
+"""
+
+import argparse
+import selectors
+import socket
+import threading
+import time
+
+from todo_app.concurrency import ThreadSafeTodoManager
+from todo_app.web import create_app
+
+
+def connect(port: int, count: int) -> list[socket.socket]:
+    """Open count /events connections and wait for each stream's preamble."""
+    clients = []
+    for _ in range(count):
+        client = socket.create_connection(("127.0.0.1", port))
+        client.sendall(b"GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        clients.append(client)
+    for client in clients:
+        received = b""
+        while b"retry:" not in received:
+            received += client.recv(4096)
+        client.setblocking(False)
+    return clients
+
+
+def await_events(clients: list[socket.socket], seq: int, timeout: float) -> int:
+    """Read until every client has received event seq; return how many did."""
+    pending = set(clients)
+    marker = f"id: {seq}\n".encode()
+    with selectors.DefaultSelector() as selector:
+        for client in clients:
+            selector.register(client, selectors.EVENT_READ)
+        deadline = time.monotonic() + timeout
+        while pending and time.monotonic() < deadline:
+            for key, _ in selector.select(timeout=0.5):
+                client = key.fileobj
+                if marker in client.recv(65536) and client in pending:
+                    pending.discard(client)
+                    selector.unregister(client)
+    return len(clients) - len(pending)
+
+
+def main() -> None:
+    """Run the SSE load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--idle", type=float, default=5.0, help="Idle seconds")
+    parser.add_argument("--changes", type=int, default=5, help="Changes to fan out")
+    args = parser.parse_args()
+
+    manager = ThreadSafeTodoManager()
+    app = create_app(manager, events_port=0)
+    server = app.extensions["todo_event_server"]
+    api = app.test_client()
+    threads = threading.active_count()
+
+    began = time.perf_counter()
+    clients = connect(server.port, args.clients)
+    print(
+        f"{len(clients):,} subscribers connected in "
+        f"{time.perf_counter() - began:.1f} s "
+        f"(threads: {threads} before, {threading.active_count()} after)"
+    )
+
+    cpu, wall = time.process_time(), time.perf_counter()
+    time.sleep(args.idle)
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    print(
+        f"Idle for {wall:.1f} s: {cpu * 1e3:.1f} ms CPU "
+        f"({cpu / wall:.2%} of one core)"
+    )
+
+    for _ in range(args.changes):
+        began = time.perf_counter()
+        task_id = api.post("/tasks", json={"title": "Broadcast"}).json["id"]
+        received = await_events(clients, manager.version, timeout=30)
+        print(
+            f"Task {task_id}: {received:,}/{len(clients):,} subscribers notified "
+            f"in {(time.perf_counter() - began) * 1e3:.1f} ms"
+        )
+
+    for client in clients:
+        client.close()
+    server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Startup benchmark: interpreter + import cost of the `todo` entry point.
+
+Reports the wall-clock time of a bare interpreter, `todo --help` and an
+in-memory `todo add`, then the slowest imports behind `import todo_app.cli`
+according to `python -X importtime`. tests/test_startup.py enforces the
+budget for the CLI import.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 20] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# What the installed `todo` console script runs (imports cli.py from bytecode)
+ENTRY_POINT = ["-c", "from todo_app.cli import main; main()"]
+
+COMMANDS = {
+    "python -c pass": ["-c", "pass"],
+    "todo --help": [*ENTRY_POINT, "--help"],
+    "todo add (in-memory)": [*ENTRY_POINT, "add", "Benchmark"],
+}
+
+
+def environment() -> dict[str, str]:
+    """Return the environment for child interpreters (bytecode cache on)."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.pop("TODO_SOCKET", None)
+    env.pop("TODO_JOURNAL", None)
+    return env
+
+
+def wall_time(args: list[str], runs: int) -> float:
+    """Return the median wall-clock seconds of running the interpreter."""
+    samples = []
+    for _ in range(runs):
+        began = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            env=environment(),
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        samples.append(time.perf_counter() - began)
+    return statistics.median(samples)
+
+
+def import_profile() -> list[tuple[int, int, str]]:
+    """Return (self us, cumulative us, module) for `import todo_app.cli`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import todo_app.cli"],
+        env=environment(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        rows.append((int(own), int(cumulative), name.rstrip()))
+    return rows
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    wall_time(["-c", "import todo_app.cli, todo_app.manager"], 1)  # warm caches
+    for label, command in COMMANDS.items():
+        print(f"{label:22s}: {wall_time(command, args.runs) * 1e3:7.1f} ms")
+
+    rows = import_profile()
+    total = next(cum for _, cum, name in rows if name.strip() == "todo_app.cli")
+    print(f"\nimport todo_app.cli   : {total / 1e3:7.1f} ms cumulative")
+    print(f"{'self ms':>8} {'cum ms':>8}  module")
+    for own, cumulative, name in sorted(rows, reverse=True)[: args.top]:
+        print(f"{own / 1e3:8.2f} {cumulative / 1e3:8.2f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
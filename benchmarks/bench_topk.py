@@ -0,0 +1,83 @@
+"""
+Top-k benchmark: "N oldest/newest pending tasks" with and without sorting.
+
+Compares list_tasks("pending") followed by a full sort with
+TodoManager.top_k(), which reads the created_at index (or selects with a
+heap when the status is rare), for the oldest and newest N pending tasks.
+
+Usage:
+    python benchmarks/bench_topk.py [--tasks 1000000] [--k 20] [--queries 200]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from todo_app.manager import TodoManager
+from todo_app.models import Task
+
+
+def populate(size: int, completed_every: int) -> TodoManager:
+    """Return a manager holding size tasks, every completed_every-th completed."""
+    manager = TodoManager()
+    for i in range(size):
+        task = manager.add_task(title=f"Task {i}")
+        if i % completed_every == 0:
+            manager.mark_complete(task.id)
+    return manager
+
+
+def full_sort(manager: TodoManager, k: int, status: str, reverse: bool) -> list[Task]:
+    """Answer the query the way callers did before top_k."""
+    tasks = manager.list_tasks(status)
+    tasks.sort(key=lambda task: (task.created_at, task.id), reverse=reverse)
+    return tasks[:k]
+
+
+def per_query(call: Callable[[], Any], queries: int) -> float:
+    """Return the mean seconds per call over queries calls."""
+    began = time.perf_counter()
+    for _ in range(queries):
+        call()
+    return (time.perf_counter() - began) / queries
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    for completed_every in (4, 1000):
+        began = time.perf_counter()
+        manager = populate(args.tasks, completed_every)
+        print(
+            f"\n{args.tasks:,} tasks, 1 in {completed_every} completed "
+            f"(built in {time.perf_counter() - began:.1f} s)"
+        )
+        for status in ("pending", "completed"):
+            for reverse in (False, True):
+                query = f"{'newest' if reverse else 'oldest'} {args.k} {status}"
+                expected = full_sort(manager, args.k, status, reverse)
+                assert manager.top_k(args.k, status=status, reverse=reverse) == expected
+
+                sort_s = per_query(
+                    lambda: full_sort(manager, args.k, status, reverse),
+                    max(args.queries // 50, 1),
+                )
+                top_s = per_query(
+                    lambda: manager.top_k(args.k, status=status, reverse=reverse),
+                    args.queries,
+                )
+                print(
+                    f"{query:22s}: full sort {sort_s * 1e3:9.2f} ms  "
+                    f"top_k {top_s * 1e3:8.3f} ms  ({sort_s / top_s:,.0f}x)"
+                )
+        del manager
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Gunicorn configuration for the todo web API.
+
+Usage:
+    gunicorn -c gunicorn.conf.py "todo_app.web:create_app()"
+
+Tasks live in the memory of one process (optionally journaled to
+TODO_JOURNAL), so the API runs as a single worker process and scales with
+threads. The app uses ThreadSafeTodoManager, so concurrent reads do not
+wait for each other, and the gthread worker keeps idle keep-alive
+connections off the request threads.
+
+Subscribers of /events are served by an asyncio EventServer that the app
+starts inside the worker on EVENTS_PORT (default: PORT + 1), so thousands
+of open streams hold no worker threads; the reverse proxy routes /events
+to that port. The app's own /events endpoint remains as a fallback: each
+of its streams holds a thread, so it refuses streams beyond MAX_STREAMS
+with 503, and the worker gets MAX_STREAMS threads on top of the
+WEB_THREADS request threads. See benchmarks/bench_sse.py.
+"""
+
+import os
+
+host = os.environ.get("HOST", "0.0.0.0")
+port = int(os.environ.get("PORT", "8000"))
+bind = f"{host}:{port}"
+
+# One process owns the task store; do not raise this without a shared backend
+workers = 1
+worker_class = "gthread"
+# Request threads, plus one thread per /events stream the app admits
+max_streams = int(os.environ.get("MAX_STREAMS", "100"))
+threads = int(os.environ.get("WEB_THREADS", "8")) + max_streams
+events_port = int(os.environ.get("EVENTS_PORT", str(port + 1)))
+raw_env = [
+    f"MAX_STREAMS={max_streams}",
+    f"EVENTS_HOST={host}",
+    f"EVENTS_PORT={events_port}",
+]
+
+# Reuse client connections instead of paying a TCP handshake per request
+keepalive = 5
+backlog = 2048
+
+timeout = 30
+graceful_timeout = 10
+
+# Log to stdout/stderr; disable the access log with ACCESS_LOG=0 for benchmarks
+accesslog = "-" if os.environ.get("ACCESS_LOG", "1") != "0" else None
+errorlog = "-"
@@ -10,13 +10,43 @@ Phase I: In-memory storage with console interface
 __version__ = "1.0.0"
 __author__ = "Your Name"
 
-from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
-from todo_app.models import Task
-from todo_app.manager import TodoManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
+    from todo_app.manager import TodoManager
+    from todo_app.models import Task, TaskStats
 
 __all__ = [
     "Task",
+    "TaskStats",
     "TodoManager",
     "InvalidTaskDataError",
     "TaskNotFoundException",
 ]
+
+# Public name -> defining module. Exports are imported on first access so
+# that `import todo_app.cli` (and `todo --help`) does not load the manager.
+_EXPORTS = {
+    "Task": "todo_app.models",
+    "TaskStats": "todo_app.models",
+    "TodoManager": "todo_app.manager",
+    "InvalidTaskDataError": "todo_app.exceptions",
+    "TaskNotFoundException": "todo_app.exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public export on first access and cache it on the package."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported exports."""
+    return sorted(set(globals()) | set(__all__))
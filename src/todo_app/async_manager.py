@@ -0,0 +1,336 @@
+"""
+Asyncio facade over TodoManager for event-loop servers.
+
+This module provides AsyncTodoManager, which exposes coroutine versions of
+the TodoManager API. Purely in-memory managers are called inline (their
+operations take microseconds and never block); storage-backed managers are
+called on a bounded thread pool so journal writes and fsyncs never stall the
+event loop.
+"""
+
+import asyncio
+import functools
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Optional, Protocol, TypeVar, runtime_checkable
+
+from todo_app.concurrency import ThreadSafeTodoManager
+from todo_app.manager import ITER_PAGE_SIZE
+from todo_app.models import BulkReport, Task, TaskDelta, TaskStats
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 4
+
+# Calls allowed in flight (running or queued) before callers wait
+DEFAULT_MAX_PENDING = 256
+
+
+class TaskManager(Protocol):
+    """The synchronous API shared by TodoManager and SqliteTodoManager."""
+
+    def add_task(self, title: str, description: str = "") -> Task: ...
+
+    def list_tasks(
+        self,
+        status: str = "all",
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        sort: str = "id",
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> list[Task]: ...
+
+    def count_tasks(self, status: str = "all") -> int: ...
+
+    def stats(self) -> TaskStats: ...
+
+    def get_task(self, task_id: int) -> Task: ...
+
+    def update_task(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Task: ...
+
+    def delete_task(self, task_id: int) -> None: ...
+
+    def mark_complete(self, task_id: int) -> None: ...
+
+    def mark_incomplete(self, task_id: int) -> None: ...
+
+    def toggle_complete(self, task_id: int) -> None: ...
+
+    def bulk_complete(
+        self, task_ids: Iterable[int], atomic: bool = False
+    ) -> BulkReport: ...
+
+    def bulk_delete(
+        self, task_ids: Iterable[int], atomic: bool = False
+    ) -> BulkReport: ...
+
+    def bulk_update(
+        self,
+        updates: Mapping[int, Mapping[str, Optional[str]]],
+        atomic: bool = False,
+    ) -> BulkReport: ...
+
+    def close(self) -> None: ...
+
+
+@runtime_checkable
+class IndexedTaskManager(TaskManager, Protocol):
+    """A TaskManager with the in-memory indexes (TodoManager only)."""
+
+    def top_k(
+        self,
+        k: int,
+        by: str = "created_at",
+        status: str = "pending",
+        reverse: bool = False,
+    ) -> list[Task]: ...
+
+    def search(
+        self, query: str, status: str = "all", limit: Optional[int] = None
+    ) -> list[Task]: ...
+
+    def delta(self, since: int = 0) -> TaskDelta: ...
+
+
+class AsyncTodoManager:
+    """
+    Coroutine API over a TodoManager.
+
+    When the manager has a storage backend, every call runs on a thread pool
+    of max_workers threads and at most max_pending calls are in flight;
+    further callers wait, which applies backpressure instead of queueing
+    unbounded work. A manager that is not a ThreadSafeTodoManager is only
+    ever called from one pool thread.
+
+    top_k(), search() and delta() need a TodoManager; on other managers
+    (SqliteTodoManager) they raise NotImplementedError.
+
+    Attributes:
+        manager: The wrapped synchronous manager
+        offload: True if calls run on the thread pool
+
+    Examples:
+        >>> async def demo():
+        ...     async with AsyncTodoManager() as manager:
+        ...         task = await manager.add_task(title="Buy milk")
+        ...         return (await manager.get_task(task.id)).title
+        >>> asyncio.run(demo())
+        'Buy milk'
+    """
+
+    def __init__(
+        self,
+        manager: Optional[TaskManager] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        offload: Optional[bool] = None,
+    ) -> None:
+        """
+        Wrap a manager.
+
+        Args:
+            manager: Manager to wrap (default: a new in-memory manager)
+            max_workers: Pool threads used for offloaded calls
+            max_pending: Maximum offloaded calls in flight
+            offload: Force calls onto (True) or off (False) the pool
+                (default: offload only if the manager blocks on I/O, i.e. has
+                storage or is a SqliteTodoManager)
+        """
+        self.manager: TaskManager = (
+            manager if manager is not None else ThreadSafeTodoManager()
+        )
+        self.offload = _is_blocking(self.manager) if offload is None else offload
+        if not isinstance(self.manager, ThreadSafeTodoManager):
+            max_workers = 1
+        self._max_workers = max_workers
+        self._pending = asyncio.Semaphore(max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> "AsyncTodoManager":
+        """Return self for use as an async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the manager on leaving the context."""
+        await self.close()
+
+    async def add_task(self, title: str, description: str = "") -> Task:
+        """Add a new task (see TodoManager.add_task)."""
+        return await self._call(self.manager.add_task, title, description)
+
+    async def list_tasks(
+        self,
+        status: str = "all",
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        sort: str = "id",
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> list[Task]:
+        """List tasks, optionally one page at a time (see TodoManager.list_tasks)."""
+        return await self._call(
+            self.manager.list_tasks,
+            status,
+            limit,
+            after_id,
+            sort,
+            created_from,
+            created_to,
+        )
+
+    async def top_k(
+        self,
+        k: int,
+        by: str = "created_at",
+        status: str = "pending",
+        reverse: bool = False,
+    ) -> list[Task]:
+        """Return the k first tasks ordered by a field (see TodoManager.top_k)."""
+        return await self._call(self._indexed("top_k").top_k, k, by, status, reverse)
+
+    async def delta(self, since: int = 0) -> TaskDelta:
+        """Return what changed after a version (see TodoManager.delta)."""
+        return await self._call(self._indexed("delta").delta, since)
+
+    async def iter_tasks(
+        self,
+        status: str = "all",
+        after_id: Optional[int] = None,
+        page_size: int = ITER_PAGE_SIZE,
+    ) -> AsyncIterator[Task]:
+        """
+        Stream tasks in ID order, fetching one page per await.
+
+        Other coroutines run between pages, so streaming a large listing
+        never monopolizes the event loop.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed"
+            after_id: Only yield tasks with an ID greater than this
+            page_size: Tasks fetched per page
+
+        Returns:
+            Async iterator over matching Task objects
+
+        Raises:
+            ValueError: If status is not one of the valid options
+        """
+        while True:
+            page = await self.list_tasks(status, limit=page_size, after_id=after_id)
+            for task in page:
+                yield task
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id
+            if not self.offload:
+                await asyncio.sleep(0)
+
+    async def count_tasks(self, status: str = "all") -> int:
+        """Count tasks (see TodoManager.count_tasks)."""
+        return await self._call(self.manager.count_tasks, status)
+
+    async def stats(self) -> TaskStats:
+        """Return aggregate task counters (see TodoManager.stats)."""
+        return await self._call(self.manager.stats)
+
+    async def search(
+        self, query: str, status: str = "all", limit: Optional[int] = None
+    ) -> list[Task]:
+        """Search titles and descriptions (see TodoManager.search)."""
+        return await self._call(
+            self._indexed("search").search, query, status, limit
+        )
+
+    async def get_task(self, task_id: int) -> Task:
+        """Get a single task by ID (see TodoManager.get_task)."""
+        return await self._call(self.manager.get_task, task_id)
+
+    async def update_task(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Task:
+        """Update a task's title and/or description (see TodoManager.update_task)."""
+        return await self._call(self.manager.update_task, task_id, title, description)
+
+    async def delete_task(self, task_id: int) -> None:
+        """Delete a task by ID (see TodoManager.delete_task)."""
+        await self._call(self.manager.delete_task, task_id)
+
+    async def mark_complete(self, task_id: int) -> None:
+        """Mark a task as complete (see TodoManager.mark_complete)."""
+        await self._call(self.manager.mark_complete, task_id)
+
+    async def mark_incomplete(self, task_id: int) -> None:
+        """Mark a task as incomplete (see TodoManager.mark_incomplete)."""
+        await self._call(self.manager.mark_incomplete, task_id)
+
+    async def toggle_complete(self, task_id: int) -> None:
+        """Toggle task completion status (see TodoManager.toggle_complete)."""
+        await self._call(self.manager.toggle_complete, task_id)
+
+    async def bulk_complete(
+        self, task_ids: Iterable[int], atomic: bool = False
+    ) -> BulkReport:
+        """Mark many tasks as complete (see TodoManager.bulk_complete)."""
+        return await self._call(self.manager.bulk_complete, list(task_ids), atomic)
+
+    async def bulk_delete(
+        self, task_ids: Iterable[int], atomic: bool = False
+    ) -> BulkReport:
+        """Delete many tasks (see TodoManager.bulk_delete)."""
+        return await self._call(self.manager.bulk_delete, list(task_ids), atomic)
+
+    async def bulk_update(
+        self,
+        updates: Mapping[int, Mapping[str, Optional[str]]],
+        atomic: bool = False,
+    ) -> BulkReport:
+        """Update many tasks (see TodoManager.bulk_update)."""
+        return await self._call(self.manager.bulk_update, updates, atomic)
+
+    async def close(self) -> None:
+        """Close the wrapped manager and shut down the thread pool."""
+        await self._call(self.manager.close)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _indexed(self, operation: str) -> IndexedTaskManager:
+        """Return the manager, or raise if it lacks the in-memory indexes."""
+        if not isinstance(self.manager, IndexedTaskManager):
+            raise NotImplementedError(
+                f"{operation}() is not supported by {type(self.manager).__name__}"
+            )
+        return self.manager
+
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a manager method inline or on the bounded thread pool."""
+        if not self.offload:
+            return func(*args)
+
+        async with self._pending:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="todo-io"
+                )
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args)
+            )
+
+
+def _is_blocking(manager: Any) -> bool:
+    """Return True if the manager's calls may block on I/O."""
+    return bool(
+        getattr(manager, "blocking", False)
+        or getattr(manager, "_storage", None) is not None
+    )
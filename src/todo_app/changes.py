@@ -0,0 +1,225 @@
+"""
+Change feed for TodoManager mutations.
+
+Every mutation of a TodoManager emits a ChangeEvent with a monotonically
+increasing sequence number. Recent events are kept in a bounded ring buffer,
+so consumers that remember the last sequence number they saw can catch up
+with changes_since() in O(changes), and subscribers are called as events
+happen.
+"""
+
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from todo_app.exceptions import ChangesExpiredError
+from todo_app.models import Task
+
+logger = logging.getLogger(__name__)
+
+# Events kept for changes_since()
+DEFAULT_CAPACITY = 10_000
+
+Subscriber = Callable[["ChangeEvent"], None]
+
+
+@dataclass(slots=True)
+class ChangeEvent:
+    """
+    One task mutation, with the task's state right after it.
+
+    For "delete" events the fields hold the state of the deleted task.
+    Events are shared between consumers; treat them as read-only.
+
+    Attributes:
+        seq: Sequence number (1 for the first event of a feed)
+        op: "add", "update", "delete", "complete", "incomplete" or "toggle"
+        task_id: ID of the changed task
+        title: Task title after the change
+        description: Task description after the change
+        completed: Completion status after the change
+        created_at: Task creation timestamp
+    """
+
+    seq: int
+    op: str
+    task_id: int
+    title: str
+    description: str
+    completed: bool
+    created_at: datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the event to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with seq, op and the task (as in Task.to_dict)
+        """
+        return {
+            "seq": self.seq,
+            "op": self.op,
+            "task": {
+                "id": self.task_id,
+                "title": self.title,
+                "description": self.description,
+                "completed": self.completed,
+                "created_at": self.created_at.isoformat(),
+            },
+        }
+
+
+class ChangeFeed:
+    """
+    Sequence-numbered mutation events with a bounded history.
+
+    Emitting is serialized by the manager (ThreadSafeTodoManager emits
+    under its write lock); reading the history is safe from any thread.
+
+    Attributes:
+        capacity: Maximum number of events kept for changes_since()
+
+    Examples:
+        >>> from todo_app.manager import TodoManager
+        >>> manager = TodoManager()
+        >>> seen = manager.changes.last_seq
+        >>> task = manager.add_task(title="Buy milk")
+        >>> manager.mark_complete(task.id)
+        >>> [(e.seq, e.op) for e in manager.changes.changes_since(seen)]
+        [(1, 'add'), (2, 'complete')]
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, last_seq: int = 0) -> None:
+        """
+        Initialize an empty feed.
+
+        Args:
+            capacity: Maximum number of events kept (must be positive)
+            last_seq: Sequence number of the latest event emitted before the
+                feed was created (e.g. by a manager before a restart); the
+                next event gets last_seq + 1
+
+        Raises:
+            ValueError: If capacity is not positive or last_seq is negative
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive (got {capacity})")
+        if last_seq < 0:
+            raise ValueError(f"last_seq must not be negative (got {last_seq})")
+        self.capacity = capacity
+        self._events: deque[tuple[Any, ...]] = deque(maxlen=capacity)
+        self._last_seq = last_seq
+        self._subscribers: list[Subscriber] = []
+        self._lock = threading.Lock()
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the latest event (0 before the first one)."""
+        return self._last_seq
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest event still kept (last_seq + 1 if none)."""
+        with self._lock:
+            return self._events[0][0] if self._events else self._last_seq + 1
+
+    def emit(self, op: str, task: Task) -> int:
+        """
+        Record a mutation and notify subscribers.
+
+        Subscribers run synchronously, in subscription order, after the
+        event is recorded. An exception from a subscriber is logged and
+        does not reach the caller (the mutation has already taken effect),
+        and later subscribers still receive the event.
+
+        Args:
+            op: Mutation name
+            task: Task state right after the mutation
+
+        Returns:
+            Sequence number of the new event
+        """
+        # Events are kept as plain tuples (about half the cost of building a
+        # ChangeEvent on every mutation) and materialized when read
+        with self._lock:
+            self._last_seq += 1
+            record = (
+                self._last_seq,
+                op,
+                task.id,
+                task.title,
+                task.description,
+                task.completed,
+                task.created_at,
+            )
+            self._events.append(record)
+        if self._subscribers:
+            event = ChangeEvent(*record)
+            for subscriber in self._subscribers:
+                try:
+                    subscriber(event)
+                except Exception:
+                    logger.exception("Change feed subscriber %r failed", subscriber)
+        return record[0]
+
+    def changes_since(self, seq: int) -> list[ChangeEvent]:
+        """
+        Return the events after a sequence number, oldest first.
+
+        Costs O(returned events), however many events the feed keeps.
+
+        Args:
+            seq: Last sequence number the caller has seen (0 for all)
+
+        Returns:
+            Events with a sequence number greater than seq
+
+        Raises:
+            ValueError: If seq is negative or greater than last_seq
+            ChangesExpiredError: If events after seq were already dropped
+                from the buffer; the caller must resynchronize in full
+        """
+        with self._lock:
+            if seq < 0 or seq > self._last_seq:
+                raise ValueError(
+                    f"Sequence number {seq} is outside 0..{self._last_seq}"
+                )
+            missing = self._last_seq - seq
+            if missing > len(self._events):
+                raise ChangesExpiredError(
+                    f"Changes after {seq} are no longer available "
+                    f"(oldest kept: {self._last_seq - len(self._events) + 1})"
+                )
+            records = list(islice(reversed(self._events), missing))
+        return [ChangeEvent(*record) for record in reversed(records)]
+
+    def subscribe(self, subscriber: Subscriber) -> Callable[[], None]:
+        """
+        Call subscriber(event) for every future event.
+
+        Subscribers run inside the mutation (under the write lock of a
+        ThreadSafeTodoManager), so they must be quick and must not call
+        back into the manager.
+
+        Args:
+            subscriber: Callable receiving each ChangeEvent
+
+        Returns:
+            A function that unsubscribes the subscriber
+        """
+        with self._lock:
+            # Copy on write, so emit() can iterate without the lock
+            self._subscribers = [*self._subscribers, subscriber]
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._subscribers = [
+                    other for other in self._subscribers if other is not subscriber
+                ]
+
+        return unsubscribe
@@ -2,14 +2,33 @@
 Command-line interface for the todo application.
 
 This module provides a CLI for managing tasks via command-line arguments.
+
+Startup time matters here (scripts may run `todo` thousands of times), so
+only lightweight modules are imported at module level; the manager, storage
+backends and daemon are imported by the code paths that need them.
 """
 
 import argparse
+import io
+import os
 import sys
-from typing import Optional
+from collections.abc import Callable
+from types import FrameType
+from typing import TYPE_CHECKING, Optional
+
+from todo_app.exceptions import (
+    DaemonError,
+    InvalidTaskDataError,
+    TaskNotFoundException,
+)
 
-from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
-from todo_app.manager import TodoManager
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from todo_app.daemon import Request, Response
+    from todo_app.manager import TodoManager
+    from todo_app.models import BulkReport, Task
+    from todo_app.storage import StorageBackend
 
 
 class TodoCLI:
@@ -17,12 +36,41 @@ class TodoCLI:
     Command-line interface for todo application.
 
     Provides command-line arguments for all task management operations.
+    Tasks are kept in-memory unless a journal file is given with --journal
+    (or the TODO_JOURNAL environment variable). When TODO_SOCKET names a
+    running `todo serve` daemon, commands are forwarded to it instead.
+    Setting TODO_METRICS=1 instruments the manager (see `todo stats`).
     """
 
-    def __init__(self) -> None:
-        """Initialize CLI with a TodoManager instance."""
-        self.manager = TodoManager()
-        self.parser = self._create_parser()
+    def __init__(self, manager: Optional["TodoManager"] = None) -> None:
+        """
+        Initialize CLI with a TodoManager instance.
+
+        Args:
+            manager: Manager to operate on (default: a new in-memory manager,
+                replaced by a journal-backed one when --journal is given)
+        """
+        self._manager = manager
+        self._manager_injected = manager is not None
+        self._parser: Optional[argparse.ArgumentParser] = None
+
+    @property
+    def manager(self) -> "TodoManager":
+        """Manager commands operate on, created on first use."""
+        if self._manager is None:
+            self._manager = _new_manager()
+        return self._manager
+
+    @manager.setter
+    def manager(self, manager: "TodoManager") -> None:
+        self._manager = manager
+
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """Argument parser, built on first use (forwarded commands skip it)."""
+        if self._parser is None:
+            self._parser = self._create_parser()
+        return self._parser
 
     def _create_parser(self) -> argparse.ArgumentParser:
         """
@@ -31,11 +79,26 @@ class TodoCLI:
         Returns:
             Configured ArgumentParser instance
         """
+        from todo_app.render import RENDER_FORMATS
+        from todo_app.serialization import FORMATS
+        from todo_app.storage import FSYNC_POLICIES
+
         parser = argparse.ArgumentParser(
             prog="todo",
             description="LifeStepsAI Todo Application - CLI Interface",
             epilog="Phase I: In-Memory Python Console App",
         )
+        parser.add_argument(
+            "--journal",
+            default=os.environ.get("TODO_JOURNAL"),
+            help="Journal file for persistent storage (default: $TODO_JOURNAL)",
+        )
+        parser.add_argument(
+            "--fsync",
+            choices=FSYNC_POLICIES,
+            default="batch",
+            help="Journal fsync policy (default: batch)",
+        )
 
         subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -55,6 +118,68 @@ class TodoCLI:
             default="all",
             help="Filter tasks by status (default: all)",
         )
+        list_parser.add_argument(
+            "-n",
+            "--limit",
+            type=_non_negative_int,
+            help="Show at most this many tasks (default: no limit)",
+        )
+        list_parser.add_argument(
+            "--after",
+            type=int,
+            metavar="ID",
+            help="Only show tasks after this one in the listing order (next page)",
+        )
+        list_parser.add_argument(
+            "--sort",
+            choices=["id", "created", "-created", "title", "-title"],
+            default="id",
+            help="Order by id, created or title; --sort=-created etc. for "
+            "descending (default: id)",
+        )
+        list_parser.add_argument(
+            "--since",
+            type=_parse_datetime,
+            metavar="WHEN",
+            help="Only show tasks created at or after this ISO date/time",
+        )
+        list_parser.add_argument(
+            "--until",
+            type=_parse_datetime,
+            metavar="WHEN",
+            help="Only show tasks created before this ISO date/time",
+        )
+        list_parser.add_argument(
+            "--format",
+            choices=RENDER_FORMATS,
+            default="text",
+            help="Output format; json and tsv are undecorated (default: text)",
+        )
+
+        # Search tasks command
+        search_parser = subparsers.add_parser(
+            "search", help="Search task titles and descriptions"
+        )
+        search_parser.add_argument("query", help="Words or word prefixes to find")
+        search_parser.add_argument(
+            "-s",
+            "--status",
+            choices=["all", "pending", "completed"],
+            default="all",
+            help="Filter tasks by status (default: all)",
+        )
+        search_parser.add_argument(
+            "-n",
+            "--limit",
+            type=_non_negative_int,
+            help="Maximum number of results (default: no limit)",
+        )
+        search_parser.add_argument(
+            "--format",
+            choices=RENDER_FORMATS,
+            default="text",
+            help="Output format; json and tsv are undecorated (default: text)",
+        )
 
         # Get task command
         get_parser = subparsers.add_parser("get", help="Get a specific task")
@@ -68,9 +193,16 @@ class TodoCLI:
 
         # Complete task command
         complete_parser = subparsers.add_parser(
-            "complete", help="Mark task as complete"
+            "complete", help="Mark one or more tasks as complete"
+        )
+        complete_parser.add_argument(
+            "ids", nargs="+", type=int, metavar="ID", help="Task ID(s)"
+        )
+        complete_parser.add_argument(
+            "--atomic",
+            action="store_true",
+            help="Change nothing unless every ID exists",
         )
-        complete_parser.add_argument("id", type=int, help="Task ID")
 
         # Incomplete task command
         incomplete_parser = subparsers.add_parser(
@@ -85,23 +217,93 @@ class TodoCLI:
         toggle_parser.add_argument("id", type=int, help="Task ID")
 
         # Delete task command
-        delete_parser = subparsers.add_parser("delete", help="Delete a task")
-        delete_parser.add_argument("id", type=int, help="Task ID")
+        delete_parser = subparsers.add_parser(
+            "delete", help="Delete one or more tasks"
+        )
+        delete_parser.add_argument(
+            "ids", nargs="+", type=int, metavar="ID", help="Task ID(s)"
+        )
+        delete_parser.add_argument(
+            "--atomic",
+            action="store_true",
+            help="Delete nothing unless every ID exists",
+        )
+
+        # Import tasks command
+        import_parser = subparsers.add_parser(
+            "import", help="Import tasks from a JSON Lines or CSV file"
+        )
+        import_parser.add_argument("file", help="Input file ('-' for stdin)")
+        import_parser.add_argument(
+            "-f",
+            "--format",
+            choices=FORMATS,
+            help="File format (default: from extension, else jsonl)",
+        )
+
+        # Export tasks command
+        export_parser = subparsers.add_parser(
+            "export", help="Export tasks as JSON Lines or CSV"
+        )
+        export_parser.add_argument(
+            "file", nargs="?", default="-", help="Output file (default: stdout)"
+        )
+        export_parser.add_argument(
+            "-f",
+            "--format",
+            choices=FORMATS,
+            help="File format (default: from extension, else jsonl)",
+        )
+        export_parser.add_argument(
+            "-s",
+            "--status",
+            choices=["all", "pending", "completed"],
+            default="all",
+            help="Filter tasks by status (default: all)",
+        )
+
+        # Stats command
+        stats_parser = subparsers.add_parser(
+            "stats", help="Show task counts or manager metrics"
+        )
+        stats_parser.add_argument(
+            "--metrics",
+            action="store_true",
+            help="Print manager call metrics in Prometheus text format",
+        )
+
+        # Batch command
+        batch_parser = subparsers.add_parser(
+            "batch", help="Run many commands (one per line) in one process"
+        )
+        batch_parser.add_argument(
+            "-f",
+            "--file",
+            default="-",
+            help="Command file: shell-style lines or JSON arrays (default: stdin)",
+        )
+
+        # Serve command
+        serve_parser = subparsers.add_parser(
+            "serve", help="Run a daemon holding tasks in memory for other calls"
+        )
+        serve_parser.add_argument(
+            "--socket",
+            help="Unix socket to listen on (default: $TODO_SOCKET or a temp path)",
+        )
 
         return parser
 
-    def print_task(self, task) -> None:
+    def print_task(self, task: "Task") -> None:
         """
         Print a single task in formatted style.
 
         Args:
             task: Task object to display
         """
-        status = "✓" if task.completed else "☐"
-        print(f"[{task.id}] {status} {task.title}")
-        if task.description:
-            print(f"    Description: {task.description}")
-        print(f"    Status: {'Completed' if task.completed else 'Pending'}")
+        from todo_app.render import format_task_detail
+
+        sys.stdout.write(format_task_detail(task))
 
     def cmd_add(self, args: argparse.Namespace) -> None:
         """
@@ -111,7 +313,9 @@ class TodoCLI:
             args: Parsed command-line arguments
         """
         try:
-            task = self.manager.add_task(title=args.title, description=args.description)
+            task = self.manager.add_task(
+                title=args.title, description=args.description
+            )
             print("✅ Task added successfully!")
             self.print_task(task)
         except InvalidTaskDataError as e:
@@ -125,7 +329,29 @@ class TodoCLI:
         Args:
             args: Parsed command-line arguments
         """
-        tasks = self.manager.list_tasks(status=args.status)
+        from todo_app.render import render_tasks
+
+        # Fetch one extra task to know whether another page follows
+        limit = None if args.limit is None else args.limit + 1
+        try:
+            tasks = self.manager.list_tasks(
+                status=args.status,
+                limit=limit,
+                after_id=args.after,
+                sort=args.sort,
+                created_from=args.since,
+                created_to=args.until,
+            )
+        except TaskNotFoundException as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        has_more = limit is not None and len(tasks) == limit
+        if has_more:
+            tasks.pop()
+
+        if args.format != "text":
+            render_tasks(tasks, sys.stdout, args.format)
+            return
 
         if not tasks:
             print(f"📭 No {args.status} tasks found.")
@@ -138,22 +364,47 @@ class TodoCLI:
         }
         print(f"\n{status_names[args.status]}:")
         print("=" * 60)
-
-        for task in tasks:
-            status = "✓" if task.completed else "☐"
-            print(f"[{task.id}] {status} {task.title}")
-            if task.description:
-                print(f"    {task.description}")
+        render_tasks(tasks, sys.stdout)
 
         # Show summary
-        total = len(tasks)
+        stats = self.manager.stats()
         if args.status == "all":
-            completed = len([t for t in tasks if t.completed])
-            pending = total - completed
-            print(f"\n📊 Total: {total} tasks ({completed} completed, {pending} pending)")
+            print(
+                f"\n📊 Total: {stats.total} tasks "
+                f"({stats.completed} completed, {stats.pending} pending)"
+            )
         else:
+            total = getattr(stats, args.status)
             print(f"\n📊 Total: {total} {args.status} tasks")
 
+        if has_more:
+            print(f"➡️  Next page: --after {tasks[-1].id}")
+
+    def cmd_search(self, args: argparse.Namespace) -> None:
+        """
+        Handle search command.
+
+        Args:
+            args: Parsed command-line arguments
+        """
+        from todo_app.render import render_tasks
+
+        tasks = self.manager.search(args.query, status=args.status, limit=args.limit)
+
+        if args.format != "text":
+            render_tasks(tasks, sys.stdout, args.format)
+            return
+
+        if not tasks:
+            print(f"🔍 No tasks matching '{args.query}'.")
+            return
+
+        print(f"\nSearch results for '{args.query}':")
+        print("=" * 60)
+        render_tasks(tasks, sys.stdout)
+
+        print(f"\n🔍 {len(tasks)} matching tasks")
+
     def cmd_get(self, args: argparse.Namespace) -> None:
         """
         Handle get command.
@@ -200,10 +451,16 @@ class TodoCLI:
         Args:
             args: Parsed command-line arguments
         """
+        if len(args.ids) > 1:
+            report = self.manager.bulk_complete(args.ids, atomic=args.atomic)
+            print(f"✅ Marked {len(report.succeeded)} tasks as complete!")
+            self._report_errors(report)
+            return
+
         try:
-            self.manager.mark_complete(task_id=args.id)
+            self.manager.mark_complete(task_id=args.ids[0])
             print("✅ Task marked as complete!")
-            task = self.manager.get_task(task_id=args.id)
+            task = self.manager.get_task(task_id=args.ids[0])
             self.print_task(task)
         except TaskNotFoundException as e:
             print(f"❌ Error: {e}", file=sys.stderr)
@@ -249,21 +506,234 @@ class TodoCLI:
         Args:
             args: Parsed command-line arguments
         """
+        if len(args.ids) > 1:
+            report = self.manager.bulk_delete(args.ids, atomic=args.atomic)
+            print(f"✅ Deleted {len(report.succeeded)} tasks!")
+            self._report_errors(report)
+            return
+
+        task_id = args.ids[0]
         try:
-            task = self.manager.get_task(task_id=args.id)
-            self.manager.delete_task(task_id=args.id)
-            print(f"✅ Task '{task.title}' (ID: {args.id}) deleted successfully!")
+            task = self.manager.get_task(task_id=task_id)
+            self.manager.delete_task(task_id=task_id)
+            print(f"✅ Task '{task.title}' (ID: {task_id}) deleted successfully!")
         except TaskNotFoundException as e:
             print(f"❌ Error: {e}", file=sys.stderr)
             sys.exit(1)
 
+    def cmd_import(self, args: argparse.Namespace) -> None:
+        """
+        Handle import command.
+
+        Args:
+            args: Parsed command-line arguments
+        """
+        from todo_app.serialization import read_records
+
+        file_format = args.format or _format_from_path(args.file)
+        try:
+            if args.file == "-":
+                records = read_records(sys.stdin, file_format)
+                report = self.manager.import_tasks(records)
+            else:
+                with open(args.file, encoding="utf-8", newline="") as fp:
+                    report = self.manager.import_tasks(read_records(fp, file_format))
+        except OSError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        print(f"✅ Imported {report.imported} tasks.")
+        for row_number, message in report.errors:
+            print(f"❌ Row {row_number}: {message}", file=sys.stderr)
+        if not report.ok:
+            sys.exit(1)
+
+    def cmd_export(self, args: argparse.Namespace) -> None:
+        """
+        Handle export command.
+
+        Args:
+            args: Parsed command-line arguments
+        """
+        file_format = args.format or _format_from_path(args.file)
+        if args.file == "-":
+            self.manager.export_tasks(sys.stdout, file_format, status=args.status)
+            return
+
+        try:
+            with open(args.file, "w", encoding="utf-8", newline="") as fp:
+                count = self.manager.export_tasks(fp, file_format, status=args.status)
+        except OSError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"✅ Exported {count} tasks to {args.file}")
+
+    def cmd_stats(self, args: argparse.Namespace) -> None:
+        """
+        Handle stats command.
+
+        Metrics cover this process only, so they are most useful from a
+        long-running `TODO_METRICS=1 todo serve` daemon.
+
+        Args:
+            args: Parsed command-line arguments
+        """
+        if not args.metrics:
+            stats = self.manager.stats()
+            print(f"📊 Total: {stats.total} tasks")
+            print(f"   ✓ Completed: {stats.completed}")
+            print(f"   ☐ Pending: {stats.pending}")
+            return
+
+        from todo_app.metrics import metrics_of
+
+        metrics = metrics_of(self.manager)
+        if metrics is None:
+            print("# Instrumentation is off; set TODO_METRICS=1 to enable it")
+            return
+        sys.stdout.write(metrics.render())
+
+    def cmd_batch(self, args: argparse.Namespace) -> None:
+        """
+        Handle batch command.
+
+        Runs every command in the file against this CLI's manager. Failing
+        commands are collected instead of ending the run; all output is
+        written at the end, followed by one line per failed command.
+
+        Args:
+            args: Parsed command-line arguments
+        """
+        from contextlib import redirect_stderr, redirect_stdout
+
+        try:
+            if args.file == "-":
+                lines = sys.stdin.read().splitlines()
+            else:
+                with open(args.file, encoding="utf-8") as fp:
+                    lines = fp.read().splitlines()
+        except OSError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        worker = TodoCLI(self.manager)
+        output = io.StringIO()
+        errors: list[tuple[int, str]] = []
+        ran = 0
+        with redirect_stdout(output):
+            for number, line in enumerate(lines, start=1):
+                try:
+                    argv = _parse_batch_line(line)
+                except ValueError as e:
+                    errors.append((number, str(e)))
+                    continue
+                if argv is None:
+                    continue
+                ran += 1
+                if _command_name(argv) in ("batch", "serve"):
+                    errors.append((number, f"'{argv[0]}' cannot run in a batch"))
+                    continue
+
+                stderr = io.StringIO()
+                with redirect_stderr(stderr):
+                    code = worker._execute(argv)
+                if code:
+                    errors.append((number, _last_line(stderr.getvalue(), code)))
+
+            print(f"✅ Ran {ran} commands ({len(errors)} failed)")
+
+        sys.stdout.write(output.getvalue())
+        if errors:
+            sys.stderr.write(
+                "".join(
+                    f"❌ Line {number}: {message}\n" for number, message in errors
+                )
+            )
+            sys.exit(1)
+
+    def cmd_serve(self, args: argparse.Namespace) -> None:
+        """
+        Handle serve command.
+
+        Serves this CLI's manager (journal-backed if --journal is given) on
+        a Unix socket until interrupted. Requests run one at a time.
+
+        Args:
+            args: Parsed command-line arguments
+        """
+        import signal
+
+        from todo_app import daemon
+
+        socket_path = args.socket or daemon.default_socket_path()
+        worker = TodoCLI(self.manager)
+        signal.signal(signal.SIGTERM, _exit_on_signal)
+        print(f"🚀 Serving tasks on {socket_path} (Ctrl+C to stop)", flush=True)
+        try:
+            daemon.serve(socket_path, worker.execute_request)
+        except (DaemonError, OSError) as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    def execute_request(self, request: "Request") -> "Response":
+        """
+        Run a command forwarded by a daemon client.
+
+        Args:
+            request: Request object with argv and optional cwd and stdin
+
+        Returns:
+            Response object with the command's stdout, stderr and exit code
+        """
+        argv = [str(arg) for arg in request["argv"]]
+        if _command_name(argv) == "serve":
+            return {
+                "stdout": "",
+                "stderr": "❌ Error: Cannot start a daemon from inside a daemon\n",
+                "code": 1,
+            }
+
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(request.get("cwd") or previous_cwd)
+        except OSError as e:
+            return {"stdout": "", "stderr": f"❌ Error: {e}\n", "code": 1}
+        try:
+            stdout, stderr, code = self._capture(argv, request.get("stdin", ""))
+        finally:
+            os.chdir(previous_cwd)
+        return {"stdout": stdout, "stderr": stderr, "code": code}
+
     def run(self, argv: Optional[list[str]] = None) -> None:
         """
         Run the CLI application.
 
+        If TODO_SOCKET is set, the command (anything but `serve`) is sent to
+        the daemon listening there and its output is replayed locally.
+
         Args:
             argv: Command-line arguments (default: sys.argv[1:])
         """
+        if argv is None:
+            argv = sys.argv[1:]
+
+        socket_path = os.environ.get("TODO_SOCKET")
+        if (
+            socket_path
+            and not self._manager_injected
+            and _command_name(argv) != "serve"
+        ):
+            from todo_app import daemon
+
+            try:
+                code = daemon.forward(socket_path, argv)
+            except DaemonError as e:
+                print(f"❌ Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            if code:
+                sys.exit(code)
+            return
+
         args = self.parser.parse_args(argv)
 
         if not args.command:
@@ -274,22 +744,221 @@ class TodoCLI:
         command_handlers = {
             "add": self.cmd_add,
             "list": self.cmd_list,
+            "search": self.cmd_search,
             "get": self.cmd_get,
             "update": self.cmd_update,
             "complete": self.cmd_complete,
             "incomplete": self.cmd_incomplete,
             "toggle": self.cmd_toggle,
             "delete": self.cmd_delete,
+            "import": self.cmd_import,
+            "export": self.cmd_export,
+            "stats": self.cmd_stats,
+            "batch": self.cmd_batch,
+            "serve": self.cmd_serve,
         }
 
         handler = command_handlers.get(args.command)
         if handler:
-            handler(args)
+            self._run_handler(handler, args)
         else:
             print(f"❌ Unknown command: {args.command}", file=sys.stderr)
             self.parser.print_help()
             sys.exit(1)
 
+    def _capture(self, argv: list[str], stdin: str = "") -> tuple[str, str, int]:
+        """
+        Run one command with its standard streams captured.
+
+        Args:
+            argv: Command-line arguments
+            stdin: Text the command reads as standard input
+
+        Returns:
+            Tuple of (stdout text, stderr text, exit code)
+        """
+        from contextlib import redirect_stderr, redirect_stdout
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        saved_stdin = sys.stdin
+        sys.stdin = io.StringIO(stdin)
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                code = self._execute(argv)
+        finally:
+            sys.stdin = saved_stdin
+        return stdout.getvalue(), stderr.getvalue(), code
+
+    def _execute(self, argv: list[str]) -> int:
+        """
+        Run one command, turning exits and errors into an exit code.
+
+        Args:
+            argv: Command-line arguments
+
+        Returns:
+            The command's exit code (0 on success)
+        """
+        try:
+            self.run(argv)
+        except SystemExit as e:
+            return _exit_code(e)
+        except Exception as e:
+            print(f"❌ An unexpected error occurred: {e}", file=sys.stderr)
+            return 1
+        return 0
+
+    def _report_errors(self, report: "BulkReport") -> None:
+        """
+        Print the per-ID errors of a bulk operation and exit 1 if any.
+
+        Args:
+            report: Result of a bulk manager call
+        """
+        for task_id, message in report.errors:
+            print(f"❌ ID {task_id}: {message}", file=sys.stderr)
+        if not report.ok:
+            sys.exit(1)
+
+    def _run_handler(
+        self, handler: Callable[[argparse.Namespace], None], args: argparse.Namespace
+    ) -> None:
+        """
+        Run a command handler, opening the journal first if requested.
+
+        Args:
+            handler: Bound command handler method
+            args: Parsed command-line arguments
+        """
+        if not args.journal or self._manager_injected:
+            handler(args)
+            return
+
+        from todo_app.storage import JournalStorage
+
+        self.manager = _new_manager(JournalStorage(args.journal, fsync=args.fsync))
+        try:
+            handler(args)
+        finally:
+            self.manager.close()
+
+
+def _new_manager(storage: Optional["StorageBackend"] = None) -> "TodoManager":
+    """Create a manager, instrumented if TODO_METRICS is set to a true value."""
+    from todo_app.manager import TodoManager
+
+    manager = TodoManager(storage=storage)
+    if os.environ.get("TODO_METRICS", "") not in ("", "0"):
+        from todo_app.metrics import instrument
+
+        instrument(manager)
+    return manager
+
+
+def _parse_datetime(text: str) -> "datetime":
+    """Parse an ISO 8601 date or date-time argument."""
+    from datetime import datetime
+
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid date/time '{text}' (use ISO 8601, e.g. 2026-10-17 or "
+            "2026-10-17T09:30)"
+        ) from None
+
+
+def _non_negative_int(text: str) -> int:
+    """Parse a count argument, rejecting negative numbers."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number '{text}'") from None
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative (got {value})")
+    return value
+
+
+def _format_from_path(path: str) -> str:
+    """Infer the import/export format from a file extension."""
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def _command_name(argv: list[str]) -> Optional[str]:
+    """Return the subcommand in argv without building the parser."""
+    return _split_command(argv)[0]
+
+
+def _split_command(argv: list[str]) -> tuple[Optional[str], list[str]]:
+    """Return the subcommand in argv and the arguments after it."""
+    skip = False
+    for index, arg in enumerate(argv):
+        if skip:
+            skip = False
+        elif arg in ("--journal", "--fsync"):
+            skip = True
+        elif not arg.startswith("-"):
+            return arg, argv[index + 1 :]
+    return None, []
+
+
+# Characters that need shlex to split a batch line correctly
+_SHELL_SPECIAL = frozenset("\"'\\#")
+
+
+def _parse_batch_line(line: str) -> Optional[list[str]]:
+    """
+    Split one batch line into command-line arguments.
+
+    Lines starting with "[" are JSON arrays of strings; others are split
+    like a shell command, with an optional leading "todo". Blank lines and
+    "#" comments yield None.
+
+    Raises:
+        ValueError: If the line cannot be parsed
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("["):
+        import json
+
+        argv = json.loads(line)
+        if not all(isinstance(arg, str) for arg in argv):
+            raise ValueError("JSON command must be an array of strings")
+    elif _SHELL_SPECIAL.isdisjoint(line):
+        argv = line.split()  # plain words; shlex is ~10x slower
+    else:
+        import shlex
+
+        argv = shlex.split(line, comments=True)
+    if argv[:1] == ["todo"]:
+        argv = argv[1:]
+    return argv or None
+
+
+def _last_line(text: str, code: int) -> str:
+    """Return the last line of a command's stderr as its error message."""
+    lines = text.strip().splitlines()
+    if not lines:
+        return f"exited with code {code}"
+    return lines[-1].removeprefix("❌ ").removeprefix("Error: ")
+
+
+def _exit_code(error: SystemExit) -> int:
+    """Translate a SystemExit into a process exit code."""
+    if error.code is None:
+        return 0
+    if isinstance(error.code, int):
+        return error.code
+    print(error.code, file=sys.stderr)
+    return 1
+
+
+def _exit_on_signal(signum: int, frame: Optional[FrameType]) -> None:
+    """Turn SIGTERM into a clean exit so the daemon closes its journal."""
+    sys.exit(0)
+
 
 def main() -> None:
     """Main entry point for the CLI application."""
@@ -0,0 +1,317 @@
+"""
+Columnar task store for analytics-scale task lists.
+
+This module provides ColumnarTaskStore, which keeps task fields in flat
+typed arrays instead of one Python object per task. Task objects are only
+created when a caller asks for them, and counting/filtering run as C-level
+passes over the status column.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Optional
+
+from todo_app.exceptions import TaskNotFoundException
+from todo_app.manager import TodoManager
+from todo_app.models import Task, from_epoch_micros, to_epoch_micros
+
+# Values of the status column
+PENDING = 0
+COMPLETED = 1
+DELETED = 2
+
+_STATUS_BYTES = {"pending": bytes([PENDING]), "completed": bytes([COMPLETED])}
+
+
+class ColumnarTaskStore:
+    """
+    Stores tasks column-wise in compact arrays.
+
+    Each task occupies one row: its ID in an int64 array (ascending, so rows
+    are found by binary search), its status in a bytearray, created_at as
+    int64 epoch microseconds, and its title and description as UTF-8 bytes
+    in a shared text arena addressed by offset and lengths. Deleted rows are
+    tombstoned; compact() reclaims them along with text from old updates.
+
+    Tasks returned by get_task/list_tasks are materialized copies; mutate
+    the store through its methods, not by editing the returned objects.
+
+    Examples:
+        >>> store = ColumnarTaskStore()
+        >>> task = store.add_task(title="Buy milk")
+        >>> store.get_task(task.id).title
+        'Buy milk'
+        >>> store.count_tasks(status="pending")
+        1
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns and the ID counter."""
+        self._ids = array("q")
+        self._status = bytearray()
+        self._created = array("q")
+        self._text_start = array("q")
+        self._title_len = array("i")
+        self._description_len = array("i")
+        self._arena = bytearray()
+        self._next_id = 1
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> "ColumnarTaskStore":
+        """
+        Build a store from existing tasks (e.g. TodoManager.list_tasks()).
+
+        Args:
+            tasks: Tasks in ascending ID order
+
+        Returns:
+            A new store holding the tasks
+
+        Raises:
+            ValueError: If task IDs are not strictly ascending
+        """
+        store = cls()
+        for task in tasks:
+            if task.id < store._next_id:
+                raise ValueError(f"Task IDs must be ascending (got {task.id})")
+            store._append(task)
+        return store
+
+    def add_task(self, title: str, description: str = "") -> Task:
+        """
+        Add a new task.
+
+        Args:
+            title: Task title (1-200 characters, required)
+            description: Task description (0-1000 characters, optional)
+
+        Returns:
+            The newly created Task object
+
+        Raises:
+            InvalidTaskDataError: If title/description violate constraints
+        """
+        task = Task(id=self._next_id, title=title, description=description)
+        self._append(task)
+        return task
+
+    def get_task(self, task_id: int) -> Task:
+        """
+        Get a single task by ID.
+
+        Args:
+            task_id: The ID of the task to retrieve
+
+        Returns:
+            A Task object materialized from the columns
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        return self._materialize(self._row(task_id))
+
+    def list_tasks(
+        self,
+        status: str = "all",
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> list[Task]:
+        """
+        List tasks with optional status filter, ordered by ID.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed"
+            limit: Maximum number of tasks to return (None for all)
+            after_id: Only return tasks with an ID greater than this
+
+        Returns:
+            List of Task objects matching the filter
+
+        Raises:
+            ValueError: If status is not one of the valid options
+        """
+        return list(islice(self.iter_tasks(status, after_id), limit))
+
+    def iter_tasks(
+        self, status: str = "all", after_id: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        Lazily yield tasks with optional status filter, ordered by ID.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed"
+            after_id: Only yield tasks with an ID greater than this
+
+        Returns:
+            Iterator creating one Task per matching row on demand
+
+        Raises:
+            ValueError: If status is not one of the valid options
+        """
+        TodoManager._validate_status(status)
+        start = 0 if after_id is None else bisect_right(self._ids, after_id)
+        return map(self._materialize, self._rows(status, start))
+
+    def count_tasks(self, status: str = "all") -> int:
+        """
+        Count tasks with optional status filter.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed"
+
+        Returns:
+            Number of tasks matching the filter
+
+        Raises:
+            ValueError: If status is not one of the valid options
+        """
+        TodoManager._validate_status(status)
+
+        if status == "all":
+            return len(self._status) - self._status.count(DELETED)
+        return self._status.count(_STATUS_BYTES[status])
+
+    def update_task(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Task:
+        """
+        Update an existing task's title and/or description.
+
+        The new text is appended to the arena; the old bytes are reclaimed by
+        compact().
+
+        Returns:
+            The updated Task object
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+            InvalidTaskDataError: If new data violates constraints
+        """
+        row = self._row(task_id)
+        task = self._materialize(row)
+        task.title, task.description = TodoManager._validate_update(
+            task, title, description
+        )
+        self._text_start[row], self._title_len[row], self._description_len[row] = (
+            self._store_text(task.title, task.description)
+        )
+        return task
+
+    def delete_task(self, task_id: int) -> None:
+        """
+        Delete a task by ID (tombstones its row).
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self._status[self._row(task_id)] = DELETED
+
+    def mark_complete(self, task_id: int) -> None:
+        """
+        Mark a task as complete.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self._status[self._row(task_id)] = COMPLETED
+
+    def mark_incomplete(self, task_id: int) -> None:
+        """
+        Mark a task as incomplete.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self._status[self._row(task_id)] = PENDING
+
+    def toggle_complete(self, task_id: int) -> None:
+        """
+        Toggle task completion status.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        row = self._row(task_id)
+        self._status[row] = COMPLETED - self._status[row]
+
+    def compact(self) -> None:
+        """Drop tombstoned rows and unreferenced text from the columns."""
+        fresh = ColumnarTaskStore.from_tasks(self.iter_tasks())
+        fresh._next_id = self._next_id
+        vars(self).update(vars(fresh))
+
+    def _append(self, task: Task) -> None:
+        """Append a validated task as a new row."""
+        start, title_len, description_len = self._store_text(
+            task.title, task.description
+        )
+        self._ids.append(task.id)
+        self._status.append(COMPLETED if task.completed else PENDING)
+        self._created.append(to_epoch_micros(task.created_at))
+        self._text_start.append(start)
+        self._title_len.append(title_len)
+        self._description_len.append(description_len)
+        self._next_id = task.id + 1
+
+    def _store_text(self, title: str, description: str) -> tuple[int, int, int]:
+        """Append title and description to the arena; return their location."""
+        title_bytes = title.encode("utf-8")
+        description_bytes = description.encode("utf-8")
+        start = len(self._arena)
+        self._arena += title_bytes
+        self._arena += description_bytes
+        return start, len(title_bytes), len(description_bytes)
+
+    def _row(self, task_id: int) -> int:
+        """
+        Return the row index of a live task.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        row = bisect_left(self._ids, task_id)
+        if (
+            row == len(self._ids)
+            or self._ids[row] != task_id
+            or self._status[row] == DELETED
+        ):
+            raise TaskNotFoundException(f"Task with ID {task_id} not found")
+        return row
+
+    def _rows(self, status: str, start: int = 0) -> Iterator[int]:
+        """Yield row indexes from start matching a status using C-level scans."""
+        column = self._status
+        if status == "all":
+            # Scan for runs of live rows between tombstones
+            row = start
+            while row < len(column):
+                tombstone = column.find(DELETED, row)
+                end = len(column) if tombstone == -1 else tombstone
+                yield from range(row, end)
+                row = end + 1
+            return
+
+        needle = _STATUS_BYTES[status]
+        row = column.find(needle, start)
+        while row != -1:
+            yield row
+            row = column.find(needle, row + 1)
+
+    def _materialize(self, row: int) -> Task:
+        """Create a Task object from one row of the columns."""
+        start = self._text_start[row]
+        middle = start + self._title_len[row]
+        end = middle + self._description_len[row]
+        arena = self._arena
+        return Task(
+            id=self._ids[row],
+            title=arena[start:middle].decode("utf-8"),
+            description=arena[middle:end].decode("utf-8"),
+            completed=self._status[row] == COMPLETED,
+            created_at=from_epoch_micros(self._created[row]),
+        )
@@ -0,0 +1,277 @@
+"""
+Thread-safe task manager for multi-threaded servers.
+
+This module provides a readers-writer lock and ThreadSafeTodoManager, a
+TodoManager whose read operations run concurrently with each other while
+mutations (including ID allocation) run exclusively.
+"""
+
+import functools
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Optional, TextIO, TypeVar
+
+from todo_app.manager import ITER_PAGE_SIZE, TodoManager, _sort_fields
+from todo_app.models import Task, TaskStats
+from todo_app.serialization import validate_format, write_records
+from todo_app.storage import StorageBackend
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class RWLock:
+    """
+    Writer-preferring readers-writer lock.
+
+    Any number of readers may hold the lock at once; a writer holds it
+    alone. Once a writer is waiting, new readers queue behind it so a steady
+    stream of readers cannot starve writers. The lock is not reentrant.
+
+    Examples:
+        >>> lock = RWLock()
+        >>> with lock.reading():
+        ...     pass
+        >>> with lock.writing():
+        ...     pass
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unlocked lock."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self) -> None:
+        """Block until no writer holds or waits for the lock, then share it."""
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Release a shared hold on the lock."""
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """Block until no reader or writer holds the lock, then own it."""
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """Release exclusive ownership of the lock."""
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def reading(self) -> Iterator[None]:
+        """Hold the lock shared for the duration of a with block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """Hold the lock exclusively for the duration of a with block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+def _reading(method: F) -> F:
+    """Wrap a TodoManager method to run under the shared (read) lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: "ThreadSafeTodoManager", *args: Any, **kwargs: Any) -> Any:
+        lock = self._lock
+        lock.acquire_read()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_read()
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _writing(method: F) -> F:
+    """Wrap a TodoManager method to run under the exclusive (write) lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: "ThreadSafeTodoManager", *args: Any, **kwargs: Any) -> Any:
+        lock = self._lock
+        lock.acquire_write()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_write()
+
+    return wrapper  # type: ignore[return-value]
+
+
+class ThreadSafeTodoManager(TodoManager):
+    """
+    TodoManager that can be shared between threads.
+
+    Reads (get_task, list_tasks, top_k, count_tasks, stats, search, delta)
+    share a readers-writer lock, so they never wait for each other;
+    mutations (including bulk operations, each applied as one unit) take it
+    exclusively, which makes ID allocation in add_task atomic. iter_tasks
+    and export_tasks take the read lock once per page, so long streams do
+    not block writers.
+
+    Returned Task objects are the live stored objects; treat them as
+    read-only and mutate tasks through the manager. A transaction() holds
+    the write lock only while it commits.
+
+    Examples:
+        >>> manager = ThreadSafeTodoManager()
+        >>> task = manager.add_task(title="Buy milk")
+        >>> manager.get_task(task.id).title
+        'Buy milk'
+    """
+
+    def __init__(self, storage: Optional[StorageBackend] = None) -> None:
+        """
+        Initialize the manager and its lock.
+
+        Args:
+            storage: Optional storage backend (see TodoManager)
+        """
+        self._lock = RWLock()
+        super().__init__(storage)
+
+    add_task = _writing(TodoManager.add_task)
+    delete_task = _writing(TodoManager.delete_task)
+    update_task = _writing(TodoManager.update_task)
+    mark_complete = _writing(TodoManager.mark_complete)
+    mark_incomplete = _writing(TodoManager.mark_incomplete)
+    toggle_complete = _writing(TodoManager.toggle_complete)
+    bulk_complete = _writing(TodoManager.bulk_complete)
+    bulk_delete = _writing(TodoManager.bulk_delete)
+    bulk_update = _writing(TodoManager.bulk_update)
+    import_tasks = _writing(TodoManager.import_tasks)
+    close = _writing(TodoManager.close)
+    _commit = _writing(TodoManager._commit)
+    _select_top_k = _reading(TodoManager._select_top_k)
+
+    count_tasks = _reading(TodoManager.count_tasks)
+    get_task = _reading(TodoManager.get_task)
+    delta = _reading(TodoManager.delta)
+
+    def stats(self) -> TaskStats:
+        """
+        Return a consistent snapshot of the aggregate task counters.
+
+        Unlike TodoManager.stats(), created_per_day is a copy, so it cannot
+        change while another thread mutates the manager.
+
+        Returns:
+            TaskStats with total, completed, pending and created-per-day counts
+        """
+        with self._lock.reading():
+            stats = super().stats()
+            per_day = dict(stats.created_per_day)
+        return TaskStats(
+            total=stats.total,
+            completed=stats.completed,
+            pending=stats.pending,
+            created_per_day=MappingProxyType(per_day),
+        )
+
+    def list_tasks(
+        self,
+        status: str = "all",
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        sort: str = "id",
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> list[Task]:
+        """
+        List tasks (see TodoManager.list_tasks).
+
+        The first listing that needs a sort index builds it, so it runs
+        under the write lock; later listings share the read lock.
+        """
+        fields = _sort_fields(sort, created_from, created_to)
+        if fields - self._sort_indexes.keys():
+            lock = self._lock.writing()
+        else:
+            lock = self._lock.reading()
+        with lock:
+            return super().list_tasks(
+                status, limit, after_id, sort, created_from, created_to
+            )
+
+    def search(
+        self, query: str, status: str = "all", limit: Optional[int] = None
+    ) -> list[Task]:
+        """
+        Search task titles and descriptions (see TodoManager.search).
+
+        The first search builds the index, so it runs under the write lock;
+        later searches share the read lock.
+        """
+        if self._search_index is None:
+            with self._lock.writing():
+                return super().search(query, status=status, limit=limit)
+        with self._lock.reading():
+            return super().search(query, status=status, limit=limit)
+
+    def iter_tasks(
+        self, status: str = "all", after_id: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        Lazily yield tasks, holding the read lock only while fetching a page.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed"
+            after_id: Only yield tasks with an ID greater than this
+
+        Returns:
+            Iterator over matching Task objects
+
+        Raises:
+            ValueError: If status is not one of the valid options
+        """
+        self._validate_status(status)
+        return self._iter_pages(status, after_id)
+
+    def export_tasks(
+        self, fp: TextIO, format: str = "jsonl", status: str = "all"
+    ) -> int:
+        """
+        Stream tasks to a file, holding the read lock only per page.
+
+        Returns:
+            Number of tasks written
+
+        Raises:
+            ValueError: If format or status is not valid
+        """
+        validate_format(format)
+        return write_records(fp, self.iter_tasks(status), format)
+
+    def _iter_pages(self, status: str, after_id: Optional[int]) -> Iterator[Task]:
+        """Yield tasks page by page, locking for each page fetch."""
+        while True:
+            page = self.list_tasks(status, limit=ITER_PAGE_SIZE, after_id=after_id)
+            yield from page
+            if len(page) < ITER_PAGE_SIZE:
+                return
+            after_id = page[-1].id
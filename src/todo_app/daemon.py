@@ -0,0 +1,235 @@
+"""
+Persistent daemon for the todo CLI.
+
+This module lets one long-running process (`todo serve`) hold a TodoManager
+in memory behind a Unix domain socket. CLI invocations with TODO_SOCKET set
+forward their arguments to it instead of building their own manager, so
+they share state and skip loading tasks on every call.
+
+The wire protocol is one JSON object per line in each direction, one
+request per connection:
+
+    request:  {"argv": [...], "cwd": "/path", "stdin": "..."}
+    response: {"stdout": "...", "stderr": "...", "code": 0}
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from todo_app.exceptions import DaemonError
+
+# Environment variable naming the daemon socket used by CLI clients
+SOCKET_ENV = "TODO_SOCKET"
+
+Request = dict[str, Any]
+Response = dict[str, Any]
+
+
+def default_socket_path() -> str:
+    """
+    Return the socket path used when none is configured.
+
+    Returns:
+        $TODO_SOCKET if set, else a per-user path in the temp directory
+    """
+    import tempfile
+
+    return os.environ.get(SOCKET_ENV) or os.path.join(
+        tempfile.gettempdir(), f"todo-{os.getuid()}.sock"
+    )
+
+
+def reads_stdin(argv: list[str]) -> bool:
+    """
+    Return True if the command would read its input from standard input.
+
+    That is `import -`, and `batch` without a file (or with `-f -`,
+    `--file=-`), also after global options such as `--journal PATH`.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+    """
+    from todo_app.cli import _split_command
+
+    command, options = _split_command(argv)
+    if command == "import":
+        return "-" in options
+    if command == "batch":
+        source = "-"
+        args = iter(options)
+        for arg in args:
+            if arg in ("-f", "--file"):
+                source = next(args, "-")
+            elif arg.startswith("--file="):
+                source = arg.removeprefix("--file=")
+            elif arg.startswith("-f"):
+                source = arg.removeprefix("-f")
+        return source == "-"
+    return False
+
+
+def request(path: str, payload: Request) -> Response:
+    """
+    Send one request to a running daemon and return its response.
+
+    Args:
+        path: Daemon socket path
+        payload: Request object (see module docstring)
+
+    Returns:
+        Response object with stdout, stderr and code
+
+    Raises:
+        DaemonError: If the daemon cannot be reached or replies badly
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        except OSError as e:
+            raise DaemonError(f"Cannot reach todo daemon at {path}: {e}") from e
+
+    try:
+        response = json.loads(line)
+    except ValueError as e:
+        raise DaemonError(f"Invalid response from todo daemon at {path}") from e
+    if not isinstance(response, dict):
+        raise DaemonError(f"Invalid response from todo daemon at {path}")
+    return response
+
+
+def forward(path: str, argv: list[str]) -> int:
+    """
+    Run a CLI command in the daemon and replay its output locally.
+
+    Args:
+        path: Daemon socket path
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        The command's exit code
+
+    Raises:
+        DaemonError: If the daemon cannot be reached or replies badly
+    """
+    payload: Request = {"argv": argv, "cwd": os.getcwd()}
+    if reads_stdin(argv):
+        payload["stdin"] = sys.stdin.read()
+
+    response = request(path, payload)
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response.get("code", 1))
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """
+    Unix domain socket server running CLI requests one at a time.
+
+    Requests are handled sequentially, so execute never runs concurrently
+    and may use a plain (non-thread-safe) TodoManager. The socket is created
+    owner-only and removed when the server is closed.
+
+    Attributes:
+        path: Socket path being served
+        execute: Callback turning a request object into a response object
+    """
+
+    def __init__(self, path: str, execute: Callable[[Request], Response]) -> None:
+        """
+        Bind the socket, replacing a stale one left by a dead daemon.
+
+        Args:
+            path: Socket path to listen on
+            execute: Callback turning a request object into a response object
+
+        Raises:
+            DaemonError: If path is taken by a live daemon or another file
+        """
+        _remove_stale_socket(path)
+        self.path = path
+        self.execute = execute
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self) -> None:
+        """Close the listening socket and remove the socket file."""
+        super().server_close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Read one JSON request line and write one JSON response line."""
+
+    server: DaemonServer
+
+    def handle(self) -> None:
+        """Handle a single request on the connection."""
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            payload = json.loads(line)
+            if not isinstance(payload, dict) or not isinstance(
+                payload.get("argv"), list
+            ):
+                raise ValueError("request must be an object with an argv list")
+        except ValueError as e:
+            response: Response = {
+                "stdout": "",
+                "stderr": f"❌ Error: Invalid request: {e}\n",
+                "code": 2,
+            }
+        else:
+            response = self.server.execute(payload)
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def serve(path: str, execute: Callable[[Request], Response]) -> None:
+    """
+    Serve requests on a Unix domain socket until interrupted.
+
+    Args:
+        path: Socket path to listen on
+        execute: Callback turning a request object into a response object
+
+    Raises:
+        DaemonError: If path is taken by a live daemon or another file
+    """
+    with DaemonServer(path, execute) as server:
+        server.serve_forever()
+
+
+def _remove_stale_socket(path: str) -> None:
+    """
+    Remove a socket file left behind by a daemon that is no longer running.
+
+    Raises:
+        DaemonError: If path is not a socket, or a daemon is still accepting
+            connections on it
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise DaemonError(f"{path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+    raise DaemonError(f"A todo daemon is already running at {path}")
@@ -30,3 +30,49 @@ class TaskNotFoundException(Exception):
     """
 
     pass
+
+
+class StorageError(Exception):
+    """
+    Raised when a storage backend cannot read or write task data.
+
+    Examples:
+        - Journal record with an unknown operation
+        - Invalid storage configuration (e.g. unknown fsync policy)
+    """
+
+    pass
+
+
+class DaemonError(Exception):
+    """
+    Raised when the CLI daemon cannot be started or reached.
+
+    Examples:
+        - No daemon listening on the configured socket
+        - Another daemon already serving the socket path
+    """
+
+    pass
+
+
+class ChangesExpiredError(Exception):
+    """
+    Raised when requested changes are no longer kept by a change feed.
+
+    Examples:
+        - changes_since() with a sequence number older than the ring buffer
+    """
+
+    pass
+
+
+class TransactionConflictError(Exception):
+    """
+    Raised when a transaction cannot commit over the manager's current state.
+
+    Examples:
+        - A task added by the transaction would take an ID already in use
+    """
+
+    pass
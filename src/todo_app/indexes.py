@@ -0,0 +1,211 @@
+"""
+Ordered in-memory indexes for the todo application.
+
+This module provides a sorted container used by TodoManager to keep
+secondary indexes (such as task IDs grouped by status) in order without
+rescanning every task.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import Any, Optional
+
+# Bucket size for SortedIndex; keeps insert/remove memmoves small
+DEFAULT_LOAD = 1000
+
+
+class SortedIndex:
+    """
+    Sorted collection of unique, comparable keys.
+
+    Keys are stored in a list of sorted buckets, so inserting or removing a
+    key costs O(log n) comparisons plus a memmove bounded by the bucket size,
+    and iterating a range costs O(log n + k) for k returned keys.
+
+    Attributes:
+        load: Target bucket size; buckets split at twice this size
+
+    Examples:
+        >>> index = SortedIndex([3, 1, 2])
+        >>> list(index)
+        [1, 2, 3]
+        >>> index.discard(2)
+        True
+        >>> list(index.irange(minimum=2))
+        [3]
+    """
+
+    def __init__(self, keys: Iterable[Any] = (), load: int = DEFAULT_LOAD) -> None:
+        """
+        Initialize the index, optionally bulk-loading keys.
+
+        Args:
+            keys: Initial keys (duplicates are ignored)
+            load: Target bucket size (must be positive)
+        """
+        self.load = load
+        self._buckets: list[list[Any]] = []
+        self._maxes: list[Any] = []
+        self._len = 0
+
+        ordered = sorted(set(keys))
+        for start in range(0, len(ordered), load):
+            bucket = ordered[start : start + load]
+            self._buckets.append(bucket)
+            self._maxes.append(bucket[-1])
+        self._len = len(ordered)
+
+    def __len__(self) -> int:
+        """Return the number of keys in the index."""
+        return self._len
+
+    def __contains__(self, key: Any) -> bool:
+        """Return True if key is present in the index."""
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._buckets[pos]
+        idx = bisect_left(bucket, key)
+        return bucket[idx] == key
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over all keys in ascending order."""
+        return chain.from_iterable(self._buckets)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterate over all keys in descending order."""
+        return chain.from_iterable(reversed(b) for b in reversed(self._buckets))
+
+    def add(self, key: Any) -> bool:
+        """
+        Insert a key, keeping the index sorted.
+
+        Args:
+            key: Key to insert
+
+        Returns:
+            True if the key was inserted, False if it was already present
+        """
+        if not self._maxes:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._len = 1
+            return True
+
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            # Larger than every key: append to the last bucket (common case
+            # for monotonically increasing task IDs)
+            pos -= 1
+            self._buckets[pos].append(key)
+            self._maxes[pos] = key
+        else:
+            bucket = self._buckets[pos]
+            idx = bisect_left(bucket, key)
+            if bucket[idx] == key:
+                return False
+            bucket.insert(idx, key)
+
+        self._len += 1
+        self._split(pos)
+        return True
+
+    def discard(self, key: Any) -> bool:
+        """
+        Remove a key if present.
+
+        Args:
+            key: Key to remove
+
+        Returns:
+            True if the key was removed, False if it was not present
+        """
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return False
+
+        bucket = self._buckets[pos]
+        idx = bisect_left(bucket, key)
+        if bucket[idx] != key:
+            return False
+
+        del bucket[idx]
+        self._len -= 1
+        if not bucket:
+            del self._buckets[pos]
+            del self._maxes[pos]
+        elif idx == len(bucket):
+            self._maxes[pos] = bucket[-1]
+        return True
+
+    def irange(
+        self,
+        minimum: Optional[Any] = None,
+        maximum: Optional[Any] = None,
+        inclusive: tuple[bool, bool] = (True, True),
+        reverse: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Iterate over keys between minimum and maximum.
+
+        The iterator reads the live index, so the index must not be modified
+        while the iterator is being consumed.
+
+        Args:
+            minimum: Lower bound (None for unbounded)
+            maximum: Upper bound (None for unbounded)
+            inclusive: Whether (minimum, maximum) bounds are inclusive
+            reverse: Yield keys in descending order if True
+
+        Returns:
+            Iterator over matching keys
+        """
+        start = self._locate(minimum, inclusive[0], lower=True)
+        stop = self._locate(maximum, inclusive[1], lower=False)
+        return self._slice(start, stop, reverse)
+
+    def _locate(
+        self, key: Optional[Any], inclusive: bool, lower: bool
+    ) -> tuple[int, int]:
+        """Return the (bucket, offset) boundary for a range endpoint."""
+        if key is None:
+            if lower:
+                return (0, 0)
+            return (len(self._buckets), 0)
+
+        use_left = inclusive if lower else not inclusive
+        search = bisect_left if use_left else bisect_right
+        pos = search(self._maxes, key)
+        if pos == len(self._maxes):
+            return (pos, 0)
+        return (pos, search(self._buckets[pos], key))
+
+    def _slice(
+        self, start: tuple[int, int], stop: tuple[int, int], reverse: bool
+    ) -> Iterator[Any]:
+        """Yield keys between two (bucket, offset) boundaries."""
+        if start >= stop:
+            return
+        (start_pos, start_idx), (stop_pos, stop_idx) = start, stop
+        buckets = self._buckets
+        positions = range(start_pos, min(stop_pos, len(buckets) - 1) + 1)
+        for pos in reversed(positions) if reverse else positions:
+            bucket = buckets[pos]
+            lo = start_idx if pos == start_pos else 0
+            hi = stop_idx if pos == stop_pos else len(bucket)
+            if reverse:
+                yield from reversed(bucket[lo:hi])
+            else:
+                yield from bucket[lo:hi]
+
+    def _split(self, pos: int) -> None:
+        """Split an oversized bucket in two."""
+        bucket = self._buckets[pos]
+        if len(bucket) <= 2 * self.load:
+            return
+        tail = bucket[self.load :]
+        del bucket[self.load :]
+        self._maxes[pos] = bucket[-1]
+        self._buckets.insert(pos + 1, tail)
+        self._maxes.insert(pos + 1, tail[-1])
@@ -1,13 +1,64 @@
 """
 TodoManager class for managing todo tasks.
 
-This module provides the core CRUD operations for managing tasks in-memory.
+This module provides the core CRUD operations for managing tasks in-memory,
+optionally persisting every mutation through a storage backend.
 """
 
-from typing import Optional
+import heapq
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import partial
+from itertools import islice
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Optional, TextIO
 
-from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
-from todo_app.models import Task
+from todo_app.changes import ChangeFeed
+from todo_app.exceptions import (
+    ChangesExpiredError,
+    InvalidTaskDataError,
+    StorageError,
+    TaskNotFoundException,
+    TransactionConflictError,
+)
+from todo_app.indexes import SortedIndex
+from todo_app.models import (
+    BulkReport,
+    ImportReport,
+    Task,
+    TaskDelta,
+    TaskStats,
+    to_epoch_micros,
+)
+from todo_app.search import SearchIndex
+from todo_app.serialization import record_to_task, validate_format, write_records
+from todo_app.storage import StorageBackend
+from todo_app.transaction import Transaction
+
+VALID_STATUSES = ("all", "pending", "completed")
+
+# list_tasks orders; a leading "-" means descending
+VALID_SORTS = ("id", "created", "-created", "title", "-title")
+
+# Task IDs fetched per index lookup while iterating lazily
+ITER_PAGE_SIZE = 1000
+
+# top_k fields and the list_tasks order each one reads
+TOP_K_FIELDS = {"created_at": "created", "title": "title"}
+
+# Cost of one heap step in top_k relative to one sort index entry scanned
+# (the heap computes a key per task, the index has them precomputed)
+TOP_K_HEAP_COST = 16
+
+# Deleted task IDs remembered for delta(); older deletions are forgotten and
+# callers that last synced before them must resynchronize in full
+TOMBSTONE_RETENTION = 10_000
+
+# Imported tasks journaled per batch, bounding the memory an import holds
+IMPORT_BATCH_SIZE = 10_000
 
 
 class TodoManager:
@@ -15,11 +66,33 @@ class TodoManager:
     Manages in-memory todo tasks with CRUD operations.
 
     The TodoManager provides methods to create, read, update, and delete tasks.
-    All tasks are stored in-memory and will be lost when the application terminates.
+    All tasks are stored in-memory and will be lost when the application terminates,
+    unless a storage backend is given: then every mutation is appended to it and
+    the stored history is replayed on startup.
 
     Attributes:
         tasks: Dictionary mapping task IDs to Task objects
         _next_id: Counter for generating unique task IDs
+        _status_ids: Sorted task IDs per status ("pending", "completed"),
+            kept in sync with tasks so filtered views never scan all tasks
+        _created_per_day: Number of existing tasks per creation date
+        _storage: Optional backend receiving one record per mutation
+        _search_index: Inverted index over titles/descriptions, built on the
+            first search() and then maintained incrementally
+        changes: Feed of mutation events (replace it with a ChangeFeed of
+            another capacity, and last_seq=version, before mutating to keep
+            more history)
+        _versions: Version (change sequence number) of each task's last
+            change, ordered oldest change first; tasks unchanged since the
+            manager was created or restored are absent
+        _tombstones: Version of each remembered deletion, oldest first, at
+            most TOMBSTONE_RETENTION of them
+        _tombstone_floor: Version of the newest forgotten deletion; after a
+            restore from storage, at least the restored version, since
+            deletions before it are not tracked
+        _sort_indexes: Sorted (key, task ID) pairs per sort field ("created",
+            "title"), each built on the first list_tasks() that needs it and
+            then maintained incrementally
 
     Examples:
         >>> manager = TodoManager()
@@ -30,10 +103,43 @@ class TodoManager:
         1
     """
 
-    def __init__(self) -> None:
-        """Initialize TodoManager with empty task dictionary and ID counter."""
+    def __init__(self, storage: Optional[StorageBackend] = None) -> None:
+        """
+        Initialize TodoManager with empty task dictionary and ID counter.
+
+        Args:
+            storage: Optional storage backend; its records are replayed to
+                restore previously saved tasks
+
+        Raises:
+            StorageError: If stored records cannot be replayed
+        """
         self.tasks: dict[int, Task] = {}
         self._next_id: int = 1
+        self._status_ids: dict[str, SortedIndex] = {
+            "pending": SortedIndex(),
+            "completed": SortedIndex(),
+        }
+        self._created_per_day: Counter[date] = Counter()
+        self._storage = storage
+        self._search_index: Optional[SearchIndex] = None
+        self._sort_indexes: dict[str, SortedIndex] = {}
+        self.changes = ChangeFeed()
+        self._versions: dict[int, int] = {}
+        self._tombstones: dict[int, int] = {}
+        self._tombstone_floor = 0
+
+        if storage is not None:
+            version = 0
+            for record in storage.replay():
+                try:
+                    version = self._apply_record(record, version)
+                except (KeyError, TypeError, ValueError, InvalidTaskDataError) as e:
+                    raise StorageError(f"Cannot replay record {record!r}: {e}") from e
+            # Versions keep counting across restarts, and deltas from before
+            # the restart expire instead of missing the deletions made then
+            self.changes = ChangeFeed(last_seq=version)
+            self._tombstone_floor = version
 
     def add_task(self, title: str, description: str = "") -> Task:
         """
@@ -64,24 +170,51 @@ class TodoManager:
             description=description,
         )
 
-        self.tasks[task.id] = task
+        self._insert(task)
         self._next_id += 1
+        self._log("add", task)
 
         return task
 
-    def list_tasks(self, status: str = "all") -> list[Task]:
+    def list_tasks(
+        self,
+        status: str = "all",
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        sort: str = "id",
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> list[Task]:
         """
-        List tasks with optional status filter.
+        List tasks with optional status filter, order and creation range.
+
+        Supports keyset pagination: pass the ID of the last task of one page
+        as after_id to get the next page. Each page costs O(log n + limit).
+
+        Orders other than "id" and creation ranges read sorted indexes on
+        (created_at, id) and (case-folded title, id), so a page costs
+        O(log n + k) for k tasks scanned; with a status filter, tasks of the
+        other status are scanned and skipped. A range combined with the "id"
+        or "title" order sorts the tasks in the range, O(log n + k log k).
 
         Args:
             status: Filter by status - "all", "pending", or "completed".
                    Default is "all"
+            limit: Maximum number of tasks to return (None for all)
+            after_id: Only return tasks after this one in the chosen order;
+                for orders other than "id" the task must still exist
+            sort: "id" (default), "created" (oldest first), "-created"
+                (newest first), "title" (case-insensitive A-Z) or "-title"
+            created_from: Only return tasks created at or after this time
+            created_to: Only return tasks created before this time
 
         Returns:
-            List of Task objects matching the filter, ordered by creation (ID)
+            List of Task objects matching the filter, in the chosen order
 
         Raises:
-            ValueError: If status is not one of the valid options
+            ValueError: If status or sort is not one of the valid options
+            TaskNotFoundException: If after_id doesn't exist and sort is
+                not "id"
 
         Examples:
             >>> manager = TodoManager()
@@ -92,19 +225,269 @@ class TodoManager:
             2
             >>> len(manager.list_tasks(status="pending"))
             1
+            >>> [t.id for t in manager.list_tasks(limit=1, after_id=task1.id)]
+            [2]
+            >>> [t.id for t in manager.list_tasks(sort="-created")]
+            [2, 1]
         """
-        valid_statuses = ["all", "pending", "completed"]
-        if status not in valid_statuses:
-            raise ValueError(
-                f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
-            )
+        self._validate_status(status)
+        self._validate_sort(sort)
+
+        if sort != "id" or created_from is not None or created_to is not None:
+            tasks = self._iter_sorted(status, sort, after_id, created_from, created_to)
+            return list(islice(tasks, limit))
+
+        if limit is not None:
+            # Fetch only the IDs of this page, not a whole ITER_PAGE_SIZE
+            tasks = self.tasks
+            return [tasks[i] for i in self._page_ids(status, after_id, limit)]
+        if after_id is not None:
+            return list(self._iter_status(status, after_id))
 
         if status == "all":
             return list(self.tasks.values())
-        elif status == "pending":
-            return [task for task in self.tasks.values() if not task.completed]
-        else:  # status == "completed"
-            return [task for task in self.tasks.values() if task.completed]
+
+        # Walk the status index so the cost is proportional to the result
+        tasks = self.tasks
+        return [tasks[task_id] for task_id in self._status_ids[status]]
+
+    def iter_tasks(
+        self, status: str = "all", after_id: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        Lazily yield tasks with optional status filter, ordered by ID.
+
+        IDs are fetched from the status indexes in pages, so memory stays
+        bounded and the manager may be modified between items: tasks deleted
+        or changed to another status before they are reached are skipped.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed"
+            after_id: Only yield tasks with an ID greater than this
+
+        Returns:
+            Iterator over matching Task objects
+
+        Raises:
+            ValueError: If status is not one of the valid options
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> task = manager.add_task(title="Task 1")
+            >>> [t.title for t in manager.iter_tasks()]
+            ['Task 1']
+        """
+        self._validate_status(status)
+        return self._iter_status(status, after_id)
+
+    def count_tasks(self, status: str = "all") -> int:
+        """
+        Count tasks with optional status filter.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed".
+                   Default is "all"
+
+        Returns:
+            Number of tasks matching the filter
+
+        Raises:
+            ValueError: If status is not one of the valid options
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> task = manager.add_task(title="Task")
+            >>> manager.count_tasks(status="pending")
+            1
+        """
+        self._validate_status(status)
+
+        if status == "all":
+            return len(self.tasks)
+        return len(self._status_ids[status])
+
+    def stats(self) -> TaskStats:
+        """
+        Return aggregate task counters.
+
+        Counters are maintained on every mutation, so this is O(1) regardless
+        of how many tasks exist.
+
+        Returns:
+            TaskStats with total, completed, pending and created-per-day counts
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> task = manager.add_task(title="Task")
+            >>> manager.mark_complete(task_id=task.id)
+            >>> manager.stats().completed
+            1
+        """
+        completed = len(self._status_ids["completed"])
+        return TaskStats(
+            total=len(self.tasks),
+            completed=completed,
+            pending=len(self.tasks) - completed,
+            created_per_day=MappingProxyType(self._created_per_day),
+        )
+
+    def top_k(
+        self,
+        k: int,
+        by: str = "created_at",
+        status: str = "pending",
+        reverse: bool = False,
+    ) -> list[Task]:
+        """
+        Return the k first tasks with a status, ordered by a field.
+
+        Reads the field's sorted index (see list_tasks): O(log n + k) for
+        status "all", and O(log n + k * n / m) when m of the n tasks have
+        the status, since the others are skipped. When the status is so
+        rare that this scan would cost more, it selects from the m tasks
+        with a heap instead, O(m log k), without sorting them.
+
+        Args:
+            k: Number of tasks to return
+            by: "created_at" (default) or "title" (case-insensitive)
+            status: Filter by status - "all", "pending" (default), or
+                "completed"
+            reverse: Return the last k instead (e.g. the newest tasks)
+
+        Returns:
+            Up to k tasks, in ascending order of the field (descending if
+            reverse), ties broken by ID
+
+        Raises:
+            ValueError: If by or status is not valid, or k is negative
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> for title in ("first", "second", "third"):
+            ...     _ = manager.add_task(title=title)
+            >>> [t.title for t in manager.top_k(2, reverse=True)]
+            ['third', 'second']
+        """
+        self._validate_status(status)
+        if by not in TOP_K_FIELDS:
+            raise ValueError(
+                f"Invalid field '{by}'. Must be one of: {', '.join(TOP_K_FIELDS)}"
+            )
+        if k < 0:
+            raise ValueError(f"k must not be negative (got {k})")
+
+        field = TOP_K_FIELDS[by]
+        matching = self.count_tasks(status)
+        if matching * matching * TOP_K_HEAP_COST < k * len(self.tasks):
+            return self._select_top_k(k, field, status, reverse)
+        return self.list_tasks(status, limit=k, sort=f"-{field}" if reverse else field)
+
+    @property
+    def version(self) -> int:
+        """
+        Number of changes made to the tasks (0 before any).
+
+        Changes replayed from storage count, so versions keep increasing
+        across restarts.
+        """
+        return self.changes.last_seq
+
+    def delta(self, since: int = 0) -> TaskDelta:
+        """
+        Return what changed after a version, for incremental sync.
+
+        A client stores the returned version and passes it back next time,
+        receiving only the tasks changed since and the IDs deleted since.
+        Costs O(changes), however many tasks exist; since=0 returns every
+        task.
+
+        Args:
+            since: Version the caller last synced to (0 for everything)
+
+        Returns:
+            TaskDelta with the current version, changed tasks and deleted IDs
+
+        Raises:
+            ValueError: If since is negative
+            ChangesExpiredError: If since predates a forgotten deletion or
+                the manager's restore from storage, or is ahead of this
+                manager (e.g. its storage was reset); the caller must
+                resynchronize with since=0
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> first = manager.add_task(title="Buy milk")
+            >>> synced = manager.version
+            >>> second = manager.add_task(title="Walk dog")
+            >>> manager.delete_task(first.id)
+            >>> delta = manager.delta(synced)
+            >>> ([t.title for t in delta.changed], delta.deleted, delta.version)
+            (['Walk dog'], [1], 3)
+        """
+        version = self.version
+        if since < 0:
+            raise ValueError(f"Version must not be negative (got {since})")
+        if since > version:
+            raise ChangesExpiredError(
+                f"Version {since} is ahead of this manager (at {version})"
+            )
+        if since == 0:
+            return TaskDelta(version=version, changed=list(self.tasks.values()))
+        if since < self._tombstone_floor:
+            raise ChangesExpiredError(
+                f"Deletions before version {self._tombstone_floor} "
+                f"are no longer tracked (requested {since})"
+            )
+
+        changed = _newer_than(self._versions, since)
+        return TaskDelta(
+            version=version,
+            changed=[self.tasks[task_id] for task_id in changed],
+            deleted=_newer_than(self._tombstones, since),
+        )
+
+    def search(
+        self, query: str, status: str = "all", limit: Optional[int] = None
+    ) -> list[Task]:
+        """
+        Search task titles and descriptions.
+
+        Every query word must match a word in the task, either exactly or as
+        a prefix ("groc" matches "groceries"). Matching is Unicode-aware and
+        case-insensitive; title matches rank above description matches.
+
+        Args:
+            query: Free-text query
+            status: Filter by status - "all", "pending", or "completed"
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            Matching tasks, most relevant first
+
+        Raises:
+            ValueError: If status is not one of the valid options
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> task = manager.add_task(title="Buy groceries")
+            >>> [t.title for t in manager.search("groc")]
+            ['Buy groceries']
+        """
+        self._validate_status(status)
+
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            for task in self.tasks.values():
+                self._search_index.add(task)
+
+        task_ids = self._search_index.search(
+            query, limit=limit if status == "all" else None
+        )
+        matches = (self.tasks[task_id] for task_id in task_ids)
+        if status != "all":
+            completed = status == "completed"
+            matches = (task for task in matches if task.completed == completed)
+        return list(islice(matches, limit))
 
     def get_task(self, task_id: int) -> Task:
         """
@@ -126,10 +509,7 @@ class TodoManager:
             >>> retrieved.title
             'Test'
         """
-        if task_id not in self.tasks:
-            raise TaskNotFoundException(f"Task with ID {task_id} not found")
-
-        return self.tasks[task_id]
+        return self._require(task_id)
 
     def delete_task(self, task_id: int) -> None:
         """
@@ -148,10 +528,8 @@ class TodoManager:
             >>> len(manager.list_tasks())
             0
         """
-        if task_id not in self.tasks:
-            raise TaskNotFoundException(f"Task with ID {task_id} not found")
-
-        del self.tasks[task_id]
+        self._require(task_id)
+        self._log("delete", self._remove(task_id))
 
     def update_task(
         self,
@@ -181,32 +559,13 @@ class TodoManager:
             >>> updated.title
             'New title'
         """
-        if task_id not in self.tasks:
-            raise TaskNotFoundException(f"Task with ID {task_id} not found")
-
-        task = self.tasks[task_id]
+        task = self._require(task_id)
 
-        # Update title if provided
-        if title is not None:
-            # Create a temporary task to validate the new title
-            # This leverages Task.__post_init__ validation
-            temp_task = Task(
-                id=task.id,
-                title=title,
-                description=task.description,
-                completed=task.completed,
-            )
-            task.title = temp_task.title  # Use the validated and trimmed title
-
-        # Update description if provided
-        if description is not None:
-            # Validate description length
-            if len(description) > 1000:
-                raise InvalidTaskDataError(
-                    f"Description must be at most 1000 characters (got {len(description)})"
-                )
-            task.description = description
+        # Validate both fields before changing anything
+        new_title, new_description = self._validate_update(task, title, description)
 
+        self._set_fields(task, new_title, new_description)
+        self._log("update", task)
         return task
 
     def mark_complete(self, task_id: int) -> None:
@@ -226,10 +585,9 @@ class TodoManager:
             >>> manager.get_task(task.id).completed
             True
         """
-        if task_id not in self.tasks:
-            raise TaskNotFoundException(f"Task with ID {task_id} not found")
-
-        self.tasks[task_id].completed = True
+        task = self._require(task_id)
+        self._set_completed(task, True)
+        self._log("complete", task)
 
     def mark_incomplete(self, task_id: int) -> None:
         """
@@ -249,10 +607,9 @@ class TodoManager:
             >>> manager.get_task(task.id).completed
             False
         """
-        if task_id not in self.tasks:
-            raise TaskNotFoundException(f"Task with ID {task_id} not found")
-
-        self.tasks[task_id].completed = False
+        task = self._require(task_id)
+        self._set_completed(task, False)
+        self._log("incomplete", task)
 
     def toggle_complete(self, task_id: int) -> None:
         """
@@ -276,8 +633,666 @@ class TodoManager:
             >>> manager.get_task(task.id).completed
             False
         """
-        if task_id not in self.tasks:
+        task = self._require(task_id)
+        self._set_completed(task, not task.completed)
+        self._log("toggle", task)
+
+    def bulk_complete(
+        self, task_ids: Iterable[int], atomic: bool = False
+    ) -> BulkReport:
+        """
+        Mark many tasks as complete in one pass.
+
+        Args:
+            task_ids: IDs of the tasks to complete (duplicates are ignored)
+            atomic: If True, change nothing unless every ID exists
+
+        Returns:
+            BulkReport with the IDs changed and per-ID errors
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> task = manager.add_task(title="Task")
+            >>> report = manager.bulk_complete([task.id, 99])
+            >>> report.succeeded, report.errors
+            ([1], [(99, 'Task with ID 99 not found')])
+        """
+        tasks, report = self._collect(task_ids, atomic)
+        for task in tasks:
+            self._set_completed(task, True)
+        self._log_many("complete", tasks)
+        return report
+
+    def bulk_delete(self, task_ids: Iterable[int], atomic: bool = False) -> BulkReport:
+        """
+        Delete many tasks in one pass.
+
+        Args:
+            task_ids: IDs of the tasks to delete (duplicates are ignored)
+            atomic: If True, delete nothing unless every ID exists
+
+        Returns:
+            BulkReport with the IDs deleted and per-ID errors
+        """
+        tasks, report = self._collect(task_ids, atomic)
+        for task in tasks:
+            self._remove(task.id)
+        self._log_many("delete", tasks)
+        return report
+
+    def bulk_update(
+        self,
+        updates: Mapping[int, Mapping[str, Optional[str]]],
+        atomic: bool = False,
+    ) -> BulkReport:
+        """
+        Update the title and/or description of many tasks in one pass.
+
+        Every update is validated before any task is changed.
+
+        Args:
+            updates: Task ID -> {"title": ..., "description": ...}; missing
+                or None fields are left unchanged
+            atomic: If True, change nothing unless every update is valid
+
+        Returns:
+            BulkReport with the IDs changed and per-ID errors
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> task = manager.add_task(title="Old")
+            >>> manager.bulk_update({task.id: {"title": "New"}}).ok
+            True
+        """
+        report = BulkReport()
+        changes: list[tuple[Task, str, str]] = []
+        for task_id, fields in updates.items():
+            task = self.tasks.get(task_id)
+            if task is None:
+                report.errors.append((task_id, f"Task with ID {task_id} not found"))
+                continue
+            try:
+                title, description = self._validate_update(
+                    task, fields.get("title"), fields.get("description")
+                )
+            except InvalidTaskDataError as e:
+                report.errors.append((task_id, str(e)))
+                continue
+            changes.append((task, title, description))
+
+        if atomic and report.errors:
+            return report
+        for task, title, description in changes:
+            self._set_fields(task, title, description)
+        report.succeeded = [task.id for task, _, _ in changes]
+        self._log_many("update", [task for task, _, _ in changes])
+        return report
+
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """
+        Group changes so they are applied all together or not at all.
+
+        Changes made through the yielded Transaction are validated
+        immediately but buffered in an overlay; when the with block exits
+        normally they are committed (and journaled as one atomic record),
+        and if it raises they are discarded. Only touched tasks are copied,
+        so the cost is proportional to the number of changed tasks.
+
+        Returns:
+            Context manager yielding the Transaction
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> with manager.transaction() as tx:
+            ...     task = tx.add_task(title="Plan trip")
+            ...     tx.mark_complete(task.id)
+            >>> manager.get_task(1).completed
+            True
+            >>> try:
+            ...     with manager.transaction() as tx:
+            ...         tx.delete_task(1)
+            ...         tx.add_task(title="")
+            ... except InvalidTaskDataError:
+            ...     pass
+            >>> manager.count_tasks()
+            1
+        """
+        transaction = Transaction(self)
+        yield transaction
+        self._commit(transaction)
+
+    def import_tasks(self, records: Iterable[Mapping[str, Any]]) -> ImportReport:
+        """
+        Add many tasks from an iterable of records.
+
+        Records are consumed lazily (e.g. from serialization.read_records), so
+        the input is never held in memory. Each valid row gets the next
+        sequential ID; IDs in the input are ignored. Invalid rows are
+        skipped and reported instead of aborting the import. The imported
+        tasks are journaled in batches of IMPORT_BATCH_SIZE.
+
+        Args:
+            records: Mappings with "title" and optional "description",
+                "completed" and "created_at" keys
+
+        Returns:
+            ImportReport with the number imported and per-row errors
+
+        Examples:
+            >>> manager = TodoManager()
+            >>> report = manager.import_tasks([{"title": "A"}, {"title": ""}])
+            >>> report.imported, report.errors
+            (1, [(2, 'Title cannot be empty')])
+        """
+        report = ImportReport()
+        next_id = self._next_id
+        added: list[Task] = []
+        try:
+            for row_number, record in enumerate(records, start=1):
+                try:
+                    task = record_to_task(record, next_id)
+                except InvalidTaskDataError as e:
+                    report.errors.append((row_number, str(e)))
+                    continue
+                self._insert(task)
+                added.append(task)
+                next_id += 1
+                report.imported += 1
+                if len(added) >= IMPORT_BATCH_SIZE:
+                    self._next_id = next_id
+                    self._log_many("add", added)
+                    added = []
+        finally:
+            # IDs are handed out from a local counter and published per
+            # batch, and each batch costs at most one fsync
+            self._next_id = next_id
+            self._log_many("add", added)
+        return report
+
+    def export_tasks(
+        self, fp: TextIO, format: str = "jsonl", status: str = "all"
+    ) -> int:
+        """
+        Stream tasks to a file as JSON Lines or CSV.
+
+        Args:
+            fp: Text stream to write to (open CSV files with newline="")
+            format: "jsonl" or "csv"
+            status: Filter by status - "all", "pending", or "completed"
+
+        Returns:
+            Number of tasks written
+
+        Raises:
+            ValueError: If format or status is not valid
+        """
+        validate_format(format)
+        self._validate_status(status)
+        return write_records(fp, self._iter_status(status), format)
+
+    def close(self) -> None:
+        """Flush and close the storage backend, if any."""
+        if self._storage is not None:
+            self._storage.close()
+
+    def _require(self, task_id: int) -> Task:
+        """
+        Return the task with the given ID or raise.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        task = self.tasks.get(task_id)
+        if task is None:
             raise TaskNotFoundException(f"Task with ID {task_id} not found")
+        return task
+
+    def _collect(
+        self, task_ids: Iterable[int], atomic: bool
+    ) -> tuple[list[Task], BulkReport]:
+        """
+        Look up the tasks for a bulk operation.
+
+        Returns:
+            The existing tasks (none if atomic and any ID is missing) and a
+            report listing them as succeeded and missing IDs as errors
+        """
+        report = BulkReport()
+        found: list[Task] = []
+        tasks = self.tasks
+        for task_id in dict.fromkeys(task_ids):
+            task = tasks.get(task_id)
+            if task is None:
+                report.errors.append((task_id, f"Task with ID {task_id} not found"))
+            else:
+                found.append(task)
+
+        if atomic and report.errors:
+            return [], report
+        report.succeeded = [task.id for task in found]
+        return found, report
+
+    @staticmethod
+    def _validate_update(
+        task: Task, title: Optional[str], description: Optional[str]
+    ) -> tuple[str, str]:
+        """
+        Validate an update and return the resulting (title, description).
+
+        Raises:
+            InvalidTaskDataError: If new data violates constraints
+        """
+        new_title = task.title
+        if title is not None:
+            # Create a temporary task to validate the new title
+            # This leverages Task.__post_init__ validation
+            new_title = Task(id=task.id, title=title).title
+
+        new_description = task.description
+        if description is not None:
+            # Validate description length
+            if len(description) > 1000:
+                raise InvalidTaskDataError(
+                    "Description must be at most 1000 characters "
+                    f"(got {len(description)})"
+                )
+            new_description = description
+
+        return new_title, new_description
+
+    @staticmethod
+    def _validate_status(status: str) -> None:
+        """
+        Check that status is a valid list filter.
+
+        Raises:
+            ValueError: If status is not one of the valid options
+        """
+        if status not in VALID_STATUSES:
+            raise ValueError(
+                f"Invalid status '{status}'. "
+                f"Must be one of: {', '.join(VALID_STATUSES)}"
+            )
+
+    @staticmethod
+    def _validate_sort(sort: str) -> None:
+        """
+        Check that sort is a valid list order.
+
+        Raises:
+            ValueError: If sort is not one of the valid options
+        """
+        if sort not in VALID_SORTS:
+            raise ValueError(
+                f"Invalid sort '{sort}'. Must be one of: {', '.join(VALID_SORTS)}"
+            )
+
+    @staticmethod
+    def _status_of(task: Task) -> str:
+        """Return the index status name for a task."""
+        return "completed" if task.completed else "pending"
+
+    def _iter_status(
+        self, status: str, after_id: Optional[int] = None
+    ) -> Iterator[Task]:
+        """Lazily yield tasks matching a (validated) status in ID order."""
+        tasks = self.tasks
+        while True:
+            page = self._page_ids(status, after_id, ITER_PAGE_SIZE)
+            for task_id in page:
+                # The manager may have changed since the page was fetched
+                task = tasks.get(task_id)
+                if task is not None and status in ("all", self._status_of(task)):
+                    yield task
+            if len(page) < ITER_PAGE_SIZE:
+                return
+            after_id = page[-1]
+
+    def _page_ids(
+        self, status: str, after_id: Optional[int], limit: int
+    ) -> list[int]:
+        """Return up to limit task IDs with the status, after after_id."""
+        if status == "all":
+            # Both status indexes are sorted, so merge them by ID
+            ids: Iterator[int] = heapq.merge(
+                *(
+                    index.irange(minimum=after_id, inclusive=(False, True))
+                    for index in self._status_ids.values()
+                )
+            )
+        else:
+            ids = self._status_ids[status].irange(
+                minimum=after_id, inclusive=(False, True)
+            )
+        return list(islice(ids, limit))
+
+    def _sort_index(self, field: str) -> SortedIndex:
+        """Return the sorted index for a field, building it on first use."""
+        index = self._sort_indexes.get(field)
+        if index is None:
+            index = self._sort_indexes[field] = SortedIndex(
+                _sort_key(field, task) for task in self.tasks.values()
+            )
+        return index
+
+    def _iter_sorted(
+        self,
+        status: str,
+        sort: str,
+        after_id: Optional[int],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+    ) -> Iterator[Task]:
+        """Yield tasks matching a (validated) status in a (validated) order."""
+        field, reverse = sort.lstrip("-"), sort.startswith("-")
+        after: Optional[tuple[Any, ...]] = None
+        if after_id is not None and field == "id":
+            after = (after_id,)
+        elif after_id is not None:
+            # Other keys are read from the last task of the previous page
+            after = _sort_key(field, self._require(after_id))
+
+        # Bounds compare below/above every (micros, id) key in the range
+        lower = None if created_from is None else (to_epoch_micros(created_from),)
+        upper = None if created_to is None else (to_epoch_micros(created_to),)
+
+        keys: Iterable[tuple[Any, ...]]
+        if field == "created" or (lower is None and upper is None):
+            if after is not None:
+                if reverse:
+                    upper = after if upper is None else min(upper, after)
+                else:
+                    lower = after if lower is None else max(lower, after)
+            keys = self._sort_index(field).irange(
+                lower, upper, inclusive=(False, False), reverse=reverse
+            )
+        else:
+            # Another order within a creation range: sort the range
+            in_range = self._sort_index("created").irange(
+                lower, upper, inclusive=(False, False)
+            )
+            keys = sorted(
+                (_sort_key(field, self.tasks[key[-1]]) for key in in_range),
+                reverse=reverse,
+            )
+            if after is not None:
+                keys = [
+                    key for key in keys if (key < after if reverse else key > after)
+                ]
+
+        tasks = self.tasks
+        for key in keys:
+            task = tasks[key[-1]]
+            if status == "all" or self._status_of(task) == status:
+                yield task
+
+    def _select_top_k(
+        self, k: int, field: str, status: str, reverse: bool
+    ) -> list[Task]:
+        """Select the first k tasks with a (validated) status with a heap."""
+        tasks = self.tasks
+        # IDs roughly follow creation order; feeding the heap the best
+        # candidates first lets it reject most of the rest in one comparison
+        ids = tasks if status == "all" else self._status_ids[status]
+        candidates = [tasks[task_id] for task_id in (reversed(ids) if reverse else ids)]
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        if field == "created":
+            try:
+                # Comparing datetimes directly is ~4x cheaper than sort keys;
+                # it fails only when naive and aware datetimes are mixed
+                return select(k, candidates, key=attrgetter("created_at", "id"))
+            except TypeError:
+                pass
+        return select(k, candidates, key=partial(_sort_key, field))
+
+    def _insert(self, task: Task) -> None:
+        """Store a task and add it to the status and sort indexes."""
+        self.tasks[task.id] = task
+        self._status_ids[self._status_of(task)].add(task.id)
+        self._created_per_day[task.created_at.date()] += 1
+        for field, index in self._sort_indexes.items():
+            index.add(_sort_key(field, task))
+        if self._search_index is not None:
+            self._search_index.add(task)
+
+    def _remove(self, task_id: int) -> Task:
+        """Remove a task and drop it from the status and sort indexes."""
+        task = self.tasks.pop(task_id)
+        self._status_ids[self._status_of(task)].discard(task_id)
+        for field, index in self._sort_indexes.items():
+            index.discard(_sort_key(field, task))
+
+        day = task.created_at.date()
+        self._created_per_day[day] -= 1
+        if not self._created_per_day[day]:
+            del self._created_per_day[day]
+        if self._search_index is not None:
+            self._search_index.remove(task_id)
+        return task
+
+    def _set_fields(self, task: Task, title: str, description: str) -> None:
+        """Set a task's (already validated) title and description."""
+        index = self._sort_indexes.get("title")
+        if index is not None and title != task.title:
+            index.discard(_sort_key("title", task))
+            index.add((title.casefold(), task.id))
+        task.title = title
+        task.description = description
+        if self._search_index is not None:
+            self._search_index.add(task)
+
+    def _set_completed(self, task: Task, completed: bool) -> None:
+        """Set a task's completion status, moving it between status indexes."""
+        if task.completed == completed:
+            return
+        self._status_ids[self._status_of(task)].discard(task.id)
+        task.completed = completed
+        self._status_ids[self._status_of(task)].add(task.id)
+
+    def _track(self, op: str, task: Task) -> None:
+        """Emit a change event and stamp the task (or its tombstone) with it."""
+        version = self.changes.emit(op, task)
+        task_id = task.id
+        if op == "delete":
+            self._versions.pop(task_id, None)
+            self._tombstones[task_id] = version
+            if len(self._tombstones) > TOMBSTONE_RETENTION:
+                oldest = next(iter(self._tombstones))
+                self._tombstone_floor = self._tombstones.pop(oldest)
+            return
+        # Re-inserting keeps the dictionary ordered by version
+        self._versions.pop(task_id, None)
+        self._versions[task_id] = version
+
+    def _log(self, op: str, task: Task) -> None:
+        """Append a mutation record to storage, then track the change."""
+        if self._storage is not None:
+            self._storage.append(_mutation_record(op, task))
+        self._track(op, task)
+        self._maybe_compact()
+
+    def _log_many(self, op: str, tasks: list[Task]) -> None:
+        """Append the records of a batch to storage, then track each change."""
+        if self._storage is not None and tasks:
+            self._storage.append_many(_mutation_record(op, task) for task in tasks)
+        for task in tasks:
+            self._track(op, task)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Rewrite storage from a snapshot if its journal has grown too long."""
+        if self._storage is not None and self._storage.needs_compaction():
+            self._storage.compact(self._snapshot_records())
+
+    def _commit(self, transaction: Transaction) -> None:
+        """
+        Apply a transaction's final task states and journal them atomically.
+
+        Tasks the transaction changed but another caller deleted meanwhile
+        stay deleted. Added tasks get their IDs here, after any tasks added
+        outside the transaction since it started.
+
+        Raises:
+            TransactionConflictError: If an ID for an added task is already
+                in use (nothing is applied)
+        """
+        tasks = self.tasks
+        final_ids = {
+            pending_id: self._next_id + i
+            for i, pending_id in enumerate(sorted(transaction.added))
+        }
+        taken = [task_id for task_id in final_ids.values() if task_id in tasks]
+        if taken:
+            raise TransactionConflictError(
+                f"Cannot add tasks with IDs already in use: {taken}"
+            )
+        # IDs of tasks added and deleted in the transaction stay consumed
+        self._next_id += len(final_ids)
+
+        changed: list[tuple[str, Task]] = []
+        for task_id, final in transaction.changes.items():
+            if task_id in final_ids:
+                if final is not None:
+                    final.id = final_ids[task_id]
+                    self._insert(final)
+                    changed.append(("add", final))
+                continue
+            task = tasks.get(task_id)
+            if final is None:
+                if task is not None:
+                    self._remove(task_id)
+                    changed.append(("delete", task))
+            elif task is not None:
+                if (task.title, task.description) != (final.title, final.description):
+                    self._set_fields(task, final.title, final.description)
+                    changed.append(("update", task))
+                if task.completed != final.completed:
+                    self._set_completed(task, final.completed)
+                    changed.append(("toggle", task))
+
+        if self._storage is not None:
+            # One record, so a crash mid-write can never replay half a
+            # transaction
+            records = [_mutation_record(op, task) for op, task in changed]
+            self._storage.append(
+                {"op": "batch", "records": records, "next_id": self._next_id}
+            )
+        for op, task in changed:
+            self._track(op, task)
+        self._maybe_compact()
+
+    def _snapshot_records(self) -> Iterator[dict[str, Any]]:
+        """Yield records that rebuild the current state from scratch."""
+        for task in self.tasks.values():
+            yield {"op": "add", "task": task.to_dict()}
+        yield {"op": "next_id", "value": self._next_id}
+        yield {"op": "version", "value": self.version}
+
+    def _apply_record(self, record: dict[str, Any], version: int) -> int:
+        """
+        Apply one stored record during replay.
+
+        Replay is idempotent: re-adding an existing ID replaces the task and
+        records for missing tasks are ignored. Every mutation record stands
+        for one change event, so counting them restores the version; a
+        snapshot ends with the version it was taken at.
+
+        Args:
+            record: Stored record
+            version: Version before the record
+
+        Returns:
+            Version after the record
+
+        Raises:
+            StorageError: If the record has an unknown op
+            KeyError: If a required record field is missing
+        """
+        op = record.get("op")
+        if op == "batch":
+            for sub_record in record["records"]:
+                version = self._apply_record(sub_record, version)
+            self._next_id = max(self._next_id, int(record["next_id"]))
+            return version
+        if op == "version":
+            return int(record["value"])
+        if op == "next_id":
+            self._next_id = max(self._next_id, int(record["value"]))
+            return version
+        if op == "add":
+            task = Task.from_dict(record["task"])
+            if task.id in self.tasks:
+                self._remove(task.id)
+            self._insert(task)
+            self._next_id = max(self._next_id, task.id + 1)
+        elif op not in ("update", "complete", "incomplete", "toggle", "delete"):
+            raise StorageError(f"Unknown journal operation: {op!r}")
+        elif record["id"] in self.tasks:
+            task = self.tasks[record["id"]]
+            if op == "update":
+                self._set_fields(task, record["title"], record["description"])
+            elif op == "delete":
+                self._remove(task.id)
+            elif op == "toggle":
+                self._set_completed(task, record["completed"])
+            else:
+                self._set_completed(task, op == "complete")
+        return version + 1
+
+
+def _sort_key(field: str, task: Task) -> tuple[Any, ...]:
+    """
+    Return a task's sort key for a field ("id", "created" or "title").
+
+    Keys end with the task ID, which breaks ties. Creation times are keyed
+    by epoch microseconds, so naive (local) and timezone-aware datetimes
+    from imports compare without errors.
+    """
+    if field == "created":
+        return (to_epoch_micros(task.created_at), task.id)
+    if field == "title":
+        return (task.title.casefold(), task.id)
+    return (task.id,)
+
+
+def _sort_fields(
+    sort: str, created_from: Optional[datetime], created_to: Optional[datetime]
+) -> set[str]:
+    """Return the fields whose sorted indexes a listing reads."""
+    fields = {sort.lstrip("-")} - {"id"}
+    if created_from is not None or created_to is not None:
+        fields.add("created")
+    return fields
+
+
+def _newer_than(versions: dict[int, int], since: int) -> list[int]:
+    """
+    Return the task IDs stamped after a version, oldest first.
+
+    versions is ordered by version, so only the newer entries are visited.
+    """
+    newer = []
+    for task_id in reversed(versions):
+        if versions[task_id] <= since:
+            break
+        newer.append(task_id)
+    newer.reverse()
+    return newer
+
 
-        task = self.tasks[task_id]
-        task.completed = not task.completed
+def _mutation_record(op: str, task: Task) -> dict[str, Any]:
+    """Build the storage record for a mutation of task."""
+    if op == "add":
+        return {"op": op, "task": task.to_dict()}
+    if op == "update":
+        return {
+            "op": op,
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+        }
+    if op == "toggle":
+        # Record the resulting state so replay is idempotent
+        return {"op": op, "id": task.id, "completed": task.completed}
+    return {"op": op, "id": task.id}
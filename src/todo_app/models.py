@@ -4,18 +4,51 @@ Task model for the todo application.
 This module defines the Task data structure representing a single todo item.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
 
 from todo_app.exceptions import InvalidTaskDataError
 
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
 
-@dataclass
+
+def to_epoch_micros(value: datetime) -> int:
+    """
+    Convert a naive local datetime to integer microseconds since the epoch.
+
+    Timezone-aware values are first converted to naive local time.
+
+    Examples:
+        >>> to_epoch_micros(datetime(1970, 1, 1, 0, 0, 1))
+        1000000
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(value: int) -> datetime:
+    """
+    Convert microseconds since the epoch back to a naive local datetime.
+
+    Examples:
+        >>> from_epoch_micros(1000000)
+        datetime.datetime(1970, 1, 1, 0, 0, 1)
+    """
+    return _EPOCH + timedelta(microseconds=value)
+
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a single todo task.
 
+    The class uses __slots__, so instances carry no per-object __dict__;
+    this keeps memory per task low when managing millions of tasks.
+
     Attributes:
         id: Unique task identifier (positive integer)
         title: Task title (1-200 characters, required)
@@ -81,6 +114,62 @@ class Task:
         if self.description is None:
             self.description = ""
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return a JSON-serializable dictionary of the task's fields.
+
+        Returns:
+            Dictionary with id, title, description, completed and
+            created_at (ISO 8601 string)
+
+        Examples:
+            >>> task = Task(id=1, title="Test")
+            >>> task.to_dict()["title"]
+            'Test'
+        """
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "completed": self.completed,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Task":
+        """
+        Create a task from a dictionary produced by to_dict().
+
+        Args:
+            data: Dictionary with at least id and title
+
+        Returns:
+            The validated Task object
+
+        Raises:
+            InvalidTaskDataError: If fields are missing or fail validation
+
+        Examples:
+            >>> Task.from_dict({"id": 1, "title": "Test"}).title
+            'Test'
+        """
+        try:
+            task_id = int(data["id"])
+            created_at = data.get("created_at")
+            return cls(
+                id=task_id,
+                title=data["title"],
+                description=data.get("description") or "",
+                completed=bool(data.get("completed", False)),
+                created_at=(
+                    datetime.fromisoformat(created_at)
+                    if created_at
+                    else datetime.now()
+                ),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidTaskDataError(f"Invalid task data: {e}") from e
+
     def __repr__(self) -> str:
         """
         Return detailed string representation of the task.
@@ -113,3 +202,97 @@ class Task:
         """
         status = "✓" if self.completed else "☐"
         return f"[{self.id}] {status} {self.title}"
+
+
+@dataclass(frozen=True)
+class TaskStats:
+    """
+    Aggregate task counters maintained by TodoManager.
+
+    Attributes:
+        total: Number of tasks
+        completed: Number of completed tasks
+        pending: Number of pending tasks
+        created_per_day: Read-only mapping of creation date to number of
+            existing tasks created that day (a live view, not a copy)
+
+    Examples:
+        >>> stats = TaskStats(total=3, completed=1, pending=2, created_per_day={})
+        >>> stats.pending
+        2
+    """
+
+    total: int
+    completed: int
+    pending: int
+    created_per_day: Mapping[date, int]
+
+
+@dataclass
+class ImportReport:
+    """
+    Result of a bulk import.
+
+    Attributes:
+        imported: Number of tasks added
+        errors: (row number, message) for each rejected row, 1-based
+
+    Examples:
+        >>> report = ImportReport(imported=2, errors=[(3, "Title cannot be empty")])
+        >>> report.ok
+        False
+    """
+
+    imported: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every row was imported."""
+        return not self.errors
+
+
+@dataclass
+class BulkReport:
+    """
+    Result of a bulk mutation.
+
+    Attributes:
+        succeeded: IDs of the tasks changed, in request order
+        errors: (task ID, message) for each rejected ID; in an atomic batch
+            any error means nothing was changed
+
+    Examples:
+        >>> report = BulkReport(succeeded=[1], errors=[(9, "Task with ID 9 not found")])
+        >>> report.ok
+        False
+    """
+
+    succeeded: list[int] = field(default_factory=list)
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every requested ID was changed."""
+        return not self.errors
+
+
+@dataclass
+class TaskDelta:
+    """
+    Changes since a manager version, for incremental sync.
+
+    Attributes:
+        version: Manager version the delta brings the caller up to
+        changed: Tasks added or modified since, in the order they last changed
+        deleted: IDs of tasks deleted since, in deletion order
+
+    Examples:
+        >>> delta = TaskDelta(version=7, deleted=[3])
+        >>> (delta.version, delta.changed, delta.deleted)
+        (7, [], [3])
+    """
+
+    version: int
+    changed: list[Task] = field(default_factory=list)
+    deleted: list[int] = field(default_factory=list)
@@ -0,0 +1,165 @@
+"""
+Buffered rendering of task listings.
+
+This module formats tasks into strings and writes them CHUNK_SIZE tasks at
+a time with one write() call per chunk, instead of several print() calls
+per task. Besides the decorated console style it offers JSON and TSV output
+for scripts, without emoji or headers.
+"""
+
+import json
+import re
+from collections.abc import Callable, Iterable
+from itertools import islice
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    from todo_app.models import Task
+
+RENDER_FORMATS = ("text", "json", "tsv")
+
+# Tasks formatted into one buffer before it is written
+CHUNK_SIZE = 1000
+
+TSV_FIELDS = ("id", "completed", "title", "description", "created_at")
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_TSV_SPECIAL = re.compile(r"[\\\t\n\r]")
+
+# Reused encoder (json.dumps with options builds a new one per call)
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def format_task_line(task: "Task") -> str:
+    """
+    Format a task as a listing entry (ID, checkbox, title, description).
+
+    Examples:
+        >>> from todo_app.models import Task
+        >>> format_task_line(Task(id=1, title="Buy milk", description="2 l"))
+        '[1] ☐ Buy milk\\n    2 l\\n'
+    """
+    status = "✓" if task.completed else "☐"
+    if task.description:
+        return f"[{task.id}] {status} {task.title}\n    {task.description}\n"
+    return f"[{task.id}] {status} {task.title}\n"
+
+
+def format_task_detail(task: "Task") -> str:
+    """
+    Format a task as a detail block with an explicit status line.
+
+    Examples:
+        >>> from todo_app.models import Task
+        >>> print(format_task_detail(Task(id=1, title="Buy milk")), end="")
+        [1] ☐ Buy milk
+            Status: Pending
+    """
+    status = "✓" if task.completed else "☐"
+    description = (
+        f"    Description: {task.description}\n" if task.description else ""
+    )
+    state = "Completed" if task.completed else "Pending"
+    return f"[{task.id}] {status} {task.title}\n{description}    Status: {state}\n"
+
+
+def format_tsv_row(task: "Task") -> str:
+    """
+    Format a task as one tab-separated line (fields as in TSV_FIELDS).
+
+    Backslashes, tabs and line breaks inside fields are backslash-escaped,
+    so every task is exactly one line.
+    """
+    return (
+        f"{task.id}\t{'true' if task.completed else 'false'}\t"
+        f"{_tsv_field(task.title)}\t{_tsv_field(task.description)}\t"
+        f"{task.created_at.isoformat()}\n"
+    )
+
+
+def write_chunked(
+    fp: TextIO, parts: Iterable[str], chunk_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Write strings to a stream, joining chunk_size of them per write() call.
+
+    Args:
+        fp: Text stream to write to
+        parts: Strings to write, consumed lazily
+        chunk_size: Strings joined into each write
+
+    Returns:
+        Number of strings written
+    """
+    parts = iter(parts)
+    count = 0
+    while chunk := list(islice(parts, chunk_size)):
+        fp.write("".join(chunk))
+        count += len(chunk)
+    return count
+
+
+def render_tasks(
+    tasks: Iterable["Task"],
+    fp: TextIO,
+    format: str = "text",
+    formatter: Callable[["Task"], str] = format_task_line,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """
+    Write tasks to a stream in large blocks.
+
+    Formats:
+        text: formatter(task) per task (default: format_task_line)
+        json: one JSON array of task objects (as in Task.to_dict)
+        tsv:  a header line, then format_tsv_row(task) per task
+
+    Args:
+        fp: Text stream to write to
+        tasks: Tasks to write, consumed lazily
+        format: "text", "json" or "tsv"
+        formatter: Per-task formatter used by the text format
+        chunk_size: Tasks formatted per write() call
+
+    Returns:
+        Number of tasks written
+
+    Raises:
+        ValueError: If format is not supported
+    """
+    if format not in RENDER_FORMATS:
+        raise ValueError(
+            f"Invalid format '{format}'. Must be one of: {', '.join(RENDER_FORMATS)}"
+        )
+
+    if format == "json":
+        return _write_json(fp, tasks, chunk_size)
+    if format == "tsv":
+        fp.write("\t".join(TSV_FIELDS) + "\n")
+        formatter = format_tsv_row
+    return write_chunked(fp, map(formatter, tasks), chunk_size)
+
+
+def _write_json(fp: TextIO, tasks: Iterable["Task"], chunk_size: int) -> int:
+    """
+    Write tasks as one JSON array, encoding chunk_size tasks per call.
+
+    Encoding a list in one call avoids the encoder's per-call setup, which
+    costs more than encoding a small task object.
+    """
+    tasks = iter(tasks)
+    count = 0
+    separator = "["
+    while chunk := [task.to_dict() for task in islice(tasks, chunk_size)]:
+        fp.write(separator + _JSON_ENCODER.encode(chunk)[1:-1])
+        separator = ", "
+        count += len(chunk)
+    fp.write("]\n" if count else "[]\n")
+    return count
+
+
+def _tsv_field(text: str) -> str:
+    """Escape a TSV field (most fields need no escaping, so check first)."""
+    if _TSV_SPECIAL.search(text) is None:
+        return text
+    return text.translate(_TSV_ESCAPES)
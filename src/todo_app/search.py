@@ -0,0 +1,174 @@
+"""
+Full-text search for the todo application.
+
+This module provides an inverted index over task titles and descriptions
+with Unicode-aware tokenization, prefix matching and relevance ranking.
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterator
+from itertools import takewhile
+from typing import Optional
+
+from todo_app.indexes import SortedIndex
+from todo_app.models import Task
+
+# Relative weight of a term occurring in the title vs. the description
+TITLE_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+# Score multiplier for a query token that only matches a term's prefix
+PREFIX_FACTOR = 0.5
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into normalized search tokens.
+
+    Text is NFKC-normalized and case-folded, then split on runs of Unicode
+    word characters, so "Café", "CAFÉ" and "café" produce the same token.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in order of appearance
+
+    Examples:
+        >>> tokenize("Buy MILK, eggs & 日本語")
+        ['buy', 'milk', 'eggs', '日本語']
+    """
+    return _TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+class SearchIndex:
+    """
+    Inverted index from terms to weighted task IDs.
+
+    Attributes:
+        postings: Term -> {task ID: weight}
+        terms: Sorted vocabulary used for prefix lookups
+
+    Examples:
+        >>> index = SearchIndex()
+        >>> index.add(Task(id=1, title="Buy groceries"))
+        >>> index.search("groc")
+        [1]
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.postings: dict[str, dict[int, float]] = {}
+        self.terms = SortedIndex()
+        self._doc_terms: dict[int, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._doc_terms)
+
+    def add(self, task: Task) -> None:
+        """
+        Index a task's title and description (replacing any previous entry).
+
+        Args:
+            task: Task to index
+        """
+        self.remove(task.id)
+
+        weights: dict[str, float] = defaultdict(float)
+        for term in tokenize(task.title):
+            weights[term] += TITLE_WEIGHT
+        for term in tokenize(task.description):
+            weights[term] += DESCRIPTION_WEIGHT
+
+        for term, weight in weights.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = {}
+                self.terms.add(term)
+            posting[task.id] = weight
+        self._doc_terms[task.id] = tuple(weights)
+
+    def remove(self, task_id: int) -> None:
+        """
+        Remove a task from the index if present.
+
+        Args:
+            task_id: ID of the task to remove
+        """
+        for term in self._doc_terms.pop(task_id, ()):
+            posting = self.postings[term]
+            del posting[task_id]
+            if not posting:
+                del self.postings[term]
+                self.terms.discard(term)
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[int]:
+        """
+        Return IDs of tasks matching every query token, best match first.
+
+        Each query token matches terms equal to it or starting with it
+        (prefix matches score lower). Scores use term weights scaled by
+        inverse document frequency; ties are broken by ascending task ID.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of IDs to return (None for all)
+
+        Returns:
+            Matching task IDs ordered by descending relevance
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        scores: Optional[dict[int, float]] = None
+        for token in dict.fromkeys(tokens):
+            token_scores = self._score_token(token)
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    task_id: score + token_scores[task_id]
+                    for task_id, score in scores.items()
+                    if task_id in token_scores
+                }
+            if not scores:
+                return []
+
+        assert scores is not None
+        if limit is not None:
+            best = heapq.nsmallest(limit, scores.items(), key=_rank_key)
+        else:
+            best = sorted(scores.items(), key=_rank_key)
+        return [task_id for task_id, _ in best]
+
+    def _score_token(self, token: str) -> dict[int, float]:
+        """Score every task containing a term equal to or prefixed by token."""
+        scores: dict[int, float] = defaultdict(float)
+        total = len(self._doc_terms)
+        for term in self._terms_with_prefix(token):
+            posting = self.postings[term]
+            factor = 1.0 if term == token else PREFIX_FACTOR
+            idf = math.log(1 + total / len(posting))
+            for task_id, weight in posting.items():
+                scores[task_id] += weight * factor * idf
+        return scores
+
+    def _terms_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield vocabulary terms starting with prefix."""
+        return takewhile(
+            lambda term: term.startswith(prefix), self.terms.irange(minimum=prefix)
+        )
+
+
+def _rank_key(item: tuple[int, float]) -> tuple[float, int]:
+    """Sort key ordering (task ID, score) pairs by score desc, then ID."""
+    task_id, score = item
+    return (-score, task_id)
@@ -0,0 +1,160 @@
+"""
+Streaming import/export formats for the todo application.
+
+This module reads and writes tasks as JSON Lines or CSV one record at a time,
+so arbitrarily large files can be processed in flat memory.
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime
+from typing import Any, TextIO
+
+from todo_app.exceptions import InvalidTaskDataError
+from todo_app.models import Task
+
+FORMATS = ("jsonl", "csv")
+CSV_FIELDS = ("id", "title", "description", "completed", "created_at")
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y"})
+_FALSE_STRINGS = frozenset({"", "0", "false", "no", "n"})
+
+
+def validate_format(format: str) -> None:
+    """
+    Check that format is a supported import/export format.
+
+    Raises:
+        ValueError: If format is not "jsonl" or "csv"
+    """
+    if format not in FORMATS:
+        raise ValueError(
+            f"Invalid format '{format}'. Must be one of: {', '.join(FORMATS)}"
+        )
+
+
+def read_records(fp: TextIO, format: str = "jsonl") -> Iterator[Mapping[str, Any]]:
+    """
+    Lazily read task records from a JSON Lines or CSV stream.
+
+    Malformed JSON lines are yielded as a mapping carrying only the parse
+    error, so the importer can report them per row without stopping.
+
+    Args:
+        fp: Text stream to read from
+        format: "jsonl" or "csv"
+
+    Returns:
+        Iterator over one mapping per row
+
+    Raises:
+        ValueError: If format is not supported
+    """
+    validate_format(format)
+    if format == "csv":
+        return iter(csv.DictReader(fp))
+    return _read_jsonl(fp)
+
+
+def write_records(fp: TextIO, tasks: Iterable[Task], format: str = "jsonl") -> int:
+    """
+    Write tasks to a stream as JSON Lines or CSV.
+
+    Args:
+        fp: Text stream to write to (open CSV files with newline="")
+        tasks: Tasks to write; consumed lazily
+        format: "jsonl" or "csv"
+
+    Returns:
+        Number of tasks written
+
+    Raises:
+        ValueError: If format is not supported
+    """
+    validate_format(format)
+    count = 0
+    if format == "csv":
+        writer = csv.DictWriter(fp, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for task in tasks:
+            writer.writerow(task.to_dict())
+            count += 1
+        return count
+
+    for task in tasks:
+        fp.write(json.dumps(task.to_dict(), ensure_ascii=False))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def record_to_task(record: Mapping[str, Any], task_id: int) -> Task:
+    """
+    Build a validated Task from an imported record.
+
+    The record's own "id" (if any) is ignored; task_id is used instead.
+
+    Args:
+        record: Mapping with "title" and optional "description",
+            "completed" and "created_at" (ISO 8601) keys
+        task_id: ID to assign to the task
+
+    Returns:
+        The validated Task object
+
+    Raises:
+        InvalidTaskDataError: If the record is malformed or fails validation
+    """
+    if "_error" in record:
+        raise InvalidTaskDataError(record["_error"])
+
+    title = record.get("title")
+    description = record.get("description") or ""
+    if not isinstance(title, str) or not isinstance(description, str):
+        raise InvalidTaskDataError("Title and description must be strings")
+
+    return Task(
+        id=task_id,
+        title=title,
+        description=description,
+        completed=_parse_bool(record.get("completed")),
+        created_at=_parse_datetime(record.get("created_at")),
+    )
+
+
+def _read_jsonl(fp: TextIO) -> Iterator[Mapping[str, Any]]:
+    """Yield one mapping per non-blank JSON line."""
+    for line in fp:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {"_error": f"Invalid JSON: {e}"}
+            continue
+        if not isinstance(record, dict):
+            record = {"_error": "Expected a JSON object"}
+        yield record
+
+
+def _parse_bool(value: Any) -> bool:
+    """Parse a completed flag from JSON (bool) or CSV (string)."""
+    if value is None or isinstance(value, bool):
+        return bool(value)
+    text = str(value).strip().lower()
+    if text in _TRUE_STRINGS:
+        return True
+    if text in _FALSE_STRINGS:
+        return False
+    raise InvalidTaskDataError(f"Invalid completed value: {value!r}")
+
+
+def _parse_datetime(value: Any) -> datetime:
+    """Parse an optional ISO 8601 created_at value."""
+    if not value:
+        return datetime.now()
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError as e:
+        raise InvalidTaskDataError(f"Invalid created_at value: {value!r}") from e
@@ -0,0 +1,580 @@
+"""
+SQLite-backed task manager for the todo application.
+
+This module provides SqliteTodoManager, a drop-in replacement for
+TodoManager that stores tasks in an SQLite database so datasets can grow far
+beyond available memory while the CLI and UI code stay unchanged.
+"""
+
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Optional
+
+from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
+from todo_app.manager import ITER_PAGE_SIZE, TodoManager
+from todo_app.models import (
+    BulkReport,
+    Task,
+    TaskStats,
+    from_epoch_micros,
+    to_epoch_micros,
+)
+
+# Prepared statements are cached per connection by the sqlite3 module
+STATEMENT_CACHE_SIZE = 128
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    completed INTEGER NOT NULL DEFAULT 0,
+    created_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO counters (name, value) VALUES ('total', 0), ('completed', 0);
+
+CREATE TABLE IF NOT EXISTS daily_counts (
+    day TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS tasks_after_insert AFTER INSERT ON tasks BEGIN
+    UPDATE counters SET value = value + 1 WHERE name = 'total';
+    UPDATE counters SET value = value + NEW.completed WHERE name = 'completed';
+    INSERT INTO daily_counts (day, count)
+        VALUES (date(NEW.created_at / 1000000, 'unixepoch'), 1)
+        ON CONFLICT (day) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tasks_after_delete AFTER DELETE ON tasks BEGIN
+    UPDATE counters SET value = value - 1 WHERE name = 'total';
+    UPDATE counters SET value = value - OLD.completed WHERE name = 'completed';
+    UPDATE daily_counts SET count = count - 1
+        WHERE day = date(OLD.created_at / 1000000, 'unixepoch');
+    DELETE FROM daily_counts
+        WHERE day = date(OLD.created_at / 1000000, 'unixepoch') AND count = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tasks_after_update_completed
+AFTER UPDATE OF completed ON tasks BEGIN
+    UPDATE counters SET value = value + NEW.completed - OLD.completed
+        WHERE name = 'completed';
+END;
+"""
+
+_COLUMNS = "id, title, description, completed, created_at"
+SQL_INSERT = (
+    "INSERT INTO tasks (title, description, completed, created_at) "
+    "VALUES (?, ?, ?, ?)"
+)
+SQL_SELECT_ONE = f"SELECT {_COLUMNS} FROM tasks WHERE id = ?"
+SQL_SELECT_ALL = f"SELECT {_COLUMNS} FROM tasks ORDER BY id"
+SQL_SELECT_BY_STATUS = f"SELECT {_COLUMNS} FROM tasks WHERE completed = ? ORDER BY id"
+SQL_SELECT_PAGE = f"SELECT {_COLUMNS} FROM tasks WHERE id > ? ORDER BY id LIMIT ?"
+SQL_SELECT_PAGE_BY_STATUS = (
+    f"SELECT {_COLUMNS} FROM tasks WHERE completed = ? AND id > ? ORDER BY id LIMIT ?"
+)
+SQL_COUNTERS = "SELECT name, value FROM counters"
+SQL_DAILY_COUNTS = "SELECT day, count FROM daily_counts"
+SQL_UPDATE_FIELDS = "UPDATE tasks SET title = ?, description = ? WHERE id = ?"
+SQL_SET_COMPLETED = "UPDATE tasks SET completed = ? WHERE id = ?"
+SQL_TOGGLE = "UPDATE tasks SET completed = 1 - completed WHERE id = ?"
+SQL_DELETE = "DELETE FROM tasks WHERE id = ?"
+
+_STATUS_FLAGS = {"pending": 0, "completed": 1}
+
+# ORDER BY keys per list_tasks() sort field, matching TodoManager's sort keys
+# (titles are compared case-folded by the casefold() SQL function)
+_SORT_KEYS = {
+    "id": ("id",),
+    "created": ("created_at", "id"),
+    "title": ("casefold(title)", "id"),
+}
+
+Row = tuple[int, str, str, int, int]
+
+
+class SqliteTodoManager:
+    """
+    Manages todo tasks stored in an SQLite database.
+
+    Exposes the same public API as TodoManager. The database runs in WAL
+    mode, keeps indexes on completion status and creation time, and maintains
+    the stats() counters with triggers. IDs come from an AUTOINCREMENT
+    column, so deleted IDs are never reused (even across restarts).
+
+    Attributes:
+        path: Database file path (":memory:" for a private in-memory database)
+        blocking: Always True: calls do disk I/O, so AsyncTodoManager runs
+            them on its thread pool
+
+    Examples:
+        >>> manager = SqliteTodoManager(":memory:")
+        >>> task = manager.add_task(title="Buy milk")
+        >>> task.id
+        1
+        >>> len(manager.list_tasks())
+        1
+    """
+
+    blocking = True
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Open (or create) the task database.
+
+        Args:
+            path: Database file path (default: private in-memory database)
+        """
+        self.path = path
+        # Callers such as AsyncTodoManager use the connection from another
+        # thread (one at a time), so the creating-thread check is disabled
+        self._conn = sqlite3.connect(
+            path,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.create_function("casefold", 1, str.casefold, deterministic=True)
+
+    def add_task(self, title: str, description: str = "") -> Task:
+        """
+        Add a new task to the database.
+
+        Args:
+            title: Task title (1-200 characters, required)
+            description: Task description (0-1000 characters, optional)
+
+        Returns:
+            The newly created Task object
+
+        Raises:
+            InvalidTaskDataError: If title/description violate constraints
+        """
+        # Validate with a placeholder ID; the database assigns the real one
+        draft = Task(id=0, title=title, description=description)
+        cursor = self._conn.execute(
+            SQL_INSERT,
+            (
+                draft.title,
+                draft.description,
+                int(draft.completed),
+                to_epoch_micros(draft.created_at),
+            ),
+        )
+        assert cursor.lastrowid is not None
+        draft.id = cursor.lastrowid
+        return draft
+
+    def list_tasks(
+        self,
+        status: str = "all",
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        sort: str = "id",
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> list[Task]:
+        """
+        List tasks with optional status filter, order and creation range.
+
+        Creation order and ranges use the created_at index; title order
+        sorts the matching rows in SQLite.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed"
+            limit: Maximum number of tasks to return (None for all)
+            after_id: Only return tasks after this one in the chosen order;
+                for orders other than "id" the task must still exist
+            sort: "id" (default), "created" (oldest first), "-created"
+                (newest first), "title" (case-insensitive A-Z) or "-title"
+            created_from: Only return tasks created at or after this time
+            created_to: Only return tasks created before this time
+
+        Returns:
+            List of Task objects matching the filter, in the chosen order
+
+        Raises:
+            ValueError: If status or sort is not one of the valid options
+            TaskNotFoundException: If after_id doesn't exist and sort is
+                not "id"
+        """
+        TodoManager._validate_status(status)
+        TodoManager._validate_sort(sort)
+
+        if sort != "id" or created_from is not None or created_to is not None:
+            return self._select_sorted(
+                status, limit, after_id, sort, created_from, created_to
+            )
+        if limit is not None or after_id is not None:
+            # SQLite treats a negative LIMIT as "no limit"
+            return self._page(status, after_id or 0, -1 if limit is None else limit)
+        if status == "all":
+            rows = self._conn.execute(SQL_SELECT_ALL)
+        else:
+            rows = self._conn.execute(SQL_SELECT_BY_STATUS, (_STATUS_FLAGS[status],))
+        return [_row_to_task(row) for row in rows]
+
+    def iter_tasks(
+        self, status: str = "all", after_id: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        Lazily yield tasks with optional status filter, ordered by ID.
+
+        Rows are fetched in keyset pages, so no cursor stays open between
+        items.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed"
+            after_id: Only yield tasks with an ID greater than this
+
+        Returns:
+            Iterator over matching Task objects
+
+        Raises:
+            ValueError: If status is not one of the valid options
+        """
+        TodoManager._validate_status(status)
+        return self._iter_pages(status, after_id or 0)
+
+    def count_tasks(self, status: str = "all") -> int:
+        """
+        Count tasks with optional status filter.
+
+        Args:
+            status: Filter by status - "all", "pending", or "completed"
+
+        Returns:
+            Number of tasks matching the filter
+
+        Raises:
+            ValueError: If status is not one of the valid options
+        """
+        TodoManager._validate_status(status)
+
+        total, completed = self._counters()
+        if status == "all":
+            return total
+        return completed if status == "completed" else total - completed
+
+    def stats(self) -> TaskStats:
+        """
+        Return aggregate task counters maintained by database triggers.
+
+        Returns:
+            TaskStats with total, completed, pending and created-per-day counts
+        """
+        total, completed = self._counters()
+        per_day = {
+            date.fromisoformat(day): count
+            for day, count in self._conn.execute(SQL_DAILY_COUNTS)
+        }
+        return TaskStats(
+            total=total,
+            completed=completed,
+            pending=total - completed,
+            created_per_day=MappingProxyType(per_day),
+        )
+
+    def get_task(self, task_id: int) -> Task:
+        """
+        Get a single task by ID.
+
+        Args:
+            task_id: The ID of the task to retrieve
+
+        Returns:
+            The Task object
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        row = self._conn.execute(SQL_SELECT_ONE, (task_id,)).fetchone()
+        if row is None:
+            raise TaskNotFoundException(f"Task with ID {task_id} not found")
+        return _row_to_task(row)
+
+    def delete_task(self, task_id: int) -> None:
+        """
+        Delete a task by ID.
+
+        Args:
+            task_id: The ID of the task to delete
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self._execute_for(task_id, SQL_DELETE, (task_id,))
+
+    def update_task(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Task:
+        """
+        Update an existing task's title and/or description.
+
+        Args:
+            task_id: The ID of the task to update
+            title: New title (if provided)
+            description: New description (if provided)
+
+        Returns:
+            The updated Task object
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+            InvalidTaskDataError: If new data violates constraints
+        """
+        task = self.get_task(task_id)
+        new_title, new_description = TodoManager._validate_update(
+            task, title, description
+        )
+
+        self._execute_for(
+            task_id, SQL_UPDATE_FIELDS, (new_title, new_description, task_id)
+        )
+        task.title = new_title
+        task.description = new_description
+        return task
+
+    def mark_complete(self, task_id: int) -> None:
+        """
+        Mark a task as complete.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self._execute_for(task_id, SQL_SET_COMPLETED, (1, task_id))
+
+    def mark_incomplete(self, task_id: int) -> None:
+        """
+        Mark a task as incomplete.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self._execute_for(task_id, SQL_SET_COMPLETED, (0, task_id))
+
+    def toggle_complete(self, task_id: int) -> None:
+        """
+        Toggle task completion status.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self._execute_for(task_id, SQL_TOGGLE, (task_id,))
+
+    def bulk_complete(
+        self, task_ids: Iterable[int], atomic: bool = False
+    ) -> BulkReport:
+        """
+        Mark many tasks as complete in one transaction.
+
+        Args:
+            task_ids: IDs of the tasks to complete (duplicates are ignored)
+            atomic: If True, change nothing unless every ID exists
+
+        Returns:
+            BulkReport with the IDs changed and per-ID errors
+        """
+        return self._bulk_write(
+            task_ids, atomic, SQL_SET_COMPLETED, lambda task_id: (1, task_id)
+        )
+
+    def bulk_delete(self, task_ids: Iterable[int], atomic: bool = False) -> BulkReport:
+        """
+        Delete many tasks in one transaction.
+
+        Args:
+            task_ids: IDs of the tasks to delete (duplicates are ignored)
+            atomic: If True, delete nothing unless every ID exists
+
+        Returns:
+            BulkReport with the IDs deleted and per-ID errors
+        """
+        return self._bulk_write(
+            task_ids, atomic, SQL_DELETE, lambda task_id: (task_id,)
+        )
+
+    def bulk_update(
+        self,
+        updates: Mapping[int, Mapping[str, Optional[str]]],
+        atomic: bool = False,
+    ) -> BulkReport:
+        """
+        Update the title and/or description of many tasks in one transaction.
+
+        Every update is validated before any row is written.
+
+        Args:
+            updates: Task ID -> {"title": ..., "description": ...}; missing
+                or None fields are left unchanged
+            atomic: If True, change nothing unless every update is valid
+
+        Returns:
+            BulkReport with the IDs changed and per-ID errors
+        """
+        report = BulkReport()
+        rows: list[tuple[str, str, int]] = []
+        for task_id, fields in updates.items():
+            try:
+                task = self.get_task(task_id)
+                title, description = TodoManager._validate_update(
+                    task, fields.get("title"), fields.get("description")
+                )
+            except (TaskNotFoundException, InvalidTaskDataError) as e:
+                report.errors.append((task_id, str(e)))
+                continue
+            rows.append((title, description, task_id))
+
+        if atomic and report.errors:
+            return report
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(SQL_UPDATE_FIELDS, rows)
+        report.succeeded = [task_id for _, _, task_id in rows]
+        return report
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _iter_pages(self, status: str, after_id: int) -> Iterator[Task]:
+        """Yield tasks page by page using keyset pagination."""
+        while True:
+            page = self._page(status, after_id, ITER_PAGE_SIZE)
+            yield from page
+            if len(page) < ITER_PAGE_SIZE:
+                return
+            after_id = page[-1].id
+
+    def _page(self, status: str, after_id: int, limit: int) -> list[Task]:
+        """Fetch up to limit tasks with the status and an ID above after_id."""
+        if status == "all":
+            rows = self._conn.execute(SQL_SELECT_PAGE, (after_id, limit))
+        else:
+            rows = self._conn.execute(
+                SQL_SELECT_PAGE_BY_STATUS, (_STATUS_FLAGS[status], after_id, limit)
+            )
+        return [_row_to_task(row) for row in rows]
+
+    def _select_sorted(
+        self,
+        status: str,
+        limit: Optional[int],
+        after_id: Optional[int],
+        sort: str,
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+    ) -> list[Task]:
+        """Fetch tasks matching a (validated) status in a (validated) order."""
+        field, reverse = sort.lstrip("-"), sort.startswith("-")
+        keys = _SORT_KEYS[field]
+        conditions: list[str] = []
+        params: list[object] = []
+        if status != "all":
+            conditions.append("completed = ?")
+            params.append(_STATUS_FLAGS[status])
+        if created_from is not None:
+            conditions.append("created_at >= ?")
+            params.append(to_epoch_micros(created_from))
+        if created_to is not None:
+            conditions.append("created_at < ?")
+            params.append(to_epoch_micros(created_to))
+        if after_id is not None:
+            # Keyset pagination: compare (key, id) with the previous page's
+            # last task, read back from the table for orders other than "id"
+            key_list = ", ".join(keys)
+            if field == "id":
+                after: tuple[object, ...] = (after_id,)
+            else:
+                row = self._conn.execute(
+                    f"SELECT {key_list} FROM tasks WHERE id = ?", (after_id,)
+                ).fetchone()
+                if row is None:
+                    raise TaskNotFoundException(f"Task with ID {after_id} not found")
+                after = tuple(row)
+            placeholders = ", ".join("?" * len(keys))
+            operator = "<" if reverse else ">"
+            conditions.append(f"({key_list}) {operator} ({placeholders})")
+            params.extend(after)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        direction = " DESC" if reverse else ""
+        order = ", ".join(key + direction for key in keys)
+        # SQLite treats a negative LIMIT as "no limit"
+        params.append(-1 if limit is None else limit)
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM tasks{where} ORDER BY {order} LIMIT ?", params
+        )
+        return [_row_to_task(row) for row in rows]
+
+    def _counters(self) -> tuple[int, int]:
+        """Return the trigger-maintained (total, completed) counters."""
+        counters = dict(self._conn.execute(SQL_COUNTERS).fetchall())
+        return counters["total"], counters["completed"]
+
+    def _bulk_write(
+        self,
+        task_ids: Iterable[int],
+        atomic: bool,
+        sql: str,
+        params: Callable[[int], tuple[object, ...]],
+    ) -> BulkReport:
+        """
+        Run a single-row write statement per task ID in one transaction.
+
+        Returns:
+            BulkReport listing the IDs that matched a row as succeeded and
+            the others as errors; in atomic mode any error rolls back all
+        """
+        report = BulkReport()
+        with self._conn:
+            self._conn.execute("BEGIN")
+            for task_id in dict.fromkeys(task_ids):
+                if self._conn.execute(sql, params(task_id)).rowcount:
+                    report.succeeded.append(task_id)
+                else:
+                    report.errors.append((task_id, f"Task with ID {task_id} not found"))
+            if atomic and report.errors:
+                self._conn.rollback()
+                report.succeeded = []
+        return report
+
+    def _execute_for(
+        self, task_id: int, sql: str, params: tuple[object, ...]
+    ) -> None:
+        """
+        Run a single-row write statement for task_id.
+
+        Raises:
+            TaskNotFoundException: If no row matched task_id
+        """
+        if self._conn.execute(sql, params).rowcount == 0:
+            raise TaskNotFoundException(f"Task with ID {task_id} not found")
+
+
+def _row_to_task(row: Row) -> Task:
+    """Build a Task from a tasks table row."""
+    task_id, title, description, completed, created_at = row
+    return Task(
+        id=task_id,
+        title=title,
+        description=description,
+        completed=bool(completed),
+        created_at=from_epoch_micros(created_at),
+    )
@@ -0,0 +1,432 @@
+"""
+Server-Sent Events streaming of TodoManager changes.
+
+This module turns a manager's ChangeFeed into text/event-stream output for
+the web API. Each connected client is a generator that remembers only the
+last sequence number it sent and reads everything newer from the feed's
+ring buffer, so clients share one bounded event log and a slow client holds
+no queue of its own: its backlog is written as one coalesced batch when it
+catches up, and a client that falls further behind than the buffer keeps is
+sent a "reset" event and continues from the latest change. Idle clients
+block on one shared condition and use no CPU until a change arrives or a
+keep-alive is due.
+
+stream_changes() serves one client per server thread (the WSGI /events
+endpoint). EventServer serves any number of clients from one asyncio
+thread, for deployments that hold thousands of subscribers.
+"""
+
+import asyncio
+import json
+import threading
+from collections.abc import Callable, Iterator
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from todo_app.changes import ChangeEvent, ChangeFeed
+from todo_app.exceptions import ChangesExpiredError
+
+# Seconds between keep-alive comments on an idle stream; writing them is
+# also how the server notices clients that went away
+KEEPALIVE_INTERVAL = 15.0
+
+# Milliseconds a disconnected EventSource waits before reconnecting
+RETRY_MS = 3000
+
+# Pending connections EventServer lets the OS queue
+EVENT_SERVER_BACKLOG = 2048
+
+_STREAM_HEADERS = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/event-stream; charset=utf-8\r\n"
+    b"Cache-Control: no-cache\r\n"
+    b"X-Accel-Buffering: no\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Connection: close\r\n\r\n"
+)
+_NOT_FOUND = (
+    b"HTTP/1.1 404 Not Found\r\n"
+    b"Content-Length: 0\r\n"
+    b"Connection: close\r\n\r\n"
+)
+
+
+class ChangeNotifier:
+    """
+    Wakes the streams waiting for a feed's next change.
+
+    The feed subscriber only sets a flag, so a mutation costs the same
+    however many clients are connected. A daemon thread, started by the
+    first wait(), wakes the waiting streams, once per burst of changes.
+
+    Attributes:
+        feed: Feed whose changes are awaited
+        closed: True once close() was called; streams then end
+
+    Examples:
+        >>> notifier = ChangeNotifier(ChangeFeed())
+        >>> notifier.wait(0, timeout=0.01)
+        False
+        >>> notifier.close()
+    """
+
+    def __init__(self, feed: ChangeFeed) -> None:
+        """
+        Subscribe to a feed.
+
+        Args:
+            feed: Feed whose changes are awaited
+        """
+        self.feed = feed
+        self._changed = threading.Event()
+        self._condition = threading.Condition()
+        self.closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribe = feed.subscribe(self._on_change)
+
+    def wait(self, seq: int, timeout: float) -> bool:
+        """
+        Block until the feed has an event after seq, or timeout.
+
+        Args:
+            seq: Last sequence number the caller has seen
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if the feed has an event after seq (False on timeout or
+            when the notifier is closed)
+        """
+        self._start()
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.closed or self.feed.last_seq > seq, timeout
+            )
+        return not self.closed and self.feed.last_seq > seq
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """
+        Call listener() from the notifier thread after each burst of changes.
+
+        Args:
+            listener: Quick, non-blocking callable (e.g. one that schedules
+                work on an event loop)
+
+        Returns:
+            A function that removes the listener
+        """
+        with self._condition:
+            # Copy on write, so _run() can iterate without the lock
+            self._listeners = [*self._listeners, listener]
+        self._start()
+
+        def remove() -> None:
+            with self._condition:
+                self._listeners = [
+                    other for other in self._listeners if other is not listener
+                ]
+
+        return remove
+
+    def close(self) -> None:
+        """Unsubscribe from the feed and release waiting streams."""
+        self._unsubscribe()
+        self.closed = True
+        self._changed.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _on_change(self, event: ChangeEvent) -> None:
+        """Feed subscriber: runs inside the mutation, so only sets a flag."""
+        self._changed.set()
+
+    def _start(self) -> None:
+        """Start the thread waking waiting streams, if not running yet."""
+        if self._thread is not None:
+            return
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sse-notifier", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Wake every waiting stream after each burst of changes."""
+        while not self.closed:
+            self._changed.wait()
+            self._changed.clear()
+            with self._condition:
+                self._condition.notify_all()
+            for listener in self._listeners:
+                listener()
+
+
+class EventServer:
+    """
+    Serves GET /events from one asyncio thread, however many clients.
+
+    Each client is a coroutine, not a thread: an idle stream costs a
+    socket and a few kilobytes, and a burst of changes wakes every stream
+    with one event-loop callback. The protocol is the one of
+    stream_changes(): Last-Event-ID or ?since=<version> resumes, a reset
+    event replaces history that is gone. Any other path gets 404.
+
+    Attributes:
+        notifier: Notifier of the feed to stream
+        host: Interface to listen on
+        port: Port to listen on (0 picks a free one; the bound port once
+            start() returned)
+        keepalive: Seconds between keep-alive comments
+
+    Examples:
+        >>> server = EventServer(ChangeNotifier(ChangeFeed()))
+        >>> server.start() > 0
+        True
+        >>> server.close()
+    """
+
+    def __init__(
+        self,
+        notifier: ChangeNotifier,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        keepalive: Optional[float] = None,
+    ) -> None:
+        """
+        Configure the server; start() begins listening.
+
+        Args:
+            notifier: Notifier of the feed to stream
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+            keepalive: Seconds between keep-alive comments (default:
+                KEEPALIVE_INTERVAL)
+        """
+        self.notifier = notifier
+        self.host = host
+        self.port = port
+        self.keepalive = KEEPALIVE_INTERVAL if keepalive is None else keepalive
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._clients: dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+        self._remove_listener: Optional[Callable[[], None]] = None
+
+    def start(self) -> int:
+        """
+        Start listening on a daemon thread.
+
+        Returns:
+            The bound port
+
+        Raises:
+            OSError: If the address cannot be bound
+        """
+        ready = threading.Event()
+        errors: list[BaseException] = []
+        self._thread = threading.Thread(
+            target=self._run, args=(ready, errors), name="sse-server", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return self.port
+
+    def close(self) -> None:
+        """Stop listening and drop every open stream."""
+        if self._remove_listener is not None:
+            self._remove_listener()
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self, ready: threading.Event, errors: list[BaseException]) -> None:
+        """Run the event loop until close()."""
+        try:
+            asyncio.run(self._serve(ready))
+        except OSError as e:
+            errors.append(e)
+            ready.set()
+
+    async def _serve(self, ready: threading.Event) -> None:
+        """Accept clients until close()."""
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._stopped = asyncio.Event()
+        self._changed = asyncio.Event()
+        server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=EVENT_SERVER_BACKLOG
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        # Runs on the notifier thread, once per burst of changes
+        self._remove_listener = self.notifier.add_listener(
+            lambda: loop.call_soon_threadsafe(self._broadcast)
+        )
+        ready.set()
+        async with server:
+            await self._stopped.wait()
+            # Closing the server waits for open connections: drop them (a
+            # stream blocked on a slow client fails its write) and wake
+            # the idle streams, which then see that the server stopped
+            for writer in self._clients.values():
+                writer.transport.abort()
+            self._broadcast()
+            await asyncio.gather(*self._clients)
+
+    def _stopped_set(self) -> bool:
+        """Return True once close() was called (on the event loop)."""
+        return self._stopped is not None and self._stopped.is_set()
+
+    def _broadcast(self) -> None:
+        """Wake every waiting stream (on the event loop)."""
+        assert self._changed is not None
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one connection: parse the request, then stream."""
+        client = asyncio.current_task()
+        assert client is not None
+        self._clients[client] = writer
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            url = urlsplit(request_line[1] if len(request_line) > 1 else "")
+            if request_line[:1] != ["GET"] or url.path != "/events":
+                writer.write(_NOT_FOUND)
+                await writer.drain()
+                return
+            last_seq = _int_or_none(headers.get("last-event-id"))
+            if last_seq is None:
+                last_seq = _int_or_none(parse_qs(url.query).get("since", [""])[0])
+            await self._stream(writer, last_seq)
+        except (ConnectionError, ValueError):
+            # Client went away, or sent a line beyond the reader's limit
+            pass
+        finally:
+            del self._clients[client]
+            writer.close()
+
+    async def _stream(
+        self, writer: asyncio.StreamWriter, last_seq: Optional[int]
+    ) -> None:
+        """Write a client's event stream until it disconnects."""
+        feed = self.notifier.feed
+        seq = feed.last_seq if last_seq is None else last_seq
+        writer.write(_STREAM_HEADERS + f"retry: {RETRY_MS}\n\n".encode())
+        await writer.drain()
+        while not self.notifier.closed and not self._stopped_set():
+            # Taken before reading, so a change made meanwhile still wakes us
+            changed = self._changed
+            assert changed is not None
+            seq, chunk = _catch_up(feed, seq)
+            if chunk is None:
+                try:
+                    await asyncio.wait_for(changed.wait(), self.keepalive)
+                    continue
+                except TimeoutError:
+                    chunk = ": keep-alive\n\n"
+            writer.write(chunk.encode())
+            await writer.drain()
+
+
+def stream_changes(
+    notifier: ChangeNotifier,
+    last_seq: Optional[int] = None,
+    keepalive: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Stream a feed's changes as text/event-stream chunks until it closes.
+
+    Each event's id is its sequence number and its data is
+    ChangeEvent.to_dict() as JSON, so a reconnecting EventSource resumes
+    with Last-Event-ID. Events that piled up while the client was slow are
+    written as one chunk. If the events after last_seq are no longer kept
+    (e.g. they were made before a server restart) or last_seq is ahead of
+    the feed, a "reset" event carries the current version: the client
+    reloads its state (GET /tasks?since=0) and the stream continues from
+    there.
+
+    Args:
+        notifier: Notifier of the feed to stream
+        last_seq: Last sequence number the client has seen (None to stream
+            only changes from now on)
+        keepalive: Seconds between keep-alive comments (default:
+            KEEPALIVE_INTERVAL)
+
+    Returns:
+        Iterator over chunks of the event stream
+    """
+    # Resolved now, not on the first next(): changes made between connecting
+    # and the first read must not be skipped
+    if last_seq is None:
+        last_seq = notifier.feed.last_seq
+    if keepalive is None:
+        keepalive = KEEPALIVE_INTERVAL
+    return _stream(notifier, last_seq, keepalive)
+
+
+def format_event(event: ChangeEvent) -> str:
+    """
+    Format a change as one server-sent event.
+
+    Examples:
+        >>> from todo_app.models import Task
+        >>> feed = ChangeFeed()
+        >>> _ = feed.emit("delete", Task(id=3, title="Old"))
+        >>> format_event(feed.changes_since(0)[0]).splitlines()[:2]
+        ['id: 1', 'event: delete']
+    """
+    data = json.dumps(event.to_dict(), ensure_ascii=False, separators=(",", ":"))
+    return f"id: {event.seq}\nevent: {event.op}\ndata: {data}\n\n"
+
+
+def _stream(notifier: ChangeNotifier, seq: int, keepalive: float) -> Iterator[str]:
+    """Yield the chunks of stream_changes()."""
+    feed = notifier.feed
+    yield f"retry: {RETRY_MS}\n\n"
+    while not notifier.closed:
+        seq, chunk = _catch_up(feed, seq)
+        if chunk is not None:
+            yield chunk
+        elif not notifier.wait(seq, keepalive):
+            yield ": keep-alive\n\n"
+
+
+def _catch_up(feed: ChangeFeed, seq: int) -> tuple[int, Optional[str]]:
+    """
+    Return the new last sequence number and the chunk for events after seq.
+
+    The chunk is None if there is nothing new, and a reset event if the
+    events after seq are gone or seq is ahead of the feed.
+    """
+    try:
+        events = feed.changes_since(seq)
+    except (ChangesExpiredError, ValueError):
+        seq = feed.last_seq
+        return seq, _reset_event(seq)
+    if not events:
+        return seq, None
+    return events[-1].seq, "".join(map(format_event, events))
+
+
+def _int_or_none(text: Optional[str]) -> Optional[int]:
+    """Parse a header or query value as an int (None if it is not one)."""
+    try:
+        return int(text) if text else None
+    except ValueError:
+        return None
+
+
+def _reset_event(seq: int) -> str:
+    """Format the event telling a client to reload its state."""
+    return f'id: {seq}\nevent: reset\ndata: {{"version":{seq}}}\n\n'
@@ -0,0 +1,279 @@
+"""
+Persistent storage backends for TodoManager.
+
+This module provides an append-only, write-ahead journal backend. Every
+mutation is appended as one framed record; on startup the latest snapshot
+and the journal are replayed to rebuild the manager's state, and periodic
+compaction folds the journal into a fresh snapshot.
+"""
+
+import json
+import os
+import struct
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO, Optional
+
+from todo_app.exceptions import StorageError
+
+FSYNC_POLICIES = ("always", "batch", "os")
+
+# Frame header: payload length and CRC32 of the payload, big-endian
+FRAME_HEADER = struct.Struct(">II")
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_INTERVAL = 1.0
+DEFAULT_COMPACT_EVERY = 10_000
+
+
+class StorageBackend:
+    """
+    Interface for TodoManager storage backends.
+
+    A backend receives one record (a JSON-serializable dict) per mutation and
+    replays previously stored records when the manager starts.
+    """
+
+    def replay(self) -> Iterator[dict[str, Any]]:
+        """Yield stored records in the order they must be applied."""
+        raise NotImplementedError
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Durably store one mutation record."""
+        raise NotImplementedError
+
+    def append_many(self, records: Iterable[dict[str, Any]]) -> None:
+        """Durably store a batch of mutation records."""
+        for record in records:
+            self.append(record)
+
+    def needs_compaction(self) -> bool:
+        """Return True if the backend wants a snapshot via compact()."""
+        return False
+
+    def compact(self, records: Iterable[dict[str, Any]]) -> None:
+        """Replace stored history with the given snapshot records."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flush pending writes and release resources."""
+
+
+class JournalStorage(StorageBackend):
+    """
+    Append-only journal file with snapshot compaction.
+
+    Each record is framed as a 4-byte length, a 4-byte CRC32 and a UTF-8
+    JSON payload. A torn or corrupt frame at the end of the journal (for
+    example after a crash mid-write) is discarded on replay.
+
+    Attributes:
+        path: Journal file path
+        snapshot_path: Snapshot file path (path + ".snapshot")
+        fsync: Durability policy - "always" (fsync every record), "batch"
+            (fsync every batch_size records or batch_interval seconds) or
+            "os" (flush to the OS and let it decide when to write back)
+        batch_size: Records per fsync under the "batch" policy
+        batch_interval: Maximum seconds between fsyncs under "batch"
+        compact_every: Records appended before compaction is requested
+            (None disables automatic compaction)
+
+    Examples:
+        >>> storage = JournalStorage("tasks.journal", fsync="always")  # doctest: +SKIP
+        >>> manager = TodoManager(storage=storage)  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fsync: str = "batch",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL,
+        compact_every: Optional[int] = DEFAULT_COMPACT_EVERY,
+    ) -> None:
+        """
+        Initialize the journal backend.
+
+        Args:
+            path: Journal file path (created if missing)
+            fsync: Durability policy ("always", "batch" or "os")
+            batch_size: Records per fsync under the "batch" policy
+            batch_interval: Maximum seconds between fsyncs under "batch"
+            compact_every: Records between compactions (None to disable)
+
+        Raises:
+            StorageError: If fsync is not a valid policy
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise StorageError(
+                f"Invalid fsync policy '{fsync}'. "
+                f"Must be one of: {', '.join(FSYNC_POLICIES)}"
+            )
+
+        self.path = path
+        self.snapshot_path = f"{path}.snapshot"
+        self.fsync = fsync
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.compact_every = compact_every
+
+        self._file: Optional[BinaryIO] = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._appended = 0
+
+    def replay(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield snapshot records followed by journal records.
+
+        A torn tail in the journal is truncated so new records are appended
+        after the last valid frame.
+
+        Returns:
+            Iterator over stored records in application order
+        """
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as snapshot:
+                yield from _read_frames(snapshot)
+
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as journal:
+                for record in _read_frames(journal):
+                    self._appended += 1
+                    yield record
+                valid_end = journal.tell()
+            if valid_end < os.path.getsize(self.path):
+                os.truncate(self.path, valid_end)
+
+    def append(self, record: dict[str, Any]) -> None:
+        """
+        Append one framed record and apply the fsync policy.
+
+        Args:
+            record: JSON-serializable mutation record
+        """
+        self.append_many((record,))
+
+    def append_many(self, records: Iterable[dict[str, Any]]) -> None:
+        """
+        Append a batch of framed records.
+
+        Frames are written one by one through the file's buffer, so a large
+        batch is never held in memory as one payload. The fsync policy is
+        applied once for the whole batch, so a batch costs at most one fsync
+        even under the "always" policy.
+
+        Args:
+            records: JSON-serializable mutation records
+        """
+        journal = self._open()
+        count = 0
+        for record in records:
+            journal.write(_frame(record))
+            count += 1
+        if not count:
+            return
+        journal.flush()
+        self._appended += count
+        self._unsynced += count
+
+        if self.fsync == "always":
+            self._sync()
+        elif self.fsync == "batch" and (
+            self._unsynced >= self.batch_size
+            or time.monotonic() - self._last_sync >= self.batch_interval
+        ):
+            self._sync()
+
+    def needs_compaction(self) -> bool:
+        """Return True once compact_every records have been appended."""
+        return self.compact_every is not None and self._appended >= self.compact_every
+
+    def compact(self, records: Iterable[dict[str, Any]]) -> None:
+        """
+        Write a snapshot of the given records and truncate the journal.
+
+        The snapshot is written to a temporary file, fsynced and atomically
+        renamed, so a crash leaves either the old or the new snapshot. Replay
+        is idempotent, so a crash before the journal is truncated is safe.
+
+        Args:
+            records: Records that rebuild the current state
+        """
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, "wb") as snapshot:
+            for record in records:
+                snapshot.write(_frame(record))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        _fsync_directory(self.snapshot_path)
+
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.path, "wb")
+        self._appended = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Fsync outstanding records (unless policy is "os") and close."""
+        if self._file is None:
+            return
+        if self._unsynced and self.fsync != "os":
+            self._sync()
+        self._file.close()
+        self._file = None
+
+    def _open(self) -> BinaryIO:
+        """Return the journal file, opening it for appending if needed."""
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        return self._file
+
+    def _sync(self) -> None:
+        """Fsync the journal file."""
+        assert self._file is not None
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+
+def _frame(record: dict[str, Any]) -> bytes:
+    """Encode a record as a length- and CRC-prefixed frame."""
+    payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+    return FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _read_frames(stream: BinaryIO) -> Iterator[dict[str, Any]]:
+    """
+    Yield records from a framed stream, stopping at the first bad frame.
+
+    On return the stream is positioned just after the last valid frame.
+    """
+    while True:
+        start = stream.tell()
+        header = stream.read(FRAME_HEADER.size)
+        if len(header) < FRAME_HEADER.size:
+            stream.seek(start)
+            return
+        length, checksum = FRAME_HEADER.unpack(header)
+        payload = stream.read(length)
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            stream.seek(start)
+            return
+        yield json.loads(payload.decode("utf-8"))
+
+
+def _fsync_directory(path: str) -> None:
+    """Fsync the directory containing path so a rename is durable (POSIX)."""
+    if os.name != "posix":  # pragma: no cover
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,156 @@
+"""
+Transactional batches for TodoManager.
+
+This module provides Transaction, an overlay of pending changes created by
+TodoManager.transaction(). Changes are validated as they are made but only
+reach the manager when the with block ends without an exception.
+"""
+
+import copy
+from typing import TYPE_CHECKING, Optional
+
+from todo_app.exceptions import TaskNotFoundException
+from todo_app.models import Task
+
+if TYPE_CHECKING:
+    from todo_app.manager import TodoManager
+
+
+class Transaction:
+    """
+    Pending changes to a TodoManager, committed atomically.
+
+    The first change to a task copies that one task into the overlay; tasks
+    that are not touched are never copied, so memory and commit time scale
+    with the number of changed tasks.
+
+    Attributes:
+        changes: Task ID -> final task state (None if deleted), in the order
+            tasks were first touched
+        added: IDs of tasks created in this transaction
+
+    Examples:
+        >>> manager = TodoManager()  # doctest: +SKIP
+        >>> with manager.transaction() as tx:  # doctest: +SKIP
+        ...     task = tx.add_task(title="Plan trip")
+        ...     tx.mark_complete(task.id)
+    """
+
+    def __init__(self, manager: "TodoManager") -> None:
+        """
+        Start an empty transaction.
+
+        Args:
+            manager: Manager the changes will be committed to
+        """
+        self.changes: dict[int, Optional[Task]] = {}
+        self.added: set[int] = set()
+        self._manager = manager
+        # Pending IDs; the manager assigns the final ones when committing
+        self._next_id = manager._next_id
+
+    def add_task(self, title: str, description: str = "") -> Task:
+        """
+        Add a new task when the transaction commits.
+
+        Returns:
+            The pending Task. Its ID identifies it within the transaction
+            and becomes final on commit, unless tasks were added outside
+            the transaction meanwhile: the commit then renumbers it after
+            them.
+
+        Raises:
+            InvalidTaskDataError: If title/description violate constraints
+        """
+        task = Task(id=self._next_id, title=title, description=description)
+        self._next_id += 1
+        self.changes[task.id] = task
+        self.added.add(task.id)
+        return task
+
+    def get_task(self, task_id: int) -> Task:
+        """
+        Get a task as it will be after the transaction commits.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist (or was deleted)
+        """
+        if task_id in self.changes:
+            task = self.changes[task_id]
+            if task is None:
+                raise TaskNotFoundException(f"Task with ID {task_id} not found")
+            return task
+        return self._manager._require(task_id)
+
+    def update_task(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Task:
+        """
+        Update a task's title and/or description when the transaction commits.
+
+        Returns:
+            The pending Task
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+            InvalidTaskDataError: If new data violates constraints
+        """
+        task = self._touch(task_id)
+        task.title, task.description = self._manager._validate_update(
+            task, title, description
+        )
+        return task
+
+    def delete_task(self, task_id: int) -> None:
+        """
+        Delete a task when the transaction commits.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self.get_task(task_id)
+        self.changes[task_id] = None
+
+    def mark_complete(self, task_id: int) -> None:
+        """
+        Mark a task as complete when the transaction commits.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self._touch(task_id).completed = True
+
+    def mark_incomplete(self, task_id: int) -> None:
+        """
+        Mark a task as incomplete when the transaction commits.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        self._touch(task_id).completed = False
+
+    def toggle_complete(self, task_id: int) -> None:
+        """
+        Toggle a task's completion status when the transaction commits.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist
+        """
+        task = self._touch(task_id)
+        task.completed = not task.completed
+
+    def _touch(self, task_id: int) -> Task:
+        """
+        Return the overlay copy of a task, copying it on first change.
+
+        Raises:
+            TaskNotFoundException: If task_id doesn't exist (or was deleted)
+        """
+        task = self.get_task(task_id)
+        if task_id not in self.changes:
+            task = copy.copy(task)
+            self.changes[task_id] = task
+        return task
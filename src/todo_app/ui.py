@@ -9,6 +9,11 @@ from typing import Optional
 
 from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
 from todo_app.manager import TodoManager
+from todo_app.models import Task
+from todo_app.render import format_task_detail, render_tasks
+
+# Tasks shown per page when viewing task lists
+PAGE_SIZE = 10
 
 
 class TodoUI:
@@ -40,18 +45,14 @@ class TodoUI:
         print(f"  {title}")
         print("=" * 60)
 
-    def print_task(self, task) -> None:
+    def print_task(self, task: Task) -> None:
         """
         Print a single task in formatted style.
 
         Args:
             task: Task object to display
         """
-        status = "✓" if task.completed else "☐"
-        print(f"\n[{task.id}] {status} {task.title}")
-        if task.description:
-            print(f"    Description: {task.description}")
-        print(f"    Status: {'Completed' if task.completed else 'Pending'}")
+        sys.stdout.write(_format_entry(task))
 
     def show_menu(self) -> None:
         """Display the main menu options."""
@@ -65,7 +66,8 @@ class TodoUI:
         print("  6. Mark task as complete")
         print("  7. Mark task as incomplete")
         print("  8. Delete task")
-        print("  9. Exit")
+        print("  9. Search tasks")
+        print("  10. Exit")
         print("\n" + "-" * 60)
 
     def get_input(self, prompt: str, required: bool = True) -> Optional[str]:
@@ -120,26 +122,56 @@ class TodoUI:
             "pending": "Pending Tasks",
             "completed": "Completed Tasks",
         }
-        self.print_header(status_names.get(status, "All Tasks"))
+        # after_id cursor of every page visited so far (None = first page)
+        cursors: list[Optional[int]] = [None]
 
-        tasks = self.manager.list_tasks(status=status)
+        while True:
+            self.print_header(status_names.get(status, "All Tasks"))
 
-        if not tasks:
-            print("\n📭 No tasks found.")
-        else:
-            for task in tasks:
-                self.print_task(task)
+            tasks = self.manager.list_tasks(
+                status=status, limit=PAGE_SIZE + 1, after_id=cursors[-1]
+            )
+            has_next = len(tasks) > PAGE_SIZE
+            tasks = tasks[:PAGE_SIZE]
+
+            if not tasks:
+                print("\n📭 No tasks found.")
+                input("\nPress Enter to continue...")
+                return
+
+            render_tasks(tasks, sys.stdout, formatter=_format_entry)
 
             # Show summary
-            total = len(tasks)
+            stats = self.manager.stats()
             if status == "all":
-                completed = len([t for t in tasks if t.completed])
-                pending = total - completed
-                print(f"\n📊 Total: {total} tasks ({completed} completed, {pending} pending)")
+                print(
+                    f"\n📊 Total: {stats.total} tasks "
+                    f"({stats.completed} completed, {stats.pending} pending)"
+                )
             else:
+                total = getattr(stats, status)
                 print(f"\n📊 Total: {total} {status} tasks")
 
-        input("\nPress Enter to continue...")
+            has_previous = len(cursors) > 1
+            if not has_next and not has_previous:
+                input("\nPress Enter to continue...")
+                return
+
+            options = []
+            if has_next:
+                options.append("n = next page")
+            if has_previous:
+                options.append("p = previous page")
+            options.append("Enter = back to menu")
+            print(f"📄 Page {len(cursors)}")
+            choice = input(f"\n{' | '.join(options)}: ").strip().lower()
+
+            if choice == "n" and has_next:
+                cursors.append(tasks[-1].id)
+            elif choice == "p" and has_previous:
+                cursors.pop()
+            else:
+                return
 
     def update_task_menu(self) -> None:
         """Handle updating an existing task."""
@@ -303,6 +335,22 @@ class TodoUI:
 
         input("\nPress Enter to continue...")
 
+    def search_tasks_menu(self) -> None:
+        """Handle searching task titles and descriptions."""
+        self.print_header("Search Tasks")
+
+        query = self.get_input("Enter search words: ", required=True)
+        assert query is not None  # For type checker
+
+        tasks = self.manager.search(query)
+        if not tasks:
+            print(f"\n🔍 No tasks matching '{query}'.")
+        else:
+            render_tasks(tasks, sys.stdout, formatter=_format_entry)
+            print(f"\n🔍 {len(tasks)} matching tasks")
+
+        input("\nPress Enter to continue...")
+
     def run(self) -> None:
         """Run the main application loop."""
         print("\n🚀 Welcome to LifeStepsAI Todo Application!")
@@ -313,7 +361,7 @@ class TodoUI:
             self.clear_screen()
             self.show_menu()
 
-            choice = input("Enter your choice (1-9): ").strip()
+            choice = input("Enter your choice (1-10): ").strip()
 
             if choice == "1":
                 self.add_task_menu()
@@ -332,15 +380,22 @@ class TodoUI:
             elif choice == "8":
                 self.delete_task_menu()
             elif choice == "9":
+                self.search_tasks_menu()
+            elif choice == "10":
                 self.running = False
                 print("\n👋 Thank you for using LifeStepsAI Todo App!")
                 print("   All tasks are stored in-memory and will be lost on exit.")
                 print("   Good bye! 🚀\n")
             else:
-                print("\n❌ Invalid choice. Please enter a number between 1-9.")
+                print("\n❌ Invalid choice. Please enter a number between 1-10.")
                 input("Press Enter to continue...")
 
 
+def _format_entry(task: Task) -> str:
+    """Format a task for menu listings (a detail block after a blank line)."""
+    return "\n" + format_task_detail(task)
+
+
 def main() -> None:
     """Main entry point for the application."""
     try:
@@ -0,0 +1,330 @@
+"""
+Web API for the todo application.
+
+This module provides create_app, a Flask application factory exposing a JSON
+REST API over TodoManager. GET responses carry weak ETags so clients can
+revalidate with If-None-Match, large JSON bodies are gzip-compressed,
+polling clients can fetch only what changed with GET /tasks?since=<version>,
+and GET /events streams changes as Server-Sent Events (served by an
+EventServer on EVENTS_PORT when many subscribers are expected).
+
+Run it in production with gunicorn (see gunicorn.conf.py):
+
+    gunicorn -c gunicorn.conf.py "todo_app.web:create_app()"
+"""
+
+import gzip
+import os
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Optional
+
+from flask import Flask, Response, jsonify, request, url_for
+from flask_cors import CORS
+
+from todo_app.concurrency import ThreadSafeTodoManager
+from todo_app.exceptions import (
+    ChangesExpiredError,
+    InvalidTaskDataError,
+    TaskNotFoundException,
+)
+from todo_app.manager import TodoManager
+from todo_app.sse import ChangeNotifier, EventServer, stream_changes
+from todo_app.storage import JournalStorage
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+# Concurrent /events streams; each holds a server thread while connected
+DEFAULT_MAX_STREAMS = 100
+
+# Seconds a client refused a stream slot should wait before reconnecting
+STREAM_RETRY_AFTER = 5
+
+# Bodies smaller than this are sent uncompressed (gzip would not pay off)
+GZIP_MIN_SIZE = 512
+GZIP_LEVEL = 6
+
+
+def create_app(
+    manager: Optional[TodoManager] = None,
+    max_streams: Optional[int] = None,
+    events_port: Optional[int] = None,
+) -> Flask:
+    """
+    Create the Flask application serving the task API.
+
+    Endpoints:
+        GET    /tasks?status=&limit=&after=  Page of tasks (keyset pagination)
+        GET    /tasks?since=<version>        Tasks changed and IDs deleted since
+                                             a version, and the new version
+        POST   /tasks                        Create a task
+        GET    /tasks/<id>                   Get one task
+        PATCH  /tasks/<id>                   Update title and/or description
+        POST   /tasks/<id>/toggle            Toggle completion
+        DELETE /tasks/<id>                   Delete a task
+        GET    /events?since=<version>       Server-Sent Events stream of
+                                             changes (resumes from the
+                                             Last-Event-ID header or since;
+                                             503 beyond max_streams)
+        GET    /healthz                      Liveness probe
+
+    Args:
+        manager: Manager to serve (default: a new ThreadSafeTodoManager,
+            journal-backed if the TODO_JOURNAL environment variable is set).
+            A plain TodoManager is guarded by one lock around every call.
+        max_streams: Maximum number of open /events streams (default: the
+            MAX_STREAMS environment variable, or DEFAULT_MAX_STREAMS). Each
+            stream holds a server thread, so the server needs this many
+            threads on top of those serving requests.
+        events_port: Port of an EventServer to start for this manager
+            (default: the EVENTS_PORT environment variable, else none; 0
+            picks a free port). It serves /events from one asyncio thread,
+            so subscribers hold no server threads; route /events to it.
+            The server is app.extensions["todo_event_server"].
+
+    Returns:
+        Configured Flask application
+
+    Examples:
+        >>> client = create_app().test_client()  # doctest: +SKIP
+        >>> client.post("/tasks", json={"title": "Buy milk"}).status_code
+        201
+    """
+    if manager is None:
+        journal = os.environ.get("TODO_JOURNAL")
+        manager = ThreadSafeTodoManager(
+            storage=JournalStorage(journal) if journal else None
+        )
+    if max_streams is None:
+        max_streams = int(os.environ.get("MAX_STREAMS", DEFAULT_MAX_STREAMS))
+    if events_port is None and os.environ.get("EVENTS_PORT"):
+        events_port = int(os.environ["EVENTS_PORT"])
+
+    app = Flask(__name__)
+    app.json.compact = True  # type: ignore[attr-defined]
+    app.json.ensure_ascii = False  # type: ignore[attr-defined]
+    app.json.sort_keys = False  # type: ignore[attr-defined]
+    CORS(app)
+
+    # A plain TodoManager is not thread-safe; serialize access across threads
+    lock: AbstractContextManager[Any] = (
+        nullcontext()
+        if isinstance(manager, ThreadSafeTodoManager)
+        else threading.Lock()
+    )
+
+    @app.get("/tasks")
+    def list_tasks() -> Response:
+        since = request.args.get("since", type=int)
+        if since is not None:
+            with lock:
+                delta = manager.delta(since)
+                changed = [task.to_dict() for task in delta.changed]
+            return jsonify(
+                version=delta.version, changed=changed, deleted=delta.deleted
+            )
+
+        status = request.args.get("status", "all")
+        limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
+        after_id = request.args.get("after", type=int)
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            return _error(f"limit must be between 1 and {MAX_PAGE_SIZE}", 400)
+
+        with lock:
+            # Fetch one extra task to know whether another page follows
+            tasks = manager.list_tasks(status, limit=limit + 1, after_id=after_id)
+            page = [task.to_dict() for task in tasks[:limit]]
+        next_after = page[-1]["id"] if len(tasks) > limit else None
+        return jsonify(tasks=page, next_after=next_after)
+
+    @app.post("/tasks")
+    def create_task() -> tuple[Response, int, dict[str, str]]:
+        data = _json_body()
+        with lock:
+            task = manager.add_task(
+                title=_string_field(data, "title", required=True),
+                description=_string_field(data, "description") or "",
+            )
+            body = task.to_dict()
+        location = url_for("get_task", task_id=task.id)
+        return jsonify(body), 201, {"Location": location}
+
+    @app.get("/tasks/<int:task_id>")
+    def get_task(task_id: int) -> Response:
+        with lock:
+            return jsonify(manager.get_task(task_id).to_dict())
+
+    @app.patch("/tasks/<int:task_id>")
+    def update_task(task_id: int) -> Response:
+        data = _json_body()
+        title = _string_field(data, "title")
+        description = _string_field(data, "description")
+        if title is None and description is None:
+            raise InvalidTaskDataError(
+                "At least one of title or description must be provided"
+            )
+        with lock:
+            task = manager.update_task(task_id, title=title, description=description)
+            return jsonify(task.to_dict())
+
+    @app.post("/tasks/<int:task_id>/toggle")
+    def toggle_task(task_id: int) -> Response:
+        with lock:
+            manager.toggle_complete(task_id)
+            return jsonify(manager.get_task(task_id).to_dict())
+
+    @app.delete("/tasks/<int:task_id>")
+    def delete_task(task_id: int) -> tuple[str, int]:
+        with lock:
+            manager.delete_task(task_id)
+        return "", 204
+
+    # Created by the first /events request, so managers nobody streams from
+    # do not pay for a feed subscriber on every mutation
+    notifier: Optional[ChangeNotifier] = None
+    notifier_lock = threading.Lock()
+
+    def get_notifier() -> ChangeNotifier:
+        nonlocal notifier
+        with notifier_lock:
+            if notifier is None:
+                notifier = ChangeNotifier(manager.changes)
+            return notifier
+
+    if events_port is not None:
+        event_server = EventServer(
+            get_notifier(),
+            host=os.environ.get("EVENTS_HOST", "127.0.0.1"),
+            port=events_port,
+        )
+        event_server.start()
+        app.extensions["todo_event_server"] = event_server
+
+    # Streams beyond the cap are refused, so they cannot take every server
+    # thread and starve the other endpoints
+    stream_slots = threading.BoundedSemaphore(max_streams)
+
+    @app.get("/events")
+    def events() -> Response:
+        last_seq = request.headers.get("Last-Event-ID", type=int)
+        if last_seq is None:
+            last_seq = request.args.get("since", type=int)
+        if not stream_slots.acquire(blocking=False):
+            response = jsonify(error="Too many open event streams")
+            response.status_code = 503
+            response.headers["Retry-After"] = str(STREAM_RETRY_AFTER)
+            return response
+        response = Response(
+            stream_changes(get_notifier(), last_seq),
+            mimetype="text/event-stream",
+            # Proxies must pass events through as they are written
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        # The server closes the response when the client goes away
+        response.call_on_close(stream_slots.release)
+        return response
+
+    @app.get("/healthz")
+    def healthz() -> Response:
+        return jsonify(status="ok")
+
+    @app.errorhandler(TaskNotFoundException)
+    def handle_not_found(e: TaskNotFoundException) -> tuple[Response, int]:
+        return _error(str(e), 404)
+
+    @app.errorhandler(ChangesExpiredError)
+    def handle_expired(e: ChangesExpiredError) -> tuple[Response, int]:
+        # The client must resynchronize from scratch with since=0
+        return _error(str(e), 410)
+
+    @app.errorhandler(InvalidTaskDataError)
+    @app.errorhandler(ValueError)
+    def handle_invalid(e: Exception) -> tuple[Response, int]:
+        return _error(str(e), 400)
+
+    # after_request hooks run in reverse order: ETag first, then gzip
+    app.after_request(_compress_response)
+    app.after_request(_conditional_response)
+    return app
+
+
+def main() -> None:
+    """Run the development server (use gunicorn in production)."""
+    create_app().run(
+        host=os.environ.get("HOST", "127.0.0.1"),
+        port=int(os.environ.get("PORT", "5000")),
+    )
+
+
+def _error(message: str, status: int) -> tuple[Response, int]:
+    """Build a JSON error response."""
+    return jsonify(error=message), status
+
+
+def _json_body() -> dict[str, Any]:
+    """
+    Return the request's JSON object body.
+
+    Raises:
+        InvalidTaskDataError: If the body is not a JSON object
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise InvalidTaskDataError("Request body must be a JSON object")
+    return data
+
+
+def _string_field(
+    data: dict[str, Any], name: str, required: bool = False
+) -> Optional[str]:
+    """
+    Return an optional string field of a JSON body.
+
+    Raises:
+        InvalidTaskDataError: If the field is missing (when required) or not
+            a string
+    """
+    value = data.get(name)
+    if value is None and not required:
+        return None
+    if not isinstance(value, str):
+        raise InvalidTaskDataError(f"Field '{name}' must be a string")
+    return value
+
+
+def _conditional_response(response: Response) -> Response:
+    """Tag successful GET responses with a weak ETag and honor If-None-Match."""
+    if (
+        request.method == "GET"
+        and response.status_code == 200
+        and not response.is_streamed
+    ):
+        # Weak, so the same tag stays valid for the gzip-encoded variant
+        response.add_etag(weak=True)
+        response.make_conditional(request)
+    return response
+
+
+def _compress_response(response: Response) -> Response:
+    """Gzip-compress JSON responses when the client accepts it."""
+    response.vary.add("Accept-Encoding")
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.mimetype != "application/json"
+        or "Content-Encoding" in response.headers
+        or "gzip" not in request.accept_encodings
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Unit tests for the AsyncTodoManager facade.
+
+Target: 100% code coverage for async_manager.py
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+
+from todo_app.async_manager import AsyncTodoManager
+from todo_app.concurrency import ThreadSafeTodoManager
+from todo_app.exceptions import TaskNotFoundException
+from todo_app.manager import TodoManager
+from todo_app.sqlite_manager import SqliteTodoManager
+from todo_app.storage import JournalStorage
+
+
+class TestAsyncTodoManager:
+    """Test suite for the coroutine API."""
+
+    def test_crud_inline(self):
+        """Test the full API on an in-memory manager (no thread pool)."""
+
+        async def scenario():
+            async with AsyncTodoManager() as manager:
+                assert manager.offload is False
+                task = await manager.add_task(title="Buy milk", description="2 l")
+                await manager.update_task(task.id, title="Buy oat milk")
+                await manager.mark_complete(task.id)
+                await manager.mark_incomplete(task.id)
+                await manager.toggle_complete(task.id)
+                found = await manager.search("oat")
+                stats = await manager.stats()
+                done = await manager.count_tasks("completed")
+                fetched = await manager.get_task(task.id)
+                await manager.delete_task(task.id)
+                with pytest.raises(TaskNotFoundException):
+                    await manager.get_task(task.id)
+                return found, stats, done, fetched, manager._executor
+
+        found, stats, done, fetched, executor = asyncio.run(scenario())
+
+        assert [t.title for t in found] == ["Buy oat milk"]
+        assert (stats.total, done, fetched.completed) == (1, 1, True)
+        assert executor is None
+
+    def test_storage_calls_run_on_pool(self, tmp_path):
+        """Test that storage-backed managers are called off the loop thread."""
+        storage = JournalStorage(str(tmp_path / "tasks.journal"), fsync="always")
+        threads = set()
+
+        class Recording(ThreadSafeTodoManager):
+            def add_task(self, title, description=""):
+                threads.add(threading.current_thread().name)
+                return super().add_task(title, description)
+
+        async def scenario():
+            async with AsyncTodoManager(Recording(storage), max_pending=2) as manager:
+                await asyncio.gather(
+                    *(manager.add_task(title=f"Task {i}") for i in range(20))
+                )
+                return await manager.list_tasks()
+
+        tasks = asyncio.run(scenario())
+
+        assert sorted(t.id for t in tasks) == list(range(1, 21))
+        assert threads and all(name.startswith("todo-io") for name in threads)
+        assert TodoManager(JournalStorage(storage.path)).count_tasks() == 20
+
+    def test_plain_manager_uses_single_thread(self):
+        """Test that a non-thread-safe manager is never called concurrently."""
+        manager = AsyncTodoManager(TodoManager(), max_workers=8, offload=True)
+
+        async def scenario():
+            await asyncio.gather(*(manager.add_task(title="T") for _ in range(50)))
+            await manager.close()
+
+        asyncio.run(scenario())
+
+        assert manager._max_workers == 1
+        assert manager.manager.count_tasks() == 50
+
+    @pytest.mark.parametrize(
+        ("operation", "args"),
+        [("top_k", (3,)), ("search", ("milk",)), ("delta", ())],
+    )
+    def test_indexed_operations_need_todo_manager(self, tmp_path, operation, args):
+        """Test that top_k/search/delta on a SqliteTodoManager fail clearly."""
+        manager = AsyncTodoManager(SqliteTodoManager(str(tmp_path / "tasks.db")))
+
+        async def scenario():
+            async with manager:
+                await getattr(manager, operation)(*args)
+
+        with pytest.raises(NotImplementedError, match="SqliteTodoManager"):
+            asyncio.run(scenario())
+
+    def test_sqlite_manager_runs_on_pool(self, tmp_path):
+        """Test that a SqliteTodoManager is offloaded to one pool thread."""
+        manager = AsyncTodoManager(SqliteTodoManager(str(tmp_path / "tasks.db")))
+
+        async def scenario():
+            await asyncio.gather(*(manager.add_task(title="T") for _ in range(10)))
+            await manager.mark_complete(1)
+            task = await manager.get_task(1)
+            count = await manager.count_tasks("pending")
+            await manager.close()
+            return task, count
+
+        task, count = asyncio.run(scenario())
+
+        assert (manager.offload, manager._max_workers) == (True, 1)
+        assert (task.completed, count) == (True, 9)
+
+    def test_iter_tasks_pages(self):
+        """Test that the async iterator streams every page."""
+
+        async def scenario(offload):
+            manager = AsyncTodoManager(offload=offload)
+            for i in range(25):
+                await manager.add_task(title=f"Task {i}")
+            await manager.mark_complete(3)
+            ids = [t.id async for t in manager.iter_tasks(page_size=10)]
+            pending = [t.id async for t in manager.iter_tasks("pending", after_id=20)]
+            await manager.close()
+            return ids, pending
+
+        for offload in (False, True):
+            ids, pending = asyncio.run(scenario(offload))
+            assert ids == list(range(1, 26))
+            assert pending == [21, 22, 23, 24, 25]
+
+    def test_sorted_listing(self):
+        """Test that sort and creation ranges are passed through."""
+
+        async def scenario():
+            async with AsyncTodoManager() as manager:
+                await manager.add_task(title="beta")
+                await manager.add_task(title="Alpha")
+                return await manager.list_tasks(
+                    sort="title", created_from=datetime(2000, 1, 1)
+                )
+
+        assert [t.title for t in asyncio.run(scenario())] == ["Alpha", "beta"]
+
+    def test_delta(self):
+        """Test that delta() is passed through."""
+
+        async def scenario():
+            async with AsyncTodoManager() as manager:
+                await manager.add_task(title="One")
+                await manager.add_task(title="Two")
+                return await manager.delta(1)
+
+        delta = asyncio.run(scenario())
+        assert (delta.version, [t.title for t in delta.changed]) == (2, ["Two"])
@@ -0,0 +1,184 @@
+"""
+Unit tests for the TodoManager change feed.
+
+Target: 100% code coverage for changes.py
+"""
+
+import pytest
+
+from todo_app.changes import ChangeFeed
+from todo_app.exceptions import (
+    ChangesExpiredError,
+    InvalidTaskDataError,
+    TaskNotFoundException,
+)
+from todo_app.manager import TodoManager
+from todo_app.models import Task
+
+
+def ops(events) -> list[tuple[int, str, int]]:
+    """Return (seq, op, task ID) for each event."""
+    return [(event.seq, event.op, event.task_id) for event in events]
+
+
+class TestChangeFeed:
+    """Test suite for the ring buffer and subscribers."""
+
+    def test_changes_since(self):
+        """Test that events after a sequence number are returned in order."""
+        feed = ChangeFeed()
+        for i in range(1, 6):
+            feed.emit("add", Task(id=i, title=f"Task {i}"))
+
+        assert feed.last_seq == 5
+        assert ops(feed.changes_since(3)) == [(4, "add", 4), (5, "add", 5)]
+        assert len(feed.changes_since(0)) == 5
+        assert feed.changes_since(5) == []
+
+    def test_ring_buffer_drops_oldest(self):
+        """Test that a full buffer keeps only the latest capacity events."""
+        feed = ChangeFeed(capacity=3)
+        assert feed.first_seq == 1
+        for i in range(1, 6):
+            feed.emit("add", Task(id=i, title="Task"))
+
+        assert feed.first_seq == 3
+        assert [event.seq for event in feed.changes_since(2)] == [3, 4, 5]
+        with pytest.raises(ChangesExpiredError, match="oldest kept: 3"):
+            feed.changes_since(1)
+
+    def test_invalid_arguments(self):
+        """Test that bad capacities and sequence numbers are rejected."""
+        with pytest.raises(ValueError, match="capacity"):
+            ChangeFeed(capacity=0)
+        feed = ChangeFeed()
+        with pytest.raises(ValueError, match="outside"):
+            feed.changes_since(1)
+        with pytest.raises(ValueError, match="outside"):
+            feed.changes_since(-1)
+
+    def test_resumes_numbering(self):
+        """Test a feed continuing the sequence of an earlier one."""
+        feed = ChangeFeed(last_seq=7)
+
+        assert feed.changes_since(7) == []
+        with pytest.raises(ChangesExpiredError, match="oldest kept: 8"):
+            feed.changes_since(6)
+        assert feed.emit("add", Task(id=1, title="One")) == 8
+        with pytest.raises(ValueError, match="negative"):
+            ChangeFeed(last_seq=-1)
+
+    def test_subscribe_and_unsubscribe(self):
+        """Test that subscribers see events until they unsubscribe."""
+        feed = ChangeFeed()
+        first, second = [], []
+        unsubscribe = feed.subscribe(first.append)
+        feed.subscribe(second.append)
+
+        feed.emit("add", Task(id=1, title="One"))
+        unsubscribe()
+        feed.emit("delete", Task(id=1, title="One"))
+
+        assert ops(first) == [(1, "add", 1)]
+        assert ops(second) == [(1, "add", 1), (2, "delete", 1)]
+
+    def test_failing_subscriber_is_logged(self, caplog):
+        """Test that a raising subscriber neither fails emit nor starves others."""
+        feed = ChangeFeed()
+        seen = []
+
+        def fail(event):
+            raise RuntimeError("boom")
+
+        feed.subscribe(fail)
+        feed.subscribe(seen.append)
+
+        assert feed.emit("add", Task(id=1, title="One")) == 1
+        assert ops(seen) == [(1, "add", 1)]
+        assert "subscriber" in caplog.text
+        assert "boom" in caplog.text
+
+    def test_event_to_dict(self):
+        """Test the JSON form of an event."""
+        task = Task(id=7, title="Report", description="Q3", completed=True)
+        feed = ChangeFeed()
+        feed.emit("complete", task)
+        (event,) = feed.changes_since(0)
+
+        assert event.to_dict() == {"seq": 1, "op": "complete", "task": task.to_dict()}
+
+
+class TestManagerEvents:
+    """Test suite for events emitted by TodoManager mutations."""
+
+    def test_every_mutation_emits(self):
+        """Test the events of each single-task mutation."""
+        manager = TodoManager()
+        task = manager.add_task(title="Draft")
+        manager.update_task(task.id, title="Report")
+        manager.mark_complete(task.id)
+        manager.mark_incomplete(task.id)
+        manager.toggle_complete(task.id)
+        manager.delete_task(task.id)
+
+        events = manager.changes.changes_since(0)
+        assert ops(events) == [
+            (1, "add", 1),
+            (2, "update", 1),
+            (3, "complete", 1),
+            (4, "incomplete", 1),
+            (5, "toggle", 1),
+            (6, "delete", 1),
+        ]
+        # Events snapshot the task; later changes do not alter them
+        assert (events[0].title, events[1].title) == ("Draft", "Report")
+        assert [event.completed for event in events[2:]] == [True, False, True, True]
+
+    def test_failed_mutations_emit_nothing(self):
+        """Test that rejected changes leave the feed untouched."""
+        manager = TodoManager()
+        with pytest.raises(InvalidTaskDataError):
+            manager.add_task(title="")
+        with pytest.raises(TaskNotFoundException):
+            manager.delete_task(1)
+
+        assert manager.changes.last_seq == 0
+
+    def test_bulk_import_and_transactions_emit(self):
+        """Test that bulk operations, imports and transactions emit per task."""
+        manager = TodoManager()
+        manager.import_tasks([{"title": "One"}, {"title": "Two"}])
+        manager.bulk_complete([1, 2, 99])
+        with manager.transaction() as tx:
+            tx.update_task(1, title="First")
+            tx.delete_task(2)
+            tx.add_task(title="Three")
+
+        assert [event.op for event in manager.changes.changes_since(0)] == [
+            "add",
+            "add",
+            "complete",
+            "complete",
+            "update",
+            "delete",
+            "add",
+        ]
+
+    def test_subscriber_syncs_a_cache(self):
+        """Test that a subscriber can mirror the manager incrementally."""
+        manager = TodoManager()
+        cache: dict[int, str] = {}
+
+        def apply(event):
+            if event.op == "delete":
+                cache.pop(event.task_id, None)
+            else:
+                cache[event.task_id] = event.title
+
+        manager.changes.subscribe(apply)
+        manager.add_task(title="One")
+        manager.add_task(title="Two")
+        manager.update_task(2, title="Second")
+        manager.delete_task(1)
+
+        assert cache == {2: "Second"}
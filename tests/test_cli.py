@@ -0,0 +1,302 @@
+"""
+Unit tests for the command-line interface.
+
+Target: batch mode and output formats in cli.py
+"""
+
+import io
+import json
+import sys
+
+import pytest
+
+from todo_app.cli import TodoCLI, _parse_batch_line
+from todo_app.manager import TodoManager
+from todo_app.sqlite_manager import SqliteTodoManager
+
+
+def run_batch(script: str, monkeypatch) -> tuple[TodoCLI, int]:
+    """Run a batch script from stdin and return the CLI and exit code."""
+    cli = TodoCLI(TodoManager())
+    monkeypatch.setattr(sys, "stdin", io.StringIO(script))
+    try:
+        cli.run(["batch"])
+    except SystemExit as e:
+        return cli, e.code
+    return cli, 0
+
+
+class TestBatch:
+    """Test suite for todo batch."""
+
+    def test_runs_every_command(self, monkeypatch, capsys):
+        """Test that all lines run against one manager."""
+        script = 'add "Buy milk" -d "2 litres"\nadd Walk\ncomplete 1\n'
+        cli, code = run_batch(script, monkeypatch)
+
+        assert code == 0
+        assert cli.manager.get_task(1).completed
+        assert cli.manager.get_task(1).description == "2 litres"
+        assert "Ran 3 commands (0 failed)" in capsys.readouterr().out
+
+    def test_json_lines(self, monkeypatch):
+        """Test that JSON array lines are accepted alongside shell lines."""
+        script = json.dumps(["add", "Quote \" and 'both'"]) + "\ntodo add Two\n"
+        cli, code = run_batch(script, monkeypatch)
+
+        assert code == 0
+        assert [t.title for t in cli.manager.list_tasks()] == [
+            "Quote \" and 'both'",
+            "Two",
+        ]
+
+    def test_errors_are_collected(self, monkeypatch, capsys):
+        """Test that failing commands do not stop the batch."""
+        script = "add One\nget 99\nget abc\nadd Two\n"
+        cli, code = run_batch(script, monkeypatch)
+
+        captured = capsys.readouterr()
+        assert code == 1
+        assert cli.manager.count_tasks() == 2
+        assert "Ran 4 commands (2 failed)" in captured.out
+        assert "❌ Line 2: Task with ID 99 not found" in captured.err
+        assert "❌ Line 3:" in captured.err
+
+    def test_output_is_written_once(self, monkeypatch, capsys):
+        """Test that command output is buffered until the batch ends."""
+        cli = TodoCLI(TodoManager())
+        monkeypatch.setattr(sys, "stdin", io.StringIO("add One\nadd Two\n"))
+        writes = []
+        monkeypatch.setattr(sys.stdout, "write", writes.append)
+
+        cli.run(["batch"])
+
+        assert len(writes) == 1
+        assert writes[0].count("Task added successfully") == 2
+
+    def test_comments_and_blank_lines(self, monkeypatch, capsys):
+        """Test that blank lines and comments are skipped."""
+        cli, code = run_batch("# setup\n\nadd One  # first\n", monkeypatch)
+
+        assert code == 0
+        assert cli.manager.get_task(1).title == "One"
+        assert "Ran 1 commands" in capsys.readouterr().out
+
+    def test_unparsable_and_nested_lines(self, monkeypatch, capsys):
+        """Test that bad quoting, bad JSON and nested batches are errors."""
+        script = 'add "unterminated\n["add", 1]\nbatch\nserve\n'
+        _, code = run_batch(script, monkeypatch)
+
+        err = capsys.readouterr().err
+        assert code == 1
+        assert [line[:8] for line in err.splitlines()] == [
+            "❌ Line 1",
+            "❌ Line 2",
+            "❌ Line 3",
+            "❌ Line 4",
+        ]
+
+    def test_reads_file(self, tmp_path, capsys):
+        """Test that -f reads commands from a file."""
+        script = tmp_path / "tasks.todo"
+        script.write_text("add One\nadd Two\n")
+        cli = TodoCLI(TodoManager())
+
+        cli.run(["batch", "-f", str(script)])
+
+        assert cli.manager.count_tasks() == 2
+
+    def test_missing_file(self, tmp_path):
+        """Test that an unreadable file exits with an error."""
+        with pytest.raises(SystemExit) as excinfo:
+            TodoCLI(TodoManager()).run(["batch", "-f", str(tmp_path / "none")])
+        assert excinfo.value.code == 1
+
+    def test_parse_batch_line(self):
+        """Test line parsing rules."""
+        assert _parse_batch_line("  ") is None
+        assert _parse_batch_line("todo") is None
+        assert _parse_batch_line("todo list -s pending") == [
+            "list",
+            "-s",
+            "pending",
+        ]
+        assert _parse_batch_line('["get", "1"]') == ["get", "1"]
+
+
+class TestListFormats:
+    """Test suite for machine-readable listing output."""
+
+    def test_list_json(self, capsys):
+        """Test that list --format json prints only a JSON array."""
+        cli = TodoCLI(TodoManager())
+        cli.manager.add_task(title="One")
+        cli.manager.add_task(title="Two")
+
+        cli.run(["list", "--format", "json", "--limit", "1"])
+
+        tasks = json.loads(capsys.readouterr().out)
+        assert [task["title"] for task in tasks] == ["One"]
+
+    def test_search_tsv(self, capsys):
+        """Test that search --format tsv prints a header and matching rows."""
+        cli = TodoCLI(TodoManager())
+        cli.manager.add_task(title="Buy milk")
+        cli.manager.add_task(title="Walk dog")
+
+        cli.run(["search", "milk", "--format", "tsv"])
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert lines[1].startswith("1\tfalse\tBuy milk\t")
+
+    @pytest.mark.parametrize("command", ["list", "search"])
+    def test_negative_limit(self, command, capsys):
+        """Test that a negative --limit is a usage error."""
+        argv = [command, "--limit", "-5"] + (["milk"] if command == "search" else [])
+        with pytest.raises(SystemExit) as excinfo:
+            TodoCLI(TodoManager()).run(argv)
+        assert excinfo.value.code == 2
+        assert "must not be negative" in capsys.readouterr().err
+
+    def test_list_text_is_decorated(self, capsys):
+        """Test that the default text format keeps headers and summary."""
+        cli = TodoCLI(TodoManager())
+        cli.manager.add_task(title="One", description="First")
+
+        cli.run(["list"])
+
+        out = capsys.readouterr().out
+        assert "[1] ☐ One\n    First\n" in out
+        assert "📊 Total: 1 tasks" in out
+
+
+class TestStats:
+    """Test suite for todo stats."""
+
+    def test_task_counts(self, capsys):
+        """Test that stats prints task totals."""
+        cli = TodoCLI(TodoManager())
+        cli.manager.add_task(title="One")
+        cli.manager.mark_complete(cli.manager.add_task(title="Two").id)
+
+        cli.run(["stats"])
+
+        out = capsys.readouterr().out
+        assert "Total: 2 tasks" in out
+        assert "Completed: 1" in out
+
+    def test_metrics(self, monkeypatch, capsys):
+        """Test that TODO_METRICS instruments the manager the CLI creates."""
+        monkeypatch.setenv("TODO_METRICS", "1")
+        cli = TodoCLI()
+        cli.run(["add", "One"])
+        with pytest.raises(SystemExit):
+            cli.run(["get", "99"])
+        capsys.readouterr()
+
+        cli.run(["stats", "--metrics"])
+
+        out = capsys.readouterr().out
+        assert 'todo_manager_calls_total{method="add_task"} 1' in out
+        assert (
+            'todo_manager_errors_total{method="get_task",'
+            'exception="TaskNotFoundException"} 1'
+        ) in out
+
+    def test_metrics_off(self, monkeypatch, capsys):
+        """Test that stats --metrics explains how to enable instrumentation."""
+        monkeypatch.delenv("TODO_METRICS", raising=False)
+        TodoCLI().run(["stats", "--metrics"])
+        assert "TODO_METRICS=1" in capsys.readouterr().out
+
+
+class TestListOrder:
+    """Test suite for list --sort, --since and --until."""
+
+    @staticmethod
+    def make_cli() -> TodoCLI:
+        """Return a CLI whose tasks were created on different days."""
+        cli = TodoCLI(TodoManager())
+        cli.manager.import_tasks(
+            [
+                {"id": 1, "title": "beta", "created_at": "2026-10-02T12:00:00"},
+                {"id": 2, "title": "Alpha", "created_at": "2026-10-01T12:00:00"},
+                {"id": 3, "title": "gamma", "created_at": "2026-10-03T12:00:00"},
+            ]
+        )
+        return cli
+
+    def test_sort_and_range(self, capsys):
+        """Test ordering by title within a creation range."""
+        cli = self.make_cli()
+
+        cli.run(
+            [
+                "list",
+                "--sort=-title",
+                "--since",
+                "2026-10-01",
+                "--until",
+                "2026-10-03",
+                "--format",
+                "tsv",
+            ]
+        )
+
+        rows = capsys.readouterr().out.splitlines()[1:]
+        assert [row.split("\t")[2] for row in rows] == ["beta", "Alpha"]
+
+    def test_next_page_hint_follows_sort(self, capsys):
+        """Test that --after pages through a sorted listing."""
+        cli = self.make_cli()
+
+        cli.run(["list", "--sort", "created", "--limit", "1"])
+        assert "--after 2" in capsys.readouterr().out
+        cli.run(["list", "--sort", "created", "--after", "2", "--format", "json"])
+        assert [t["id"] for t in json.loads(capsys.readouterr().out)] == [1, 3]
+
+    def test_invalid_date(self, capsys):
+        """Test that an unparsable --since is a usage error."""
+        with pytest.raises(SystemExit) as excinfo:
+            self.make_cli().run(["list", "--since", "yesterday"])
+        assert excinfo.value.code == 2
+        assert "invalid date/time" in capsys.readouterr().err
+
+    def test_after_missing_task(self, capsys):
+        """Test that a sorted page after a deleted task is an error."""
+        with pytest.raises(SystemExit) as excinfo:
+            self.make_cli().run(["list", "--sort", "title", "--after", "9"])
+        assert excinfo.value.code == 1
+        assert "not found" in capsys.readouterr().err
+
+
+class TestSqliteBackend:
+    """Test suite for commands run against a SqliteTodoManager."""
+
+    def test_multi_id_complete_and_delete(self, capsys):
+        """Test that several IDs use the SQLite bulk operations."""
+        cli = TodoCLI(SqliteTodoManager())
+        for title in ("One", "Two", "Three"):
+            cli.manager.add_task(title=title)
+
+        cli.run(["complete", "1", "2"])
+        cli.run(["delete", "2", "3"])
+
+        assert "Marked 2 tasks as complete" in capsys.readouterr().out
+        assert [(t.id, t.completed) for t in cli.manager.list_tasks()] == [(1, True)]
+
+    def test_list_with_sort_and_range(self, capsys):
+        """Test that list options reach SqliteTodoManager.list_tasks."""
+        cli = TodoCLI(SqliteTodoManager())
+        for title in ("beta", "Alpha", "gamma"):
+            cli.manager.add_task(title=title)
+
+        cli.run(["list"])
+        cli.run(["list", "--sort", "title", "--limit", "1", "--format", "tsv"])
+        cli.run(["list", "--since", "2000-01-01", "--until", "2000-01-02"])
+
+        out = capsys.readouterr().out
+        assert "gamma" in out
+        assert "\tAlpha\t" in out
+        assert "No all tasks found" in out
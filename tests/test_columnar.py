@@ -0,0 +1,173 @@
+"""
+Unit tests for the ColumnarTaskStore class.
+
+Target: 100% code coverage for columnar.py
+"""
+
+import random
+
+import pytest
+
+from todo_app.columnar import ColumnarTaskStore
+from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
+from todo_app.manager import TodoManager
+
+
+@pytest.fixture
+def store():
+    """Return a store with three tasks, the second one completed."""
+    store = ColumnarTaskStore()
+    store.add_task(title="Buy milk", description="2 litres")
+    store.add_task(title="日本語タスク", description="説明: العربية")
+    store.add_task(title="Gym")
+    store.mark_complete(task_id=2)
+    return store
+
+
+class TestColumnarReads:
+    """Test suite for the list_tasks/get_task contract."""
+
+    def test_get_task_materializes_all_fields(self, store):
+        """Test that a task is rebuilt from the columns."""
+        task = store.get_task(2)
+
+        assert task.title == "日本語タスク"
+        assert task.description == "説明: العربية"
+        assert task.completed is True
+
+    def test_list_tasks_by_status(self, store):
+        """Test status filtering in ID order."""
+        assert [t.id for t in store.list_tasks()] == [1, 2, 3]
+        assert [t.id for t in store.list_tasks("pending")] == [1, 3]
+        assert [t.id for t in store.list_tasks("completed")] == [2]
+
+    def test_count_tasks_by_status(self, store):
+        """Test vectorized counting per status."""
+        store.delete_task(task_id=1)
+
+        assert store.count_tasks() == 2
+        assert store.count_tasks("pending") == 1
+        assert store.count_tasks("completed") == 1
+
+    def test_invalid_status_raises_error(self, store):
+        """Test that invalid status parameter raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid status"):
+            store.list_tasks(status="invalid")
+        with pytest.raises(ValueError, match="Invalid status"):
+            store.count_tasks(status="invalid")
+
+    @pytest.mark.parametrize(
+        "method", ["get_task", "delete_task", "mark_complete", "toggle_complete"]
+    )
+    def test_missing_task_raises_error(self, store, method):
+        """Test that unknown and deleted IDs raise TaskNotFoundException."""
+        store.delete_task(task_id=3)
+
+        for task_id in (0, 3, 99):
+            with pytest.raises(TaskNotFoundException):
+                getattr(store, method)(task_id)
+
+
+    def test_pagination(self, store):
+        """Test limit and after_id, including after a deleted row."""
+        store.delete_task(task_id=1)
+
+        assert [t.id for t in store.list_tasks(limit=1)] == [2]
+        assert [t.id for t in store.list_tasks(after_id=1)] == [2, 3]
+        assert [t.id for t in store.list_tasks(after_id=2)] == [3]
+        assert [t.id for t in store.iter_tasks("completed", after_id=2)] == []
+
+
+class TestColumnarWrites:
+    """Test suite for mutations on the columns."""
+
+    def test_update_task_appends_new_text(self, store):
+        """Test updating text and that validation failures change nothing."""
+        store.update_task(task_id=1, title="Buy oat milk")
+
+        assert store.get_task(1).title == "Buy oat milk"
+        assert store.get_task(1).description == "2 litres"
+        with pytest.raises(InvalidTaskDataError):
+            store.update_task(task_id=1, title="")
+        assert store.get_task(1).title == "Buy oat milk"
+
+    def test_completion_methods(self, store):
+        """Test complete, incomplete and toggle."""
+        store.mark_incomplete(task_id=2)
+        assert store.get_task(2).completed is False
+        store.toggle_complete(task_id=2)
+        assert store.get_task(2).completed is True
+
+    def test_deleted_ids_not_reused(self, store):
+        """Test that IDs keep increasing after deletes and compaction."""
+        store.delete_task(task_id=3)
+        store.compact()
+
+        assert store.add_task(title="Next").id == 4
+
+    def test_compact_reclaims_tombstones_and_text(self, store):
+        """Test that compaction keeps live data and shrinks the arena."""
+        store.update_task(task_id=1, title="x" * 200)
+        store.update_task(task_id=1, title="Short")
+        store.delete_task(task_id=3)
+        before = [t.to_dict() for t in store.list_tasks()]
+        arena_before = len(store._arena)
+
+        store.compact()
+
+        assert [t.to_dict() for t in store.list_tasks()] == before
+        assert len(store._arena) < arena_before
+        assert len(store._ids) == 2
+
+    def test_matches_todo_manager_under_random_operations(self):
+        """Property test: the store agrees with TodoManager."""
+        rng = random.Random(7)
+        manager = TodoManager()
+        store = ColumnarTaskStore()
+        for _ in range(500):
+            ids = [t.id for t in manager.list_tasks()]
+            op = rng.choice(["add", "add", "delete_task", "toggle_complete", "update"])
+            if op == "add" or not ids:
+                title = f"Task {rng.random()}"
+                manager.add_task(title=title)
+                store.add_task(title=title)
+            elif op == "update":
+                task_id = rng.choice(ids)
+                manager.update_task(task_id=task_id, description="changed")
+                store.update_task(task_id=task_id, description="changed")
+            else:
+                task_id = rng.choice(ids)
+                getattr(manager, op)(task_id)
+                getattr(store, op)(task_id)
+
+        def fields(tasks):
+            return [(t.id, t.title, t.description, t.completed) for t in tasks]
+
+        for status in ("all", "pending", "completed"):
+            assert fields(store.list_tasks(status)) == fields(manager.list_tasks(status))
+
+
+class TestFromTasks:
+    """Test suite for bulk-loading a store."""
+
+    def test_from_tasks_copies_manager_contents(self):
+        """Test converting a TodoManager's tasks into columns."""
+        manager = TodoManager()
+        for i in range(5):
+            manager.add_task(title=f"Task {i}")
+        manager.delete_task(task_id=2)
+
+        store = ColumnarTaskStore.from_tasks(manager.list_tasks())
+
+        assert [t.to_dict() for t in store.list_tasks()] == [
+            t.to_dict() for t in manager.list_tasks()
+        ]
+
+    def test_from_tasks_requires_ascending_ids(self):
+        """Test that out-of-order IDs are rejected."""
+        manager = TodoManager()
+        task1 = manager.add_task(title="A")
+        task2 = manager.add_task(title="B")
+
+        with pytest.raises(ValueError, match="ascending"):
+            ColumnarTaskStore.from_tasks([task2, task1])
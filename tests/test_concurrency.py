@@ -0,0 +1,169 @@
+"""
+Unit tests for the readers-writer lock and ThreadSafeTodoManager.
+
+Target: 100% code coverage for concurrency.py
+"""
+
+import io
+import threading
+
+from todo_app.concurrency import RWLock, ThreadSafeTodoManager
+from todo_app.manager import ITER_PAGE_SIZE
+
+
+def run_threads(count: int, target) -> None:
+    """Run target(index) in count threads and wait for all of them."""
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+
+class TestRWLock:
+    """Test suite for shared and exclusive locking."""
+
+    def test_readers_share_the_lock(self):
+        """Test that several readers hold the lock at the same time."""
+        lock = RWLock()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def reader(_):
+            with lock.reading():
+                barrier.wait()  # only passes if all three hold the lock
+
+        run_threads(3, reader)
+
+    def test_writer_excludes_readers(self):
+        """Test that a reader waits until the writer releases the lock."""
+        lock = RWLock()
+        events = []
+        lock.acquire_write()
+
+        reader = threading.Thread(
+            target=lambda: (lock.acquire_read(), events.append("read"))
+        )
+        reader.start()
+        reader.join(timeout=0.05)
+        events.append("write done")
+        lock.release_write()
+        reader.join(timeout=5)
+        lock.release_read()
+
+        assert events == ["write done", "read"]
+
+    def test_waiting_writer_blocks_new_readers(self):
+        """Test writer preference: new readers queue behind a waiting writer."""
+        lock = RWLock()
+        events = []
+        lock.acquire_read()
+
+        def writer():
+            with lock.writing():
+                events.append("write")
+
+        def late_reader():
+            with lock.reading():
+                events.append("read")
+
+        writer_thread = threading.Thread(target=writer)
+        writer_thread.start()
+        while not lock._waiting_writers:
+            pass
+        reader_thread = threading.Thread(target=late_reader)
+        reader_thread.start()
+        reader_thread.join(timeout=0.05)
+        lock.release_read()
+        writer_thread.join(timeout=5)
+        reader_thread.join(timeout=5)
+
+        assert events == ["write", "read"]
+
+
+class TestThreadSafeTodoManager:
+    """Test suite for concurrent use of the manager."""
+
+    def test_concurrent_adds_get_unique_ids(self):
+        """Test that IDs are allocated atomically across threads."""
+        manager = ThreadSafeTodoManager()
+
+        def add(index):
+            for i in range(200):
+                manager.add_task(title=f"Task {index}-{i}")
+
+        run_threads(8, add)
+
+        ids = [task.id for task in manager.list_tasks()]
+        assert ids == list(range(1, 1601))
+        assert manager.count_tasks() == manager.stats().total == 1600
+
+    def test_mixed_readers_and_writers(self):
+        """Test that indexes stay consistent under concurrent mutation."""
+        manager = ThreadSafeTodoManager()
+        for i in range(500):
+            manager.add_task(title=f"Task {i}")
+
+        def work(index):
+            for task_id in range(index + 1, 501, 4):
+                if index % 2:
+                    manager.toggle_complete(task_id)
+                    manager.update_task(task_id, description="changed")
+                else:
+                    manager.get_task(task_id)
+                    manager.list_tasks("pending", limit=10, after_id=task_id)
+                    manager.search("task")
+
+        run_threads(4, work)
+
+        stats = manager.stats()
+        completed = manager.list_tasks("completed")
+        assert stats.completed == len(completed) == 250
+        assert all(task.completed for task in completed)
+
+    def test_iter_and_export_page_through_lock(self):
+        """Test that streaming spans pages and sees concurrent writes."""
+        manager = ThreadSafeTodoManager()
+        for i in range(ITER_PAGE_SIZE + 5):
+            manager.add_task(title=f"Task {i}")
+
+        tasks = manager.iter_tasks(after_id=1)
+        assert next(tasks).id == 2
+        manager.add_task(title="Late")  # does not deadlock mid-iteration
+        assert sum(1 for _ in tasks) == ITER_PAGE_SIZE + 4
+
+        out = io.StringIO()
+        assert manager.export_tasks(out, status="pending") == ITER_PAGE_SIZE + 6
+
+    def test_stats_is_a_snapshot(self):
+        """Test that created_per_day does not change after stats() returns."""
+        manager = ThreadSafeTodoManager()
+        manager.add_task(title="Task")
+        stats = manager.stats()
+
+        manager.add_task(title="Another")
+
+        assert sum(stats.created_per_day.values()) == 1
+
+    def test_search_builds_index_once(self):
+        """Test that the first search builds the index under the write lock."""
+        manager = ThreadSafeTodoManager()
+        manager.add_task(title="Buy groceries")
+
+        assert [t.id for t in manager.search("groc")] == [1]
+        assert manager._search_index is not None
+        assert [t.id for t in manager.search("buy")] == [1]
+        manager.close()
+
+    def test_sorted_listing_builds_index_once(self):
+        """Test that concurrent sorted listings see a complete title index."""
+        manager = ThreadSafeTodoManager()
+        for i in range(200):
+            manager.add_task(title=f"Task {199 - i:03d}")
+
+        results = []
+        run_threads(4, lambda _: results.append(manager.list_tasks(sort="title")))
+
+        assert list(manager._sort_indexes) == ["title"]
+        expected = list(range(200, 0, -1))
+        assert all([t.id for t in tasks] == expected for tasks in results)
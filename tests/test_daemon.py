@@ -0,0 +1,233 @@
+"""
+Unit tests for the CLI daemon and its socket-forwarding client.
+
+Target: 100% code coverage for daemon.py
+"""
+
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+
+import pytest
+
+from todo_app import daemon
+from todo_app.cli import TodoCLI
+from todo_app.daemon import DaemonServer
+from todo_app.exceptions import DaemonError
+from todo_app.manager import TodoManager
+
+
+@pytest.fixture
+def socket_path():
+    """Return a short socket path (AF_UNIX paths are length-limited)."""
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, "todo.sock")
+
+
+@pytest.fixture
+def server(socket_path):
+    """Run a daemon serving a fresh in-memory manager in a background thread."""
+    worker = TodoCLI(TodoManager())
+    server = DaemonServer(socket_path, worker.execute_request)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join(timeout=5)
+    server.server_close()
+
+
+def send(path: str, argv: list[str], **extra) -> dict:
+    """Send one command to the daemon and return its response."""
+    return daemon.request(path, {"argv": argv, **extra})
+
+
+class TestDaemonServer:
+    """Test suite for running commands in the daemon."""
+
+    def test_commands_share_state(self, server, socket_path):
+        """Test that state persists between forwarded commands."""
+        assert send(socket_path, ["add", "Buy milk"])["code"] == 0
+        send(socket_path, ["add", "Walk dog"])
+        send(socket_path, ["complete", "1"])
+
+        response = send(socket_path, ["list", "-s", "pending"])
+        assert response["code"] == 0
+        assert "Walk dog" in response["stdout"]
+        assert "Buy milk" not in response["stdout"]
+
+    def test_errors_return_exit_code_and_stderr(self, server, socket_path):
+        """Test that a failing command reports its stderr and exit code."""
+        response = send(socket_path, ["get", "99"])
+
+        assert response["code"] == 1
+        assert response["stdout"] == ""
+        assert "not found" in response["stderr"]
+
+    def test_argparse_errors_are_captured(self, server, socket_path):
+        """Test that usage errors do not stop the daemon."""
+        assert send(socket_path, ["get", "abc"])["code"] == 2
+        assert send(socket_path, ["add", "Still alive"])["code"] == 0
+
+    def test_stdin_is_forwarded(self, server, socket_path):
+        """Test that import - reads the stdin text sent with the request."""
+        lines = '{"title": "A"}\n{"title": "B"}\n'
+        response = send(socket_path, ["import", "-"], stdin=lines)
+
+        assert response["code"] == 0
+        assert "Imported 2 tasks" in response["stdout"]
+
+    def test_relative_paths_use_client_cwd(self, server, socket_path, tmp_path):
+        """Test that file arguments resolve against the client's directory."""
+        send(socket_path, ["add", "Buy milk"])
+        response = send(socket_path, ["export", "out.jsonl"], cwd=str(tmp_path))
+
+        assert response["code"] == 0
+        assert "Buy milk" in (tmp_path / "out.jsonl").read_text()
+
+    def test_missing_cwd_is_an_error(self, server, socket_path, tmp_path):
+        """Test that an unusable working directory is reported."""
+        response = send(socket_path, ["list"], cwd=str(tmp_path / "missing"))
+        assert response["code"] == 1
+
+    def test_serve_is_refused(self, server, socket_path):
+        """Test that a daemon cannot be started through another daemon."""
+        response = send(socket_path, ["serve", "--socket", "/tmp/x.sock"])
+        assert response["code"] == 1
+
+    def test_invalid_request(self, server, socket_path):
+        """Test that malformed requests get an error response."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(b'{"argv": "add"}\n')
+            response = json.loads(sock.makefile("rb").readline())
+        assert response["code"] == 2
+
+    def test_socket_is_owner_only(self, server, socket_path):
+        """Test that other users cannot connect to the socket."""
+        assert os.stat(socket_path).st_mode & 0o077 == 0
+
+    def test_socket_removed_on_close(self, socket_path):
+        """Test that closing the server removes the socket file."""
+        server = DaemonServer(socket_path, lambda request: {})
+        server.server_close()
+        assert not os.path.exists(socket_path)
+
+
+class TestStaleSockets:
+    """Test suite for starting a daemon on an existing path."""
+
+    def test_stale_socket_is_replaced(self, socket_path):
+        """Test that a socket file without a listener is removed."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        server = DaemonServer(socket_path, lambda request: {})
+        server.server_close()
+
+    def test_live_daemon_is_not_replaced(self, server, socket_path):
+        """Test that a second daemon refuses a path already being served."""
+        with pytest.raises(DaemonError, match="already running"):
+            DaemonServer(socket_path, lambda request: {})
+
+    def test_regular_file_is_not_replaced(self, socket_path):
+        """Test that a non-socket file at the path is left alone."""
+        with open(socket_path, "w") as fp:
+            fp.write("keep me")
+
+        with pytest.raises(DaemonError, match="not a socket"):
+            DaemonServer(socket_path, lambda request: {})
+        assert os.path.exists(socket_path)
+
+
+class TestClient:
+    """Test suite for forwarding commands from TodoCLI.run."""
+
+    def test_run_forwards_when_socket_set(
+        self, server, socket_path, monkeypatch, capsys
+    ):
+        """Test that TodoCLI.run sends commands to the daemon."""
+        monkeypatch.setenv("TODO_SOCKET", socket_path)
+        cli = TodoCLI()
+
+        cli.run(["add", "Buy milk"])
+        cli.run(["list"])
+
+        assert "Buy milk" in capsys.readouterr().out
+        assert cli.manager.count_tasks() == 0  # nothing ran locally
+        assert cli._parser is None  # the parser was never built
+
+    def test_forwarded_failure_exits(self, server, socket_path, monkeypatch, capsys):
+        """Test that the daemon's exit code becomes the client's."""
+        monkeypatch.setenv("TODO_SOCKET", socket_path)
+
+        with pytest.raises(SystemExit) as excinfo:
+            TodoCLI().run(["get", "42"])
+
+        assert excinfo.value.code == 1
+        assert "not found" in capsys.readouterr().err
+
+    def test_forward_sends_stdin(self, server, socket_path, monkeypatch):
+        """Test that the client ships stdin for import -."""
+        monkeypatch.setattr(sys, "stdin", io.StringIO('{"title": "A"}\n'))
+
+        assert daemon.forward(socket_path, ["import", "-"]) == 0
+        assert "A" in send(socket_path, ["list"])["stdout"]
+
+    def test_unreachable_daemon(self, socket_path, monkeypatch, capsys):
+        """Test that a missing daemon is a clear error, not a local run."""
+        monkeypatch.setenv("TODO_SOCKET", socket_path)
+
+        with pytest.raises(SystemExit) as excinfo:
+            TodoCLI().run(["list"])
+
+        assert excinfo.value.code == 1
+        assert "Cannot reach todo daemon" in capsys.readouterr().err
+
+    def test_injected_manager_runs_locally(self, socket_path, monkeypatch):
+        """Test that a CLI with its own manager ignores TODO_SOCKET."""
+        monkeypatch.setenv("TODO_SOCKET", socket_path)
+        cli = TodoCLI(TodoManager())
+
+        cli.run(["add", "Local"])
+
+        assert cli.manager.count_tasks() == 1
+
+    def test_default_socket_path(self, monkeypatch):
+        """Test the socket path defaults."""
+        monkeypatch.setenv("TODO_SOCKET", "/run/todo.sock")
+        assert daemon.default_socket_path() == "/run/todo.sock"
+
+        monkeypatch.delenv("TODO_SOCKET")
+        assert daemon.default_socket_path().endswith(f"todo-{os.getuid()}.sock")
+
+    def test_reads_stdin(self):
+        """Test which commands ship the client's stdin."""
+        assert daemon.reads_stdin(["import", "-"])
+        assert not daemon.reads_stdin(["import", "tasks.csv"])
+        assert daemon.reads_stdin(["batch"])
+        assert daemon.reads_stdin(["batch", "-f", "-"])
+        assert not daemon.reads_stdin(["batch", "-f", "script.todo"])
+        assert not daemon.reads_stdin(["batch", "--file=script.todo"])
+        assert daemon.reads_stdin(["batch", "--file=-"])
+        assert daemon.reads_stdin(["batch", "-f-"])
+        assert not daemon.reads_stdin(["batch", "-fscript.todo"])
+        assert not daemon.reads_stdin([])
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--fsync", "always", "import", "-"],
+            ["--journal", "tasks.journal", "batch"],
+            ["--journal", "batch", "batch", "--file", "-"],
+        ],
+    )
+    def test_reads_stdin_after_global_options(self, argv):
+        """Test that global options before the command are skipped."""
+        assert daemon.reads_stdin(argv)
+        assert not daemon.reads_stdin([*argv[:-1], "tasks.csv"])
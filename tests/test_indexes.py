@@ -0,0 +1,109 @@
+"""
+Unit tests for the SortedIndex container.
+
+Target: 100% code coverage for indexes.py
+"""
+
+import random
+
+from todo_app.indexes import SortedIndex
+
+
+class TestSortedIndexBasics:
+    """Test suite for inserting, removing and iterating keys."""
+
+    def test_empty_index(self):
+        """Test that a new index is empty."""
+        index = SortedIndex()
+
+        assert len(index) == 0
+        assert list(index) == []
+        assert 1 not in index
+
+    def test_bulk_load_sorts_and_deduplicates(self):
+        """Test that initial keys are sorted and duplicates dropped."""
+        index = SortedIndex([5, 3, 5, 1], load=2)
+
+        assert list(index) == [1, 3, 5]
+        assert len(index) == 3
+
+    def test_add_returns_false_for_duplicate(self):
+        """Test that adding an existing key is a no-op."""
+        index = SortedIndex([1, 2])
+
+        assert index.add(2) is False
+        assert index.add(0) is True
+        assert list(index) == [0, 1, 2]
+
+    def test_discard_missing_key_returns_false(self):
+        """Test that discarding a missing key is a no-op."""
+        index = SortedIndex([1, 3])
+
+        assert index.discard(2) is False
+        assert index.discard(9) is False
+        assert index.discard(3) is True
+        assert list(index) == [1]
+
+    def test_reversed_iteration(self):
+        """Test iterating keys in descending order."""
+        index = SortedIndex(range(10), load=3)
+
+        assert list(reversed(index)) == list(range(9, -1, -1))
+
+    def test_randomized_operations_match_sorted_set(self):
+        """Test random adds/discards against a reference set with tiny buckets."""
+        rng = random.Random(1234)
+        index = SortedIndex(load=4)
+        reference: set[int] = set()
+
+        for _ in range(2000):
+            key = rng.randrange(200)
+            if rng.random() < 0.6:
+                assert index.add(key) == (key not in reference)
+                reference.add(key)
+            else:
+                assert index.discard(key) == (key in reference)
+                reference.discard(key)
+
+            assert len(index) == len(reference)
+
+        assert list(index) == sorted(reference)
+        assert all(key in index for key in reference)
+
+
+class TestSortedIndexRanges:
+    """Test suite for range and positional queries."""
+
+    def test_irange_inclusive_bounds(self):
+        """Test that irange includes both bounds by default."""
+        index = SortedIndex(range(20), load=4)
+
+        assert list(index.irange(5, 9)) == [5, 6, 7, 8, 9]
+
+    def test_irange_exclusive_bounds(self):
+        """Test irange with exclusive bounds."""
+        index = SortedIndex(range(20), load=4)
+
+        assert list(index.irange(5, 9, inclusive=(False, False))) == [6, 7, 8]
+
+    def test_irange_unbounded_and_reverse(self):
+        """Test open-ended ranges in both directions."""
+        index = SortedIndex(range(10), load=3)
+
+        assert list(index.irange(minimum=7)) == [7, 8, 9]
+        assert list(index.irange(maximum=2, reverse=True)) == [2, 1, 0]
+        assert list(index.irange(3, 6, reverse=True)) == [6, 5, 4, 3]
+
+    def test_irange_outside_keys_is_empty(self):
+        """Test ranges that match nothing."""
+        index = SortedIndex([1, 2, 3])
+
+        assert list(index.irange(minimum=10)) == []
+        assert list(index.irange(2, 1)) == []
+        assert list(SortedIndex().irange()) == []
+
+    def test_tuple_keys(self):
+        """Test that composite keys order lexicographically."""
+        index = SortedIndex([("b", 2), ("a", 3), ("a", 1)])
+
+        assert list(index.irange(("a", 0), ("a", 99))) == [("a", 1), ("a", 3)]
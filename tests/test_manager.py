@@ -5,9 +5,17 @@ Following TDD principles: Tests written before implementation.
 Target: 100% code coverage for manager.py
 """
 
+import io
+import random
+from datetime import datetime, timedelta
+
 import pytest
 
-from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
+from todo_app.exceptions import (
+    ChangesExpiredError,
+    InvalidTaskDataError,
+    TaskNotFoundException,
+)
 from todo_app.manager import TodoManager
 from todo_app.models import Task
 
@@ -466,3 +474,634 @@ class TestToggleComplete:
 
         with pytest.raises(TaskNotFoundException):
             manager.toggle_complete(task_id=999)
+
+
+class TestStatusIndexes:
+    """Test suite for the status indexes behind filtered listing."""
+
+    @staticmethod
+    def assert_indexes_consistent(manager: TodoManager) -> None:
+        """Check that status indexes agree with manager.tasks."""
+        pending = [t.id for t in manager.tasks.values() if not t.completed]
+        completed = [t.id for t in manager.tasks.values() if t.completed]
+
+        assert [t.id for t in manager.list_tasks(status="pending")] == pending
+        assert [t.id for t in manager.list_tasks(status="completed")] == completed
+        assert manager.count_tasks(status="pending") == len(pending)
+        assert manager.count_tasks(status="completed") == len(completed)
+        assert manager.count_tasks() == len(manager.tasks)
+
+    def test_indexes_agree_with_tasks_under_random_operations(self):
+        """Property test: random mutation sequences keep indexes in sync."""
+        rng = random.Random(20251207)
+        manager = TodoManager()
+
+        for _ in range(1500):
+            ids = list(manager.tasks)
+            operation = rng.choice(
+                ["add", "add", "delete", "complete", "incomplete", "toggle"]
+            )
+            if operation == "add" or not ids:
+                manager.add_task(title=f"Task {rng.random()}")
+            elif operation == "delete":
+                manager.delete_task(task_id=rng.choice(ids))
+            elif operation == "complete":
+                manager.mark_complete(task_id=rng.choice(ids))
+            elif operation == "incomplete":
+                manager.mark_incomplete(task_id=rng.choice(ids))
+            else:
+                manager.toggle_complete(task_id=rng.choice(ids))
+
+            self.assert_indexes_consistent(manager)
+
+    def test_filtered_list_ordered_by_id_after_status_changes(self):
+        """Test that re-opened tasks keep creation order in filtered views."""
+        manager = TodoManager()
+        task1 = manager.add_task(title="First")
+        task2 = manager.add_task(title="Second")
+        manager.mark_complete(task_id=task1.id)
+        manager.mark_incomplete(task_id=task1.id)
+
+        pending = manager.list_tasks(status="pending")
+
+        assert [t.id for t in pending] == [task1.id, task2.id]
+
+    def test_count_tasks_with_invalid_status_raises_error(self):
+        """Test that count_tasks validates the status filter."""
+        manager = TodoManager()
+
+        with pytest.raises(ValueError, match="Invalid status"):
+            manager.count_tasks(status="done")
+
+
+class TestStats:
+    """Test suite for the stats() aggregate counters."""
+
+    def test_stats_empty_manager(self):
+        """Test that a new manager reports zero counters."""
+        stats = TodoManager().stats()
+
+        assert (stats.total, stats.completed, stats.pending) == (0, 0, 0)
+        assert dict(stats.created_per_day) == {}
+
+    def test_stats_track_completion_changes(self):
+        """Test that counters follow complete/incomplete/toggle/delete."""
+        manager = TodoManager()
+        task1 = manager.add_task(title="Task 1")
+        task2 = manager.add_task(title="Task 2")
+        task3 = manager.add_task(title="Task 3")
+        manager.mark_complete(task_id=task1.id)
+        manager.toggle_complete(task_id=task2.id)
+        manager.mark_incomplete(task_id=task2.id)
+        manager.delete_task(task_id=task3.id)
+
+        stats = manager.stats()
+
+        assert stats.total == 2
+        assert stats.completed == 1
+        assert stats.pending == 1
+
+    def test_stats_created_per_day_buckets(self):
+        """Test that tasks are bucketed by creation date and removed on delete."""
+        manager = TodoManager()
+        task1 = manager.add_task(title="Task 1")
+        manager.add_task(title="Task 2")
+        day = task1.created_at.date()
+
+        assert manager.stats().created_per_day[day] == 2
+
+        for task in manager.list_tasks():
+            manager.delete_task(task_id=task.id)
+
+        assert day not in manager.stats().created_per_day
+
+    def test_stats_created_per_day_is_read_only(self):
+        """Test that callers cannot mutate the manager's buckets."""
+        manager = TodoManager()
+        task = manager.add_task(title="Task")
+
+        buckets = manager.stats().created_per_day
+
+        with pytest.raises(TypeError):
+            buckets[task.created_at.date()] = 99  # type: ignore[index]
+
+
+class TestImportTasks:
+    """Test suite for bulk import_tasks."""
+
+    def test_import_assigns_sequential_ids_after_existing(self):
+        """Test that imported tasks continue the ID sequence."""
+        manager = TodoManager()
+        manager.add_task(title="Existing")
+
+        report = manager.import_tasks([{"title": "A"}, {"title": "B"}])
+
+        assert report.imported == 2
+        assert [t.id for t in manager.list_tasks()] == [1, 2, 3]
+        assert manager.add_task(title="Next").id == 4
+
+    def test_import_reports_invalid_rows_and_continues(self):
+        """Test that invalid rows are skipped with 1-based row numbers."""
+        manager = TodoManager()
+
+        report = manager.import_tasks(
+            [{"title": "A"}, {"title": ""}, {"title": "B", "completed": True}]
+        )
+
+        assert report.imported == 2
+        assert report.errors == [(2, "Title cannot be empty")]
+        assert not report.ok
+        assert manager.stats().completed == 1
+
+    def test_import_consumes_generator_lazily(self):
+        """Test that import accepts a one-shot generator."""
+        manager = TodoManager()
+
+        report = manager.import_tasks({"title": f"Task {i}"} for i in range(100))
+
+        assert report.imported == 100
+        assert manager.count_tasks(status="pending") == 100
+
+    def test_export_with_invalid_status_raises_error(self):
+        """Test that export_tasks validates the status filter."""
+        manager = TodoManager()
+
+        with pytest.raises(ValueError, match="Invalid status"):
+            manager.export_tasks(io.StringIO(), status="done")
+
+
+class TestPagination:
+    """Test suite for keyset pagination and lazy iteration."""
+
+    def make_manager(self, count: int = 10) -> TodoManager:
+        """Return a manager with count tasks; every third one completed."""
+        manager = TodoManager()
+        for i in range(1, count + 1):
+            manager.add_task(title=f"Task {i}")
+            if i % 3 == 0:
+                manager.mark_complete(task_id=i)
+        return manager
+
+    def test_limit_and_after_id(self):
+        """Test that limit and after_id select one page in ID order."""
+        manager = self.make_manager()
+
+        assert [t.id for t in manager.list_tasks(limit=3)] == [1, 2, 3]
+        assert [t.id for t in manager.list_tasks(limit=3, after_id=3)] == [4, 5, 6]
+        assert [t.id for t in manager.list_tasks(after_id=8)] == [9, 10]
+        assert manager.list_tasks(after_id=10) == []
+
+    def test_pages_with_status_filter(self):
+        """Test that paging respects the status filter."""
+        manager = self.make_manager()
+
+        completed = manager.list_tasks(status="completed", limit=2)
+        assert [t.id for t in completed] == [3, 6]
+        rest = manager.list_tasks(status="completed", after_id=completed[-1].id)
+        assert [t.id for t in rest] == [9]
+        assert [t.id for t in manager.list_tasks("pending", 2, after_id=3)] == [4, 5]
+
+    def test_after_deleted_id(self):
+        """Test that a cursor stays valid after its task is deleted."""
+        manager = self.make_manager()
+        manager.delete_task(task_id=4)
+
+        assert [t.id for t in manager.list_tasks(limit=2, after_id=4)] == [5, 6]
+
+    def test_paging_covers_all_tasks(self):
+        """Test that walking every page yields each task exactly once."""
+        manager = self.make_manager(count=2500)
+        for task_id in range(1, 2501, 7):
+            manager.delete_task(task_id=task_id)
+
+        seen: list[int] = []
+        after_id = None
+        while page := manager.list_tasks(limit=100, after_id=after_id):
+            seen.extend(t.id for t in page)
+            after_id = page[-1].id
+
+        assert seen == [t.id for t in manager.list_tasks()]
+        assert [t.id for t in manager.iter_tasks()] == seen
+
+    def test_iter_tasks_is_lazy_and_tolerates_mutation(self):
+        """Test that iter_tasks skips tasks deleted or changed mid-iteration."""
+        manager = self.make_manager(count=3000)
+        tasks = manager.iter_tasks(status="pending")
+
+        assert next(tasks).id == 1
+        manager.delete_task(task_id=2)
+        manager.mark_complete(task_id=2500)
+        ids = [t.id for t in tasks]
+
+        assert 2 not in ids
+        assert 2500 not in ids
+        assert ids[0] == 4
+
+    def test_iter_tasks_invalid_status_raises(self):
+        """Test that iter_tasks validates the status eagerly."""
+        manager = TodoManager()
+
+        with pytest.raises(ValueError):
+            manager.iter_tasks(status="archived")
+
+
+class TestBulkOperations:
+    """Test suite for bulk_complete, bulk_delete and bulk_update."""
+
+    def make_manager(self, count: int = 5) -> TodoManager:
+        """Return a manager with count pending tasks."""
+        manager = TodoManager()
+        for i in range(1, count + 1):
+            manager.add_task(title=f"Task {i}")
+        return manager
+
+    def test_bulk_complete_reports_per_id(self):
+        """Test that existing IDs change and missing ones are reported."""
+        manager = self.make_manager()
+
+        report = manager.bulk_complete([3, 1, 99, 3])
+
+        assert report.succeeded == [3, 1]
+        assert report.errors == [(99, "Task with ID 99 not found")]
+        assert not report.ok
+        assert [t.id for t in manager.list_tasks("completed")] == [1, 3]
+
+    def test_bulk_complete_atomic_changes_nothing_on_error(self):
+        """Test that an atomic batch with a bad ID is rejected as a whole."""
+        manager = self.make_manager()
+
+        report = manager.bulk_complete([1, 2, 99], atomic=True)
+
+        assert report.succeeded == []
+        assert [task_id for task_id, _ in report.errors] == [99]
+        assert manager.count_tasks("completed") == 0
+
+    def test_bulk_delete(self):
+        """Test deleting many tasks, atomically and not."""
+        manager = self.make_manager()
+
+        assert not manager.bulk_delete([1, 99], atomic=True).succeeded
+        report = manager.bulk_delete([1, 2, 99])
+
+        assert report.succeeded == [1, 2]
+        assert [t.id for t in manager.list_tasks()] == [3, 4, 5]
+        assert manager.stats().total == 3
+
+    def test_bulk_update_validates_every_entry(self):
+        """Test that invalid updates are reported and valid ones applied."""
+        manager = self.make_manager()
+
+        report = manager.bulk_update(
+            {
+                1: {"title": "New 1"},
+                2: {"title": ""},
+                3: {"description": "Details"},
+                99: {"title": "Ghost"},
+            }
+        )
+
+        assert report.succeeded == [1, 3]
+        assert [task_id for task_id, _ in report.errors] == [2, 99]
+        assert manager.get_task(1).title == "New 1"
+        assert manager.get_task(2).title == "Task 2"
+        assert manager.get_task(3).description == "Details"
+
+    def test_bulk_update_atomic(self):
+        """Test that one invalid update blocks an atomic batch."""
+        manager = self.make_manager()
+
+        report = manager.bulk_update(
+            {1: {"title": "New"}, 2: {"description": "x" * 1001}}, atomic=True
+        )
+
+        assert report.succeeded == []
+        assert manager.get_task(1).title == "Task 1"
+
+
+class TestSearch:
+    """Test suite for TodoManager.search and its incremental index."""
+
+    def test_search_finds_titles_and_descriptions(self):
+        """Test that search matches title and description words."""
+        manager = TodoManager()
+        manager.add_task(title="Buy groceries", description="Milk and eggs")
+        manager.add_task(title="Call plumber")
+
+        assert [t.id for t in manager.search("groceries")] == [1]
+        assert [t.id for t in manager.search("EGGS")] == [1]
+        assert [t.id for t in manager.search("pl")] == [2]
+
+    def test_search_unicode(self):
+        """Test that Unicode titles are searchable case-insensitively."""
+        manager = TodoManager()
+        manager.add_task(title="Réunion café 🎉")
+        manager.add_task(title="学习 Python")
+
+        assert [t.id for t in manager.search("CAFÉ")] == [1]
+        assert [t.id for t in manager.search("学习")] == [2]
+
+    def test_search_tracks_mutations(self):
+        """Test that add, update and delete keep the index current."""
+        manager = TodoManager()
+        manager.add_task(title="Draft report")
+        assert len(manager.search("draft")) == 1  # builds the index
+
+        manager.add_task(title="Review draft")
+        manager.update_task(1, title="Final report")
+        assert [t.id for t in manager.search("draft")] == [2]
+        assert [t.id for t in manager.search("final")] == [1]
+
+        manager.delete_task(2)
+        assert manager.search("draft") == []
+
+    def test_search_status_and_limit(self):
+        """Test filtering by status and limiting results."""
+        manager = TodoManager()
+        for i in range(5):
+            manager.add_task(title=f"Task {i}")
+        manager.mark_complete(2)
+        manager.mark_complete(4)
+
+        assert [t.id for t in manager.search("task", status="completed")] == [2, 4]
+        assert [t.id for t in manager.search("task", status="pending", limit=2)] == [
+            1,
+            3,
+        ]
+        assert len(manager.search("task", limit=3)) == 3
+
+    def test_search_invalid_status_raises(self):
+        """Test that an invalid status raises ValueError."""
+        manager = TodoManager()
+
+        with pytest.raises(ValueError):
+            manager.search("x", status="archived")
+
+
+class TestSortedListing:
+    """Test suite for list_tasks orders and creation ranges."""
+
+    @staticmethod
+    def make_manager() -> TodoManager:
+        """Return a manager whose creation order differs from ID order."""
+        manager = TodoManager()
+        manager.import_tasks(
+            [
+                {"id": 1, "title": "banana", "created_at": "2026-10-03T09:00:00"},
+                {"id": 2, "title": "Apple", "created_at": "2026-10-01T09:00:00"},
+                {"id": 3, "title": "cherry", "created_at": "2026-10-02T09:00:00"},
+                {"id": 4, "title": "apple", "created_at": "2026-10-04T09:00:00"},
+            ]
+        )
+        manager.mark_complete(3)
+        return manager
+
+    def test_sort_orders(self):
+        """Test every sort order, including case-insensitive titles."""
+        manager = self.make_manager()
+
+        def ids(sort):
+            return [t.id for t in manager.list_tasks(sort=sort)]
+
+        assert ids("id") == [1, 2, 3, 4]
+        assert ids("created") == [2, 3, 1, 4]
+        assert ids("-created") == [4, 1, 3, 2]
+        assert ids("title") == [2, 4, 1, 3]
+        assert ids("-title") == [3, 1, 4, 2]
+
+    def test_status_filter_and_limit(self):
+        """Test that oldest-pending-first skips other statuses."""
+        manager = self.make_manager()
+
+        pending = manager.list_tasks(status="pending", sort="created", limit=2)
+
+        assert [t.id for t in pending] == [2, 1]
+
+    def test_created_range(self):
+        """Test that created_from is inclusive and created_to exclusive."""
+        manager = self.make_manager()
+
+        tasks = manager.list_tasks(
+            sort="created",
+            created_from=datetime(2026, 10, 2, 9),
+            created_to=datetime(2026, 10, 4, 9),
+        )
+        assert [t.id for t in tasks] == [3, 1]
+
+        # Other orders sort the tasks in the range
+        in_range = dict(
+            created_from=datetime(2026, 10, 2), created_to=datetime(2026, 10, 5)
+        )
+        assert [t.id for t in manager.list_tasks(**in_range)] == [1, 3, 4]
+        assert [t.id for t in manager.list_tasks(sort="-title", **in_range)] == [
+            3,
+            1,
+            4,
+        ]
+
+    def test_pagination(self):
+        """Test that after_id continues from the last task of a page."""
+        manager = self.make_manager()
+
+        for sort in ("created", "-created", "title", "-title"):
+            expected = [t.id for t in manager.list_tasks(sort=sort)]
+            pages, after_id = [], None
+            while page := manager.list_tasks(sort=sort, limit=1, after_id=after_id):
+                pages.append(page[0].id)
+                after_id = page[0].id
+            assert pages == expected
+
+        since = datetime(2026, 10, 2)
+        first = manager.list_tasks(created_from=since, limit=2)
+        rest = manager.list_tasks(created_from=since, after_id=first[-1].id)
+        assert [t.id for t in first + rest] == [1, 3, 4]
+        rest = manager.list_tasks(created_from=since, sort="title", after_id=1)
+        assert [t.id for t in rest] == [3]
+
+    def test_after_missing_task_raises(self):
+        """Test that sorted pages need the previous page's last task."""
+        manager = self.make_manager()
+
+        with pytest.raises(TaskNotFoundException):
+            manager.list_tasks(sort="title", after_id=99)
+
+    def test_invalid_sort_raises(self):
+        """Test that an unknown order raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid sort"):
+            TodoManager().list_tasks(sort="priority")
+
+    def test_aware_and_naive_timestamps(self):
+        """Test that imported timezone-aware times sort with local ones."""
+        manager = TodoManager()
+        manager.import_tasks(
+            [{"id": 1, "title": "A", "created_at": "2020-01-01T00:00:00+00:00"}]
+        )
+        manager.add_task(title="B")
+
+        assert [t.id for t in manager.list_tasks(sort="-created")] == [2, 1]
+
+    def test_indexes_follow_mutations(self):
+        """Property test: sorted listings match sorting all tasks."""
+        rng = random.Random(20261017)
+        manager = TodoManager()
+        manager.list_tasks(sort="title")  # build the indexes up front
+        manager.list_tasks(sort="created")
+
+        for _ in range(500):
+            ids = list(manager.tasks)
+            operation = rng.choice(["add", "add", "delete", "update", "toggle"])
+            if operation == "add" or not ids:
+                manager.add_task(title=rng.choice("abcABC") + str(rng.random()))
+            elif operation == "delete":
+                manager.delete_task(rng.choice(ids))
+            elif operation == "update":
+                manager.update_task(rng.choice(ids), title=rng.choice("xyzXYZ"))
+            else:
+                manager.toggle_complete(rng.choice(ids))
+
+        tasks = list(manager.tasks.values())
+        by_title = sorted(tasks, key=lambda t: (t.title.casefold(), t.id))
+        by_created = sorted(tasks, key=lambda t: (t.created_at, t.id))
+        assert manager.list_tasks(sort="title") == by_title
+        assert manager.list_tasks(sort="created") == by_created
+        assert manager.list_tasks(status="completed", sort="-title") == [
+            t for t in reversed(by_title) if t.completed
+        ]
+
+
+class TestTopK:
+    """Test suite for top_k selection."""
+
+    @staticmethod
+    def make_manager(count: int) -> TodoManager:
+        """Return a manager with shuffled creation times and titles."""
+        rng = random.Random(20261017)
+        days = list(range(count))
+        rng.shuffle(days)
+        manager = TodoManager()
+        manager.import_tasks(
+            {
+                "id": i + 1,
+                "title": rng.choice("abcABC") + str(rng.random()),
+                "created_at": str(datetime(2026, 1, 1) + timedelta(hours=day)),
+            }
+            for i, day in enumerate(days)
+        )
+        return manager
+
+    @staticmethod
+    def expected(manager, k, by, status, reverse):
+        """Select top k by sorting everything."""
+
+        def key(task):
+            value = task.created_at if by == "created_at" else task.title.casefold()
+            return (value, task.id)
+
+        return sorted(manager.list_tasks(status), key=key, reverse=reverse)[:k]
+
+    @pytest.mark.parametrize("by", ["created_at", "title"])
+    @pytest.mark.parametrize("reverse", [False, True])
+    @pytest.mark.parametrize("completed_every", [2, 20])
+    def test_matches_full_sort(self, by, reverse, completed_every):
+        """Test index and heap paths against sorting all tasks."""
+        manager = self.make_manager(400)
+        for task_id in range(1, 401, completed_every):
+            manager.mark_complete(task_id)
+
+        for status in ("all", "pending", "completed"):
+            assert manager.top_k(15, by, status, reverse) == self.expected(
+                manager, 15, by, status, reverse
+            )
+
+    def test_heap_path_for_rare_status(self):
+        """Test that a rare status is selected without the sort index."""
+        manager = self.make_manager(100)
+        manager.mark_complete(7)
+
+        assert manager.top_k(3, status="completed") == [manager.get_task(7)]
+        assert "created" not in manager._sort_indexes
+
+    def test_edge_cases(self):
+        """Test k of zero, k beyond the count, and invalid arguments."""
+        manager = self.make_manager(5)
+
+        assert manager.top_k(0) == []
+        assert len(manager.top_k(50)) == 5
+        assert manager.top_k(100, status="all", reverse=True) == self.expected(
+            manager, 100, "created_at", "all", True
+        )
+        with pytest.raises(ValueError, match="Invalid field"):
+            manager.top_k(3, by="priority")
+        with pytest.raises(ValueError, match="negative"):
+            manager.top_k(-1)
+        with pytest.raises(ValueError, match="Invalid status"):
+            manager.top_k(3, status="done")
+
+
+class TestDeltaSync:
+    """Test suite for versions, tombstones and delta()."""
+
+    def test_delta_returns_only_changes(self):
+        """Test that a delta holds the tasks changed and IDs deleted since."""
+        manager = TodoManager()
+        for i in range(5):
+            manager.add_task(title=f"Task {i}")
+        synced = manager.version
+
+        manager.update_task(4, title="Renamed")
+        manager.mark_complete(2)
+        manager.delete_task(3)
+        manager.update_task(2, description="Changed twice")
+        delta = manager.delta(synced)
+
+        assert delta.version == manager.version == 9
+        assert [task.id for task in delta.changed] == [4, 2]
+        assert delta.changed[1].completed
+        assert delta.deleted == [3]
+        assert manager.delta(delta.version).changed == []
+
+    def test_full_sync_and_changed_then_deleted(self):
+        """Test since=0 and a task added and deleted between syncs."""
+        manager = TodoManager()
+        manager.add_task(title="Keep")
+        synced = manager.version
+        manager.add_task(title="Temporary")
+        manager.delete_task(2)
+
+        assert [t.title for t in manager.delta(0).changed] == ["Keep"]
+        delta = manager.delta(synced)
+        assert (delta.changed, delta.deleted) == ([], [2])
+
+    def test_transactions_and_bulk_operations(self):
+        """Test that batched mutations stamp every task they change."""
+        manager = TodoManager()
+        manager.import_tasks([{"title": "One"}, {"title": "Two"}, {"title": "Three"}])
+        synced = manager.version
+        manager.bulk_complete([1])
+        with manager.transaction() as tx:
+            tx.delete_task(2)
+
+        delta = manager.delta(synced)
+        assert ([t.id for t in delta.changed], delta.deleted) == ([1], [2])
+
+    def test_tombstone_retention(self, monkeypatch):
+        """Test that forgotten deletions force a full resync."""
+        monkeypatch.setattr("todo_app.manager.TOMBSTONE_RETENTION", 2)
+        manager = TodoManager()
+        for i in range(4):
+            manager.add_task(title=f"Task {i}")
+        for task_id in (1, 2, 3):
+            manager.delete_task(task_id)
+
+        assert manager.delta(5).deleted == [2, 3]
+        with pytest.raises(ChangesExpiredError, match="no longer tracked"):
+            manager.delta(4)
+
+    def test_invalid_versions(self):
+        """Test negative versions and versions ahead of the manager."""
+        manager = TodoManager()
+        manager.add_task(title="Task")
+
+        with pytest.raises(ValueError, match="negative"):
+            manager.delta(-1)
+        with pytest.raises(ChangesExpiredError, match="ahead"):
+            manager.delta(2)
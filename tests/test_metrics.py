@@ -0,0 +1,179 @@
+"""
+Unit tests for TodoManager instrumentation.
+
+Target: 100% code coverage for metrics.py
+"""
+
+import io
+import threading
+
+import pytest
+
+from todo_app.concurrency import ThreadSafeTodoManager
+from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
+from todo_app.manager import TodoManager
+from todo_app.metrics import (
+    FLUSH_SIZE,
+    Histogram,
+    Metrics,
+    instrument,
+    metrics_of,
+    uninstrument,
+)
+
+
+class TestHistogram:
+    """Test suite for fixed-bucket histograms."""
+
+    def test_bucket_edges(self):
+        """Test that a value equal to a bound falls in that bound's bucket."""
+        histogram = Histogram(buckets=(1.0, 2.0))
+        histogram.observe_many([0.5, 1.0, 1.5, 2.0, 3.0])
+
+        assert histogram.counts == [2, 2, 1]
+        assert histogram.cumulative() == [(1.0, 2), (2.0, 4), (float("inf"), 5)]
+        assert histogram.sum == 8.0
+        assert histogram.count == 5
+
+
+class TestMetrics:
+    """Test suite for recording and rendering metrics."""
+
+    def test_record_counts_calls_and_errors(self):
+        """Test that calls and exceptions are counted per method."""
+        metrics = Metrics()
+        metrics.record("get_task", 0.001)
+        metrics.record("get_task", 0.002, TaskNotFoundException("gone"))
+
+        assert metrics.calls == {"get_task": 2}
+        assert metrics.errors == {("get_task", "TaskNotFoundException"): 1}
+        assert metrics.latency["get_task"].sum == pytest.approx(0.003)
+
+    def test_flushes_when_queue_is_full(self):
+        """Test that queued samples are folded in once FLUSH_SIZE is reached."""
+        metrics = Metrics()
+        for _ in range(FLUSH_SIZE):
+            metrics.record("add_task", 0.0)
+
+        assert metrics.latency["add_task"].count == FLUSH_SIZE
+
+    def test_render_prometheus(self):
+        """Test the Prometheus text exposition output."""
+        metrics = Metrics(buckets=(0.001, 0.01))
+        metrics.record("add_task", 0.005)
+        metrics.record("add_task", 0.02, InvalidTaskDataError("bad"))
+
+        lines = metrics.render().splitlines()
+
+        assert "# TYPE todo_manager_calls_total counter" in lines
+        assert 'todo_manager_calls_total{method="add_task"} 2' in lines
+        assert (
+            'todo_manager_errors_total{method="add_task",'
+            'exception="InvalidTaskDataError"} 1'
+        ) in lines
+        assert "# TYPE todo_manager_call_duration_seconds histogram" in lines
+        assert [line for line in lines if "_bucket" in line] == [
+            'todo_manager_call_duration_seconds_bucket{method="add_task",le="0.001"} 0',
+            'todo_manager_call_duration_seconds_bucket{method="add_task",le="0.01"} 1',
+            'todo_manager_call_duration_seconds_bucket{method="add_task",le="+Inf"} 2',
+        ]
+        assert 'todo_manager_call_duration_seconds_count{method="add_task"} 2' in lines
+
+    def test_reset(self):
+        """Test that reset discards recorded and queued samples."""
+        metrics = Metrics()
+        metrics.record("get_task", 0.001, TaskNotFoundException("gone"))
+        metrics.flush()
+        metrics.record("get_task", 0.001)
+
+        metrics.reset()
+
+        assert metrics.calls == {}
+        assert metrics.errors == {}
+
+
+class TestInstrument:
+    """Test suite for instrumenting manager instances."""
+
+    def test_records_manager_calls(self):
+        """Test that public methods are counted, including failures."""
+        manager = TodoManager()
+        metrics = instrument(manager)
+
+        task = manager.add_task(title="Buy milk")
+        manager.get_task(task.id)
+        with pytest.raises(TaskNotFoundException):
+            manager.get_task(99)
+        with pytest.raises(InvalidTaskDataError):
+            manager.add_task(title="")
+
+        assert metrics.calls["add_task"] == 2
+        assert metrics.calls["get_task"] == 2
+        assert metrics.errors == {
+            ("get_task", "TaskNotFoundException"): 1,
+            ("add_task", "InvalidTaskDataError"): 1,
+        }
+
+    @pytest.mark.parametrize("manager_class", [TodoManager, ThreadSafeTodoManager])
+    def test_records_only_outermost_calls(self, manager_class, monkeypatch):
+        """Test that calls a manager makes to itself are not recorded."""
+        monkeypatch.setattr("todo_app.concurrency.ITER_PAGE_SIZE", 2)
+        manager = manager_class()
+        for i in range(5):
+            manager.add_task(title=f"Task {i}")
+        metrics = instrument(manager)
+
+        manager.top_k(2)
+        manager.export_tasks(io.StringIO())
+
+        assert metrics.calls == {"top_k": 1, "export_tasks": 1}
+        assert sum(h.count for h in metrics.latency.values()) == 2
+
+    def test_other_instances_are_untouched(self):
+        """Test that only the instrumented instance is wrapped."""
+        manager, other = TodoManager(), TodoManager()
+        instrument(manager)
+
+        assert "add_task" in vars(manager)
+        assert "add_task" not in vars(other)
+        assert metrics_of(other) is None
+
+    def test_instrument_twice_returns_same_metrics(self):
+        """Test that instrumenting again does not wrap methods twice."""
+        manager = TodoManager()
+        metrics = instrument(manager)
+
+        assert instrument(manager) is metrics
+        assert metrics_of(manager) is metrics
+        manager.count_tasks()
+        assert metrics.calls["count_tasks"] == 1
+
+    def test_uninstrument(self):
+        """Test that uninstrument restores the class methods."""
+        manager = TodoManager()
+        metrics = instrument(manager)
+        uninstrument(manager)
+        uninstrument(manager)  # no-op when not instrumented
+
+        manager.add_task(title="Buy milk")
+        assert "add_task" not in vars(manager)
+        assert metrics_of(manager) is None
+        assert metrics.calls == {}
+
+    def test_thread_safe_manager(self):
+        """Test that concurrent calls are all counted."""
+        manager = ThreadSafeTodoManager()
+        metrics = instrument(manager)
+
+        def worker():
+            for _ in range(500):
+                manager.add_task(title="Task")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.calls["add_task"] == 2000
+        assert manager.count_tasks() == 2000
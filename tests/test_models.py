@@ -5,12 +5,12 @@ Following TDD principles: Tests written before implementation.
 Target: 100% code coverage for models.py
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 
 from todo_app.exceptions import InvalidTaskDataError
-from todo_app.models import Task
+from todo_app.models import Task, from_epoch_micros, to_epoch_micros
 
 
 class TestTaskCreation:
@@ -274,3 +274,71 @@ class TestTaskEdgeCases:
         assert task.title == "Task with spaces"
         assert not task.title.startswith(" ")
         assert not task.title.endswith(" ")
+
+
+class TestTaskSerialization:
+    """Test suite for Task.to_dict() and Task.from_dict()."""
+
+    def test_round_trip_preserves_all_fields(self):
+        """Test that from_dict(to_dict()) reproduces the task."""
+        task = Task(
+            id=7,
+            title="日本語タスク",
+            description="Desc",
+            completed=True,
+            created_at=datetime(2025, 12, 7, 9, 30, 15, 123456),
+        )
+
+        assert Task.from_dict(task.to_dict()) == task
+
+    def test_from_dict_defaults_optional_fields(self):
+        """Test that description, completed and created_at are optional."""
+        task = Task.from_dict({"id": 1, "title": "Minimal"})
+
+        assert task.description == ""
+        assert task.completed is False
+        assert isinstance(task.created_at, datetime)
+
+    def test_from_dict_missing_title_raises_error(self):
+        """Test that missing required fields raise InvalidTaskDataError."""
+        with pytest.raises(InvalidTaskDataError, match="Invalid task data"):
+            Task.from_dict({"id": 1})
+
+    def test_from_dict_invalid_timestamp_raises_error(self):
+        """Test that unparseable created_at raises InvalidTaskDataError."""
+        with pytest.raises(InvalidTaskDataError):
+            Task.from_dict({"id": 1, "title": "T", "created_at": "yesterday"})
+
+
+class TestTaskMemoryLayout:
+    """Test suite for the slotted Task layout."""
+
+    def test_task_has_no_instance_dict(self):
+        """Test that Task uses __slots__ instead of a per-instance __dict__."""
+        task = Task(id=1, title="Task")
+
+        assert not hasattr(task, "__dict__")
+
+    def test_task_rejects_unknown_attributes(self):
+        """Test that arbitrary attributes cannot be added to a Task."""
+        task = Task(id=1, title="Task")
+
+        with pytest.raises(AttributeError):
+            task.priority = "high"  # type: ignore[attr-defined]
+
+
+class TestEpochMicros:
+    """Test suite for epoch-microsecond timestamp conversion."""
+
+    def test_round_trip_preserves_microseconds(self):
+        """Test that conversion to and from epoch micros is lossless."""
+        value = datetime(2025, 12, 7, 9, 30, 15, 123456)
+
+        assert from_epoch_micros(to_epoch_micros(value)) == value
+
+    def test_aware_timestamps_convert_to_local_time(self):
+        """Test that timezone-aware datetimes convert to naive local time."""
+        aware = datetime(2025, 12, 7, 12, 0, tzinfo=timezone.utc)
+        local = aware.astimezone().replace(tzinfo=None)
+
+        assert to_epoch_micros(aware) == to_epoch_micros(local)
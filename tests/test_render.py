@@ -0,0 +1,125 @@
+"""
+Unit tests for buffered task rendering.
+
+Target: 100% code coverage for render.py
+"""
+
+import io
+import json
+
+import pytest
+
+from todo_app.models import Task
+from todo_app.render import (
+    TSV_FIELDS,
+    format_task_detail,
+    format_task_line,
+    format_tsv_row,
+    render_tasks,
+    write_chunked,
+)
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write() calls."""
+
+    writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def make_tasks(count: int) -> list[Task]:
+    """Return count tasks, every other one completed."""
+    return [
+        Task(
+            id=i,
+            title=f"Task {i}",
+            description="Details" * (i % 2),
+            completed=i % 2 == 1,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+class TestFormatters:
+    """Test suite for per-task formatters."""
+
+    def test_task_line(self):
+        """Test the listing entry with and without a description."""
+        assert format_task_line(Task(id=3, title="A")) == "[3] ☐ A\n"
+        task = Task(id=4, title="B", description="More", completed=True)
+        assert format_task_line(task) == "[4] ✓ B\n    More\n"
+
+    def test_task_detail(self):
+        """Test the detail block used by get/add/update."""
+        task = Task(id=4, title="B", description="More", completed=True)
+        assert format_task_detail(task) == (
+            "[4] ✓ B\n    Description: More\n    Status: Completed\n"
+        )
+
+    def test_tsv_row_escapes_special_characters(self):
+        """Test that tabs, newlines and backslashes stay inside one field."""
+        task = Task(id=1, title="a\tb", description="x\\y\r\nz")
+        fields = format_tsv_row(task).rstrip("\n").split("\t")
+
+        assert fields[:4] == ["1", "false", "a\\tb", "x\\\\y\\r\\nz"]
+        assert fields[4] == task.created_at.isoformat()
+
+
+class TestRenderTasks:
+    """Test suite for chunked rendering."""
+
+    def test_text_writes_in_chunks(self):
+        """Test that text output is written one chunk at a time."""
+        tasks = make_tasks(25)
+        stream = CountingStream()
+
+        count = render_tasks(tasks, stream, chunk_size=10)
+
+        assert count == 25
+        assert stream.writes == 3
+        assert stream.getvalue() == "".join(map(format_task_line, tasks))
+
+    def test_custom_formatter(self):
+        """Test that the text format accepts another per-task formatter."""
+        stream = io.StringIO()
+        render_tasks(make_tasks(2), stream, formatter=format_task_detail)
+        assert stream.getvalue().count("Status:") == 2
+
+    @pytest.mark.parametrize("count", [0, 1, 7])
+    def test_json(self, count):
+        """Test that JSON output is one array of task dictionaries."""
+        tasks = make_tasks(count)
+        stream = io.StringIO()
+
+        assert render_tasks(tasks, stream, "json", chunk_size=3) == count
+        assert json.loads(stream.getvalue()) == [task.to_dict() for task in tasks]
+
+    def test_tsv(self):
+        """Test that TSV output has a header and one line per task."""
+        stream = io.StringIO()
+
+        assert render_tasks(make_tasks(3), stream, "tsv") == 3
+        lines = stream.getvalue().splitlines()
+        assert lines[0].split("\t") == list(TSV_FIELDS)
+        assert lines[2].split("\t")[:3] == ["2", "false", "Task 2"]
+        assert "☐" not in stream.getvalue()
+
+    def test_accepts_iterators(self):
+        """Test that tasks are consumed lazily from any iterable."""
+        stream = io.StringIO()
+        assert render_tasks(iter(make_tasks(5)), stream, "tsv", chunk_size=2) == 5
+
+    def test_invalid_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Invalid format"):
+            render_tasks([], io.StringIO(), "xml")
+
+    def test_write_chunked(self):
+        """Test joining strings into chunked writes."""
+        stream = CountingStream()
+        assert write_chunked(stream, ["a", "b", "c"], chunk_size=2) == 3
+        assert stream.getvalue() == "abc"
+        assert stream.writes == 2
@@ -0,0 +1,113 @@
+"""
+Unit tests for the full-text search index.
+
+Target: 100% code coverage for search.py
+"""
+
+from todo_app.models import Task
+from todo_app.search import SearchIndex, tokenize
+
+
+class TestTokenize:
+    """Test suite for Unicode-aware tokenization."""
+
+    def test_splits_on_punctuation_and_casefolds(self):
+        """Test that text is lower-cased and split into words."""
+        assert tokenize("Buy MILK, eggs & bread!") == ["buy", "milk", "eggs", "bread"]
+
+    def test_unicode_normalization(self):
+        """Test that composed/decomposed and full-width forms match."""
+        assert tokenize("Café") == tokenize("Café") == ["café"]
+        assert tokenize("ＡＢＣ") == ["abc"]
+        assert tokenize("Straße") == ["strasse"]
+
+    def test_non_latin_scripts(self):
+        """Test that non-Latin words are kept as tokens."""
+        assert tokenize("学习 Python 🐍") == ["学习", "python"]
+
+    def test_empty_text(self):
+        """Test that text without words yields no tokens."""
+        assert tokenize("  -- !! ") == []
+
+
+class TestSearchIndex:
+    """Test suite for indexing, matching and ranking."""
+
+    def make_index(self, *tasks: Task) -> SearchIndex:
+        """Build an index over the given tasks."""
+        index = SearchIndex()
+        for task in tasks:
+            index.add(task)
+        return index
+
+    def test_exact_and_prefix_match(self):
+        """Test that whole words and word prefixes both match."""
+        index = self.make_index(Task(id=1, title="Buy groceries"))
+
+        assert index.search("groceries") == [1]
+        assert index.search("groc") == [1]
+        assert index.search("roceries") == []
+
+    def test_all_tokens_must_match(self):
+        """Test that multi-word queries are AND-ed."""
+        index = self.make_index(
+            Task(id=1, title="Write report", description="quarterly numbers"),
+            Task(id=2, title="Write tests"),
+        )
+
+        assert index.search("write") == [1, 2]
+        assert index.search("write quarterly") == [1]
+        assert index.search("write missing") == []
+
+    def test_title_ranks_above_description(self):
+        """Test that title matches outrank description matches."""
+        index = self.make_index(
+            Task(id=1, title="Call mom", description="about the report"),
+            Task(id=2, title="Report"),
+        )
+
+        assert index.search("report") == [2, 1]
+
+    def test_exact_ranks_above_prefix(self):
+        """Test that exact term matches outrank prefix matches."""
+        index = self.make_index(
+            Task(id=1, title="Testing"),
+            Task(id=2, title="Test"),
+        )
+
+        assert index.search("test") == [2, 1]
+
+    def test_ties_break_by_id_and_limit(self):
+        """Test that equal scores are ordered by ID and limit truncates."""
+        index = self.make_index(*(Task(id=i, title="same") for i in range(1, 6)))
+
+        assert index.search("same") == [1, 2, 3, 4, 5]
+        assert index.search("same", limit=2) == [1, 2]
+
+    def test_readd_replaces_terms(self):
+        """Test that re-adding a task drops its old terms."""
+        index = self.make_index(Task(id=1, title="Old title"))
+        index.add(Task(id=1, title="New title"))
+
+        assert index.search("old") == []
+        assert index.search("new") == [1]
+        assert "old" not in index.postings
+        assert len(index) == 1
+
+    def test_remove(self):
+        """Test that removed tasks no longer match and vocab is pruned."""
+        index = self.make_index(Task(id=1, title="Alpha"), Task(id=2, title="Beta"))
+
+        index.remove(1)
+        index.remove(99)
+
+        assert index.search("alpha") == []
+        assert list(index.terms) == ["beta"]
+        assert len(index) == 1
+
+    def test_empty_query(self):
+        """Test that a query without words matches nothing."""
+        index = self.make_index(Task(id=1, title="Anything"))
+
+        assert index.search("") == []
+        assert index.search("?!") == []
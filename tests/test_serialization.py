@@ -0,0 +1,103 @@
+"""
+Unit tests for streaming import/export.
+
+Target: 100% code coverage for serialization.py
+"""
+
+import io
+
+import pytest
+
+from todo_app.exceptions import InvalidTaskDataError
+from todo_app.manager import TodoManager
+from todo_app.serialization import read_records, record_to_task, write_records
+
+
+class TestRecordToTask:
+    """Test suite for converting imported records to tasks."""
+
+    def test_minimal_record(self):
+        """Test that only a title is required and the ID is assigned."""
+        task = record_to_task({"id": 99, "title": "Task"}, task_id=5)
+
+        assert task.id == 5
+        assert task.completed is False
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(True, True), ("yes", True), ("1", True), ("False", False), ("", False)],
+    )
+    def test_completed_flag_parsing(self, value, expected):
+        """Test JSON booleans and CSV strings for the completed flag."""
+        task = record_to_task({"title": "Task", "completed": value}, task_id=1)
+
+        assert task.completed is expected
+
+    @pytest.mark.parametrize(
+        ("record", "message"),
+        [
+            ({"title": ""}, "Title cannot be empty"),
+            ({"title": 42}, "must be strings"),
+            ({"title": "T", "completed": "maybe"}, "Invalid completed value"),
+            ({"title": "T", "created_at": "soon"}, "Invalid created_at value"),
+            ({"_error": "Invalid JSON"}, "Invalid JSON"),
+        ],
+    )
+    def test_invalid_records_raise_error(self, record, message):
+        """Test that malformed records raise InvalidTaskDataError."""
+        with pytest.raises(InvalidTaskDataError, match=message):
+            record_to_task(record, task_id=1)
+
+
+class TestReadWriteRecords:
+    """Test suite for JSON Lines and CSV streams."""
+
+    @pytest.mark.parametrize("file_format", ["jsonl", "csv"])
+    def test_round_trip_through_manager(self, file_format):
+        """Test that export followed by import reproduces task data."""
+        source = TodoManager()
+        task = source.add_task(title="日本語タスク", description='Quote "and", comma')
+        source.mark_complete(task_id=task.id)
+        source.add_task(title="Second")
+        buffer = io.StringIO(newline="")
+
+        assert source.export_tasks(buffer, format=file_format) == 2
+
+        buffer.seek(0)
+        target = TodoManager()
+        report = target.import_tasks(read_records(buffer, file_format))
+
+        assert report.ok
+        assert [t.to_dict() for t in target.list_tasks()] == [
+            t.to_dict() for t in source.list_tasks()
+        ]
+
+    def test_jsonl_skips_blank_lines_and_flags_bad_rows(self):
+        """Test that bad JSON lines become error rows, not exceptions."""
+        stream = io.StringIO('{"title": "A"}\n\nnot json\n[1, 2]\n')
+
+        records = list(read_records(stream, "jsonl"))
+
+        assert len(records) == 3
+        assert "_error" in records[1]
+        assert "_error" in records[2]
+
+    def test_export_filters_by_status(self):
+        """Test exporting only pending tasks."""
+        manager = TodoManager()
+        task = manager.add_task(title="Done")
+        manager.mark_complete(task_id=task.id)
+        manager.add_task(title="Open")
+        buffer = io.StringIO()
+
+        manager.export_tasks(buffer, status="pending")
+
+        assert '"Open"' in buffer.getvalue()
+        assert '"Done"' not in buffer.getvalue()
+
+    def test_invalid_format_raises_error(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Invalid format"):
+            read_records(io.StringIO(), "xml")
+        with pytest.raises(ValueError, match="Invalid format"):
+            write_records(io.StringIO(), [], "xml")
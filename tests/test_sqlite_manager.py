@@ -0,0 +1,283 @@
+"""
+Unit tests for the SqliteTodoManager class.
+
+Target: 100% code coverage for sqlite_manager.py
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from todo_app.exceptions import InvalidTaskDataError, TaskNotFoundException
+from todo_app.manager import TodoManager
+from todo_app.models import Task, to_epoch_micros
+from todo_app.sqlite_manager import SqliteTodoManager
+
+
+@pytest.fixture
+def manager():
+    """Return a manager backed by a private in-memory database."""
+    manager = SqliteTodoManager()
+    yield manager
+    manager.close()
+
+
+class TestSqliteCrud:
+    """Test suite for API parity with TodoManager."""
+
+    def test_add_and_get_task(self, manager):
+        """Test that added tasks can be read back with all fields."""
+        task = manager.add_task(title="  日本語タスク ", description="説明")
+
+        retrieved = manager.get_task(task.id)
+
+        assert isinstance(retrieved, Task)
+        assert retrieved == task
+        assert retrieved.title == "日本語タスク"
+
+    def test_add_task_validates_input(self, manager):
+        """Test that invalid titles are rejected before insert."""
+        with pytest.raises(InvalidTaskDataError):
+            manager.add_task(title="")
+
+        assert manager.list_tasks() == []
+
+    def test_list_tasks_by_status(self, manager):
+        """Test status filtering and ID ordering."""
+        task1 = manager.add_task(title="Task 1")
+        task2 = manager.add_task(title="Task 2")
+        task3 = manager.add_task(title="Task 3")
+        manager.mark_complete(task_id=task2.id)
+
+        assert [t.id for t in manager.list_tasks()] == [1, 2, 3]
+        assert [t.id for t in manager.list_tasks("pending")] == [task1.id, task3.id]
+        assert [t.id for t in manager.list_tasks("completed")] == [task2.id]
+
+    def test_list_tasks_with_invalid_status_raises_error(self, manager):
+        """Test that invalid status parameter raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid status"):
+            manager.list_tasks(status="invalid")
+
+    def test_update_task(self, manager):
+        """Test updating title and description."""
+        task = manager.add_task(title="Old", description="Old desc")
+
+        updated = manager.update_task(task_id=task.id, title="New")
+
+        assert updated.title == "New"
+        assert manager.get_task(task.id).description == "Old desc"
+
+    def test_update_task_invalid_data_leaves_row_unchanged(self, manager):
+        """Test that a failed update does not modify the stored task."""
+        task = manager.add_task(title="Title")
+
+        with pytest.raises(InvalidTaskDataError):
+            manager.update_task(task_id=task.id, title="New", description="x" * 1001)
+
+        assert manager.get_task(task.id).title == "Title"
+
+    def test_completion_methods(self, manager):
+        """Test complete, incomplete and toggle."""
+        task = manager.add_task(title="Task")
+
+        manager.mark_complete(task_id=task.id)
+        assert manager.get_task(task.id).completed is True
+        manager.mark_incomplete(task_id=task.id)
+        assert manager.get_task(task.id).completed is False
+        manager.toggle_complete(task_id=task.id)
+        assert manager.get_task(task.id).completed is True
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "get_task",
+            "delete_task",
+            "mark_complete",
+            "mark_incomplete",
+            "toggle_complete",
+        ],
+    )
+    def test_missing_task_raises_error(self, manager, method):
+        """Test that every single-task method raises for unknown IDs."""
+        with pytest.raises(TaskNotFoundException, match="Task with ID 42 not found"):
+            getattr(manager, method)(42)
+
+    def test_update_missing_task_raises_error(self, manager):
+        """Test that updating an unknown ID raises TaskNotFoundException."""
+        with pytest.raises(TaskNotFoundException):
+            manager.update_task(task_id=42, title="New")
+
+    def test_delete_task_id_not_reused(self, manager):
+        """Test that deleted task IDs are not reused."""
+        manager.add_task(title="Task 1")
+        task2 = manager.add_task(title="Task 2")
+        manager.delete_task(task_id=task2.id)
+
+        assert manager.add_task(title="Task 3").id == 3
+
+
+class TestSqliteBulk:
+    """Test suite for bulk operations."""
+
+    def test_bulk_complete_and_delete(self, manager):
+        """Test per-ID reports and that existing IDs are changed."""
+        for i in range(4):
+            manager.add_task(title=f"Task {i}")
+
+        report = manager.bulk_complete([1, 2, 2, 9])
+        assert (report.succeeded, report.errors) == (
+            [1, 2],
+            [(9, "Task with ID 9 not found")],
+        )
+        assert manager.count_tasks("completed") == 2
+
+        assert manager.bulk_delete([3, 4]).ok
+        assert [t.id for t in manager.list_tasks()] == [1, 2]
+
+    def test_atomic_rolls_back(self, manager):
+        """Test that an atomic batch with a missing ID changes nothing."""
+        manager.add_task(title="Task")
+
+        report = manager.bulk_delete([1, 9], atomic=True)
+        assert (report.succeeded, report.ok) == ([], False)
+        assert manager.bulk_complete([1, 9], atomic=True).succeeded == []
+        task = manager.get_task(1)
+        assert task.completed is False
+
+    def test_bulk_update(self, manager):
+        """Test that valid updates are applied and invalid ones reported."""
+        manager.add_task(title="One")
+        manager.add_task(title="Two")
+
+        report = manager.bulk_update({1: {"title": "First"}, 2: {"title": ""}, 9: {}})
+        assert report.succeeded == [1]
+        assert [task_id for task_id, _ in report.errors] == [2, 9]
+        assert manager.get_task(1).title == "First"
+        atomic = manager.bulk_update({1: {"title": "X"}, 9: {}}, atomic=True)
+        assert atomic.succeeded == []
+        assert manager.get_task(1).title == "First"
+
+
+class TestSqlitePagination:
+    """Test suite for keyset pagination."""
+
+    def test_limit_after_id_and_iter_tasks(self, manager, monkeypatch):
+        """Test that pages and lazy iteration match list_tasks."""
+        monkeypatch.setattr("todo_app.sqlite_manager.ITER_PAGE_SIZE", 2)
+        for i in range(1, 6):
+            manager.add_task(title=f"Task {i}")
+        manager.mark_complete(task_id=2)
+        manager.mark_complete(task_id=5)
+
+        assert [t.id for t in manager.list_tasks(limit=2, after_id=1)] == [2, 3]
+        assert [t.id for t in manager.list_tasks(after_id=3)] == [4, 5]
+        assert [t.id for t in manager.list_tasks("completed", limit=1)] == [2]
+        assert [t.id for t in manager.iter_tasks()] == [1, 2, 3, 4, 5]
+        assert [t.id for t in manager.iter_tasks("pending", after_id=1)] == [3, 4]
+
+
+class TestSqliteSortedListing:
+    """Test suite for list_tasks orders and creation ranges."""
+
+    TITLES = ["beta", "Alpha", "gamma", "alpha", "Émile", "Beta", "delta", "épée"]
+    # Creation hours; equal hours are ordered by ID
+    HOURS = [5, 3, 3, 7, 1, 6, 0, 3]
+
+    @pytest.fixture
+    def managers(self, manager):
+        """Return the SQLite manager and a TodoManager with the same tasks."""
+        start = datetime(2026, 10, 17)
+        expected = TodoManager()
+        for title, hours in zip(self.TITLES, self.HOURS):
+            task = manager.add_task(title=title)
+            manager._conn.execute(
+                "UPDATE tasks SET created_at = ? WHERE id = ?",
+                (to_epoch_micros(start + timedelta(hours=hours)), task.id),
+            )
+            expected.import_tasks(
+                [{**manager.get_task(task.id).to_dict(), "id": task.id}]
+            )
+        for task_id in (2, 5, 6):
+            manager.mark_complete(task_id)
+            expected.mark_complete(task_id)
+        return manager, expected
+
+    @pytest.mark.parametrize("sort", ["id", "created", "-created", "title", "-title"])
+    @pytest.mark.parametrize("status", ["all", "pending", "completed"])
+    def test_matches_todo_manager(self, managers, sort, status):
+        """Test every order, with ranges and keyset pages, against TodoManager."""
+        manager, expected = managers
+        start = datetime(2026, 10, 17)
+        for kwargs in (
+            {},
+            {"created_from": start + timedelta(hours=3)},
+            {"created_to": start + timedelta(hours=6)},
+            {"limit": 3, "after_id": 3},
+            {"after_id": 8, "created_from": start + timedelta(hours=1)},
+        ):
+            assert [t.id for t in manager.list_tasks(status, sort=sort, **kwargs)] == [
+                t.id for t in expected.list_tasks(status, sort=sort, **kwargs)
+            ], kwargs
+
+    def test_invalid_sort_and_missing_cursor(self, manager):
+        """Test that bad orders and vanished cursor tasks are rejected."""
+        manager.add_task(title="Task")
+        with pytest.raises(ValueError, match="Invalid sort"):
+            manager.list_tasks(sort="priority")
+        with pytest.raises(TaskNotFoundException):
+            manager.list_tasks(sort="title", after_id=99)
+        assert manager.list_tasks(after_id=99, created_to=datetime(2100, 1, 1)) == []
+
+
+class TestSqliteStats:
+    """Test suite for trigger-maintained counters."""
+
+    def test_stats_follow_mutations(self, manager):
+        """Test that counters track inserts, completion changes and deletes."""
+        task1 = manager.add_task(title="Task 1")
+        task2 = manager.add_task(title="Task 2")
+        manager.add_task(title="Task 3")
+        manager.mark_complete(task_id=task1.id)
+        manager.mark_complete(task_id=task1.id)
+        manager.toggle_complete(task_id=task2.id)
+        manager.delete_task(task_id=task2.id)
+
+        stats = manager.stats()
+
+        assert (stats.total, stats.completed, stats.pending) == (2, 1, 1)
+        assert dict(stats.created_per_day) == {task1.created_at.date(): 2}
+        assert manager.count_tasks() == 2
+        assert manager.count_tasks("completed") == 1
+        assert manager.count_tasks("pending") == 1
+
+    def test_count_tasks_with_invalid_status_raises_error(self, manager):
+        """Test that count_tasks validates the status filter."""
+        with pytest.raises(ValueError, match="Invalid status"):
+            manager.count_tasks(status="done")
+
+    def test_created_per_day_bucket_removed_when_empty(self, manager):
+        """Test that deleting the last task of a day drops its bucket."""
+        task = manager.add_task(title="Task")
+        manager.delete_task(task_id=task.id)
+
+        assert dict(manager.stats().created_per_day) == {}
+
+
+class TestSqlitePersistence:
+    """Test suite for on-disk databases."""
+
+    def test_tasks_and_ids_survive_reopen(self, tmp_path):
+        """Test that data and the ID sequence persist across connections."""
+        path = str(tmp_path / "tasks.sqlite3")
+        first = SqliteTodoManager(path)
+        first.add_task(title="Task 1")
+        task2 = first.add_task(title="Task 2")
+        first.delete_task(task_id=task2.id)
+        first.close()
+
+        second = SqliteTodoManager(path)
+
+        assert [t.title for t in second.list_tasks()] == ["Task 1"]
+        assert second.add_task(title="Task 3").id == 3
+        assert second._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        second.close()
@@ -0,0 +1,199 @@
+"""
+Unit tests for Server-Sent Events streaming.
+
+Target: 100% code coverage for sse.py
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+
+from todo_app.changes import ChangeFeed
+from todo_app.models import Task
+from todo_app.sse import RETRY_MS, ChangeNotifier, EventServer, stream_changes
+
+
+@pytest.fixture
+def feed():
+    """Return an empty change feed."""
+    return ChangeFeed()
+
+
+@pytest.fixture
+def notifier(feed):
+    """Return a notifier for feed, closed after the test."""
+    notifier = ChangeNotifier(feed)
+    yield notifier
+    notifier.close()
+
+
+def emit(feed: ChangeFeed, count: int) -> None:
+    """Emit count add events."""
+    for _ in range(count):
+        seq = feed.last_seq + 1
+        feed.emit("add", Task(id=seq, title=f"Task {seq}"))
+
+
+class TestStreamChanges:
+    """Test suite for the event stream generator."""
+
+    def test_streams_new_changes(self, feed, notifier):
+        """Test the preamble, one event per change and keep-alives."""
+        emit(feed, 1)
+        stream = stream_changes(notifier, keepalive=0.01)
+
+        assert next(stream) == f"retry: {RETRY_MS}\n\n"
+        emit(feed, 1)
+        chunk = next(stream)
+        assert chunk.startswith("id: 2\nevent: add\ndata: {")
+        assert '"title":"Task 2"' in chunk
+        assert next(stream) == ": keep-alive\n\n"
+
+    def test_backlog_is_one_chunk(self, feed, notifier):
+        """Test that events piling up behind a slow client are coalesced."""
+        stream = stream_changes(notifier, keepalive=0.01)
+        next(stream)
+        emit(feed, 3)
+
+        chunk = next(stream)
+        assert [line for line in chunk.splitlines() if line.startswith("id:")] == [
+            "id: 1",
+            "id: 2",
+            "id: 3",
+        ]
+
+    def test_resume_from_last_seq(self, feed, notifier):
+        """Test that a reconnecting client gets the events it missed."""
+        emit(feed, 3)
+        stream = stream_changes(notifier, last_seq=1)
+        next(stream)
+
+        assert next(stream).count("event: add") == 2
+
+    @pytest.mark.parametrize("last_seq", [1, 9])
+    def test_reset_when_history_is_gone(self, last_seq, notifier):
+        """Test that expired or unknown positions get a reset event."""
+        feed = ChangeFeed(capacity=2)
+        small = ChangeNotifier(feed)
+        emit(feed, 5)
+        stream = stream_changes(small, last_seq=last_seq, keepalive=0.01)
+        next(stream)
+
+        assert next(stream) == 'id: 5\nevent: reset\ndata: {"version":5}\n\n'
+        assert next(stream) == ": keep-alive\n\n"
+        small.close()
+
+    def test_waiting_stream_wakes_on_change(self, feed, notifier):
+        """Test that a blocked stream is woken by a change, not a timeout."""
+        stream = stream_changes(notifier, keepalive=30)
+        next(stream)
+        timer = threading.Timer(0.05, emit, (feed, 1))
+        timer.start()
+
+        began = time.perf_counter()
+        assert next(stream).startswith("id: 1\n")
+        assert time.perf_counter() - began < 5
+        timer.join()
+
+    def test_close_ends_streams(self, feed):
+        """Test that closing the notifier ends waiting streams."""
+        notifier = ChangeNotifier(feed)
+        stream = stream_changes(notifier, keepalive=30)
+        next(stream)
+        threading.Timer(0.05, notifier.close).start()
+
+        assert list(stream) == [": keep-alive\n\n"]
+        assert notifier.wait(0, timeout=0) is False
+
+
+class TestEventServer:
+    """Test suite for the asyncio event server."""
+
+    @pytest.fixture
+    def server(self, notifier):
+        """Return a started server on a free port, closed after the test."""
+        server = EventServer(notifier, keepalive=0.2)
+        server.start()
+        yield server
+        server.close()
+
+    @staticmethod
+    def get(server: EventServer, target: str, headers: str = "") -> socket.socket:
+        """Send a GET request to server and return the connected socket."""
+        client = socket.create_connection(("127.0.0.1", server.port), timeout=5)
+        client.sendall(f"GET {target} HTTP/1.1\r\nHost: x\r\n{headers}\r\n".encode())
+        return client
+
+    @staticmethod
+    def read_until(client: socket.socket, marker: bytes) -> bytes:
+        """Read from client until marker arrives."""
+        received = b""
+        while marker not in received:
+            chunk = client.recv(4096)
+            assert chunk, received
+            received += chunk
+        return received
+
+    def test_streams_changes(self, server, feed):
+        """Test headers, the retry preamble and live events."""
+        emit(feed, 1)
+        client = self.get(server, "/events")
+        preamble = self.read_until(client, b"retry:")
+
+        assert preamble.startswith(b"HTTP/1.1 200 OK\r\n")
+        assert b"Content-Type: text/event-stream" in preamble
+        emit(feed, 2)
+        assert b"id: 3\n" in self.read_until(client, b"id: 3\n")
+        assert b": keep-alive" in self.read_until(client, b": keep-alive")
+        client.close()
+
+    def test_resume_and_reset(self, server, feed):
+        """Test Last-Event-ID and ?since= resumes, and resets."""
+        emit(feed, 3)
+
+        resumed = self.get(server, "/events", "Last-Event-ID: 1\r\n")
+        assert b"id: 2\n" in self.read_until(resumed, b"id: 3\n")
+        since = self.get(server, "/events?since=2")
+        received = self.read_until(since, b"id: 3\n")
+        assert b"id: 2\n" not in received
+        reset = self.get(server, "/events?since=9")
+        assert b"event: reset" in self.read_until(reset, b"event: reset")
+        malformed = self.get(server, "/events", "Last-Event-ID: x\r\n")
+        self.read_until(malformed, b"retry:")
+        emit(feed, 1)
+        assert b"id: 4\n" in self.read_until(malformed, b"id: 4\n")
+        for client in (resumed, since, reset, malformed):
+            client.close()
+
+    def test_unknown_path_and_closed_client(self, server, feed):
+        """Test 404s, and that a vanished client does not stop the server."""
+        client = self.get(server, "/tasks")
+        assert self.read_until(client, b"\r\n\r\n").startswith(b"HTTP/1.1 404")
+        client.close()
+        self.get(server, "/events").close()
+        emit(feed, 1)
+
+        client = self.get(server, "/events?since=0")
+        assert b"id: 1\n" in self.read_until(client, b"id: 1\n")
+        client.close()
+
+    def test_close_ends_streams(self, feed):
+        """Test that close() drops open streams and frees the port."""
+        notifier = ChangeNotifier(feed)
+        server = EventServer(notifier)
+        server.start()
+        client = self.get(server, "/events")
+        self.read_until(client, b"retry:")
+
+        server.close()
+        notifier.close()
+
+        assert client.recv(4096) == b""
+        client.close()
+
+    def test_bind_error(self, server, notifier):
+        """Test that start() raises if the port is taken."""
+        with pytest.raises(OSError):
+            EventServer(notifier, port=server.port).start()
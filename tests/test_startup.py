@@ -0,0 +1,105 @@
+"""
+Startup-time tests for the `todo` entry point.
+
+The CLI module must not import the manager, storage backends, daemon or web
+stack at import time, and importing it must stay within a time budget
+measured with `python -X importtime` (see benchmarks/bench_startup.py).
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time allowed for todo_app.cli, best of IMPORT_RUNS
+STARTUP_BUDGET_MS = float(os.environ.get("TODO_STARTUP_BUDGET_MS", "40"))
+IMPORT_RUNS = 3
+
+# Modules that only specific subcommands need
+HEAVY_MODULES = {
+    "todo_app.manager",
+    "todo_app.models",
+    "todo_app.storage",
+    "todo_app.search",
+    "todo_app.daemon",
+    "todo_app.web",
+    "flask",
+    "sqlite3",
+}
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter with the package on the path."""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # measure with cached bytecode
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def loaded_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the modules it loaded."""
+    report = "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    return set(json.loads(run_python(code + report).stdout.splitlines()[-1]))
+
+
+def import_times(code: str) -> dict[str, int]:
+    """
+    Run code in a fresh interpreter and return cumulative import times.
+
+    Returns:
+        Module name -> cumulative import time in microseconds
+    """
+    result = run_python(code, "-X", "importtime")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_bytecode_cache():
+    """Compile the package once so timings exclude bytecode compilation."""
+    import_times("import todo_app.cli, todo_app.manager, todo_app.daemon")
+
+
+class TestStartup:
+    """Test suite for CLI import cost."""
+
+    def test_cli_import_is_lightweight(self):
+        """Test that importing the CLI loads no heavy modules."""
+        assert not HEAVY_MODULES & loaded_modules("import todo_app.cli")
+
+    def test_help_does_not_load_manager(self):
+        """Test that `todo --help` builds the parser without the manager."""
+        code = (
+            "import sys; sys.argv = ['todo', '--help']\n"
+            "from todo_app.cli import main\n"
+            "try:\n    main()\nexcept SystemExit:\n    pass"
+        )
+        loaded = loaded_modules(code)
+        assert "todo_app.manager" not in loaded
+        assert "todo_app.daemon" not in loaded
+
+    def test_package_exports_are_lazy(self):
+        """Test that `import todo_app` defers its exports until accessed."""
+        assert "todo_app.manager" not in loaded_modules("import todo_app")
+        assert "todo_app.manager" in loaded_modules("from todo_app import TodoManager")
+
+    def test_cli_import_within_budget(self):
+        """Test that importing the CLI stays within the startup budget."""
+        best = min(
+            import_times("import todo_app.cli")["todo_app.cli"]
+            for _ in range(IMPORT_RUNS)
+        )
+        assert best / 1000 <= STARTUP_BUDGET_MS
@@ -0,0 +1,351 @@
+"""
+Unit tests for the journal storage backend.
+
+Target: 100% code coverage for storage.py
+"""
+
+import os
+
+import pytest
+
+from todo_app.exceptions import ChangesExpiredError, StorageError
+from todo_app.manager import TodoManager
+from todo_app.storage import JournalStorage, StorageBackend
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    """Return a fresh journal path inside a temporary directory."""
+    return str(tmp_path / "tasks.journal")
+
+
+def reopen(path: str, **kwargs) -> TodoManager:
+    """Create a manager that replays the journal at path."""
+    return TodoManager(storage=JournalStorage(path, **kwargs))
+
+
+class TestJournalReplay:
+    """Test suite for persisting and replaying mutations."""
+
+    def test_replay_restores_all_mutations(self, journal_path):
+        """Test that add/update/complete/toggle/delete survive a restart."""
+        manager = reopen(journal_path, fsync="always")
+        task1 = manager.add_task(title="Buy milk", description="2 litres")
+        task2 = manager.add_task(title="Call mom")
+        task3 = manager.add_task(title="Gym")
+        manager.update_task(task_id=task2.id, title="Call dad")
+        manager.mark_complete(task_id=task1.id)
+        manager.toggle_complete(task_id=task3.id)
+        manager.mark_incomplete(task_id=task3.id)
+        manager.delete_task(task_id=task1.id)
+        manager.close()
+
+        restored = reopen(journal_path)
+
+        assert [t.to_dict() for t in restored.list_tasks()] == [
+            t.to_dict() for t in manager.list_tasks()
+        ]
+        assert restored.stats() == manager.stats()
+
+    def test_failing_subscriber_does_not_lose_mutations(self, journal_path):
+        """Test that mutations are journaled even if a subscriber raises."""
+        manager = reopen(journal_path)
+
+        def fail(event):
+            raise RuntimeError("subscriber down")
+
+        manager.changes.subscribe(fail)
+        task = manager.add_task(title="Buy milk")
+        manager.import_tasks([{"title": "Call mom"}])
+        with manager.transaction() as tx:
+            tx.mark_complete(task.id)
+        manager.close()
+
+        restored = reopen(journal_path)
+
+        assert [(t.title, t.completed) for t in restored.list_tasks()] == [
+            ("Buy milk", True),
+            ("Call mom", False),
+        ]
+        assert manager.version == 3
+
+    def test_version_survives_restart(self, journal_path):
+        """Test that versions keep counting and older deltas expire."""
+        manager = reopen(journal_path)
+        task = manager.add_task(title="Buy milk")
+        synced = manager.version
+        manager.add_task(title="Call mom")
+        manager.delete_task(task_id=task.id)
+        with manager.transaction() as tx:
+            tx.add_task(title="Gym")
+        manager.close()
+
+        restored = reopen(journal_path)
+
+        assert restored.version == manager.version == 4
+        assert restored.delta(4).changed == []
+        with pytest.raises(ChangesExpiredError):
+            restored.delta(synced)
+        restored.add_task(title="Walk dog")
+        assert [t.title for t in restored.delta(4).changed] == ["Walk dog"]
+        assert restored.changes.changes_since(4)[0].seq == 5
+
+    def test_deleted_ids_not_reused_after_restart(self, journal_path):
+        """Test that the ID counter survives deleting the newest task."""
+        manager = reopen(journal_path)
+        manager.add_task(title="Task 1")
+        task2 = manager.add_task(title="Task 2")
+        manager.delete_task(task_id=task2.id)
+        manager.close()
+
+        restored = reopen(journal_path)
+
+        assert restored.add_task(title="Task 3").id == 3
+
+    def test_torn_tail_is_truncated(self, journal_path):
+        """Test that a partially written final record is discarded."""
+        manager = reopen(journal_path)
+        manager.add_task(title="Kept")
+        manager.close()
+        valid_size = os.path.getsize(journal_path)
+        with open(journal_path, "ab") as journal:
+            journal.write(b"\x00\x00\x01\x00garbage")
+
+        restored = reopen(journal_path)
+        restored.add_task(title="After crash")
+        restored.close()
+
+        assert [t.title for t in reopen(journal_path).list_tasks()] == [
+            "Kept",
+            "After crash",
+        ]
+        assert os.path.getsize(journal_path) > valid_size
+
+    def test_corrupt_record_checksum_stops_replay(self, journal_path):
+        """Test that a frame with a bad CRC is treated as the end of the log."""
+        manager = reopen(journal_path)
+        manager.add_task(title="Kept")
+        manager.add_task(title="Corrupted")
+        manager.close()
+        with open(journal_path, "r+b") as journal:
+            journal.seek(-2, os.SEEK_END)
+            journal.write(b"!!")
+
+        assert [t.title for t in reopen(journal_path).list_tasks()] == ["Kept"]
+
+    def test_unknown_operation_raises_storage_error(self, journal_path):
+        """Test that replaying an unknown record type fails loudly."""
+        storage = JournalStorage(journal_path)
+        storage.append({"op": "explode"})
+        storage.close()
+
+        with pytest.raises(StorageError, match="Unknown journal operation"):
+            reopen(journal_path)
+
+    def test_malformed_record_raises_storage_error(self, journal_path):
+        """Test that a record missing fields fails with StorageError."""
+        storage = JournalStorage(journal_path)
+        storage.append({"op": "add", "task": {"title": "No id"}})
+        storage.close()
+
+        with pytest.raises(StorageError, match="Cannot replay record"):
+            reopen(journal_path)
+
+
+class TestTransactionJournal:
+    """Test suite for journaling committed transactions."""
+
+    def test_transaction_replays_as_one_batch(self, journal_path):
+        """Test that a committed transaction survives a restart."""
+        manager = reopen(journal_path, fsync="always")
+        manager.add_task(title="Existing")
+        with manager.transaction() as tx:
+            tx.add_task(title="New")
+            tx.update_task(1, title="Renamed")
+            tx.mark_complete(1)
+            temp = tx.add_task(title="Temporary")
+            tx.delete_task(temp.id)
+        with manager.transaction() as tx:
+            tx.delete_task(2)
+        manager.close()
+
+        restored = reopen(journal_path)
+        assert [(t.id, t.title, t.completed) for t in restored.list_tasks()] == [
+            (1, "Renamed", True)
+        ]
+        assert restored.add_task(title="Next").id == 4
+
+    def test_torn_transaction_is_not_half_applied(self, journal_path):
+        """Test that a truncated batch record is dropped as a whole."""
+        manager = reopen(journal_path)
+        manager.add_task(title="Existing")
+        with manager.transaction() as tx:
+            tx.add_task(title="A")
+            tx.add_task(title="B")
+        manager.close()
+        os.truncate(journal_path, os.path.getsize(journal_path) - 5)
+
+        assert [t.title for t in reopen(journal_path).list_tasks()] == ["Existing"]
+
+
+class TestCompaction:
+    """Test suite for snapshot compaction."""
+
+    def test_compaction_writes_snapshot_and_truncates_journal(self, journal_path):
+        """Test that compaction folds history into a snapshot."""
+        manager = reopen(journal_path, compact_every=5)
+        for i in range(4):
+            manager.add_task(title=f"Task {i}")
+        manager.delete_task(task_id=4)  # 5th record triggers compaction
+        manager.close()
+
+        assert os.path.exists(f"{journal_path}.snapshot")
+        assert os.path.getsize(journal_path) == 0
+
+        restored = reopen(journal_path)
+        assert [t.title for t in restored.list_tasks()] == [
+            "Task 0",
+            "Task 1",
+            "Task 2",
+        ]
+        assert restored.version == 5
+        assert restored.add_task(title="Next").id == 5
+
+    def test_replay_after_snapshot_applies_newer_journal(self, journal_path):
+        """Test that records after a snapshot are replayed on top of it."""
+        manager = reopen(journal_path, compact_every=2)
+        task = manager.add_task(title="Task")
+        manager.add_task(title="Other")
+        manager.mark_complete(task_id=task.id)
+        manager.close()
+
+        restored = reopen(journal_path)
+        assert restored.get_task(task.id).completed is True
+        assert restored.version == 3
+
+    def test_replaying_journal_over_snapshot_is_idempotent(self, journal_path):
+        """Test recovery from a crash between snapshot rename and truncation."""
+        manager = reopen(journal_path, compact_every=None)
+        task = manager.add_task(title="Original")
+        manager.update_task(task_id=task.id, title="Renamed")
+        manager.close()
+        # Write a snapshot, then restore the journal as if truncation never ran
+        with open(journal_path, "rb") as journal:
+            history = journal.read()
+        snapshot = reopen(journal_path)._snapshot_records()
+        JournalStorage(journal_path).compact(snapshot)
+        with open(journal_path, "wb") as journal:
+            journal.write(history)
+
+        assert reopen(journal_path).get_task(task.id).title == "Renamed"
+
+
+class TestFsyncPolicy:
+    """Test suite for fsync policy configuration."""
+
+    def test_invalid_policy_raises_storage_error(self, journal_path):
+        """Test that unknown fsync policies are rejected."""
+        with pytest.raises(StorageError, match="Invalid fsync policy"):
+            JournalStorage(journal_path, fsync="sometimes")
+
+    @pytest.mark.parametrize("policy", ["always", "batch", "os"])
+    def test_each_policy_persists_records(self, journal_path, policy):
+        """Test that every policy writes replayable records."""
+        manager = reopen(journal_path, fsync=policy, batch_size=2)
+        for i in range(5):
+            manager.add_task(title=f"Task {i}")
+        manager.close()
+
+        assert len(reopen(journal_path).list_tasks()) == 5
+
+    def test_batch_policy_syncs_after_interval(self, journal_path, monkeypatch):
+        """Test that the batch policy fsyncs once the interval has elapsed."""
+        synced = []
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+        storage = JournalStorage(journal_path, batch_size=1000, batch_interval=0.0)
+
+        storage.append({"op": "next_id", "value": 1})
+
+        assert synced
+        storage.close()
+
+    def test_append_many_syncs_once_per_batch(self, journal_path, monkeypatch):
+        """Test that a bulk operation costs one fsync under "always"."""
+        synced = []
+        manager = reopen(journal_path, fsync="always")
+        for i in range(4):
+            manager.add_task(title=f"Task {i}")
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+
+        manager.bulk_complete([1, 2])
+        manager.bulk_update({3: {"title": "Renamed"}})
+        manager.bulk_delete([4])
+        manager.bulk_delete([])
+        manager.close()
+
+        assert len(synced) == 3
+        restored = reopen(journal_path).list_tasks()
+        assert [(t.id, t.title, t.completed) for t in restored] == [
+            (1, "Task 0", True),
+            (2, "Task 1", True),
+            (3, "Renamed", False),
+        ]
+
+    def test_import_syncs_once(self, journal_path, monkeypatch):
+        """Test that an import is journaled as one batch."""
+        synced = []
+        manager = reopen(journal_path, fsync="always")
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+
+        manager.import_tasks([{"title": f"Task {i}"} for i in range(5)])
+        manager.close()
+
+        assert len(synced) == 1
+        assert reopen(journal_path).count_tasks() == 5
+
+    def test_import_journals_in_bounded_batches(self, journal_path, monkeypatch):
+        """Test that a long import is journaled while it is still running."""
+        monkeypatch.setattr("todo_app.manager.IMPORT_BATCH_SIZE", 2)
+        manager = reopen(journal_path, fsync="always")
+        synced = []
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+        journaled = []
+
+        def records():
+            for i in range(5):
+                journaled.append(len(synced))
+                yield {"title": f"Task {i}"}
+
+        manager.import_tasks(records())
+        manager.close()
+
+        assert journaled == [0, 0, 1, 1, 2]
+        assert len(synced) == 3
+        restored = reopen(journal_path)
+        assert restored.count_tasks() == 5
+        assert restored.add_task(title="Next").id == 6
+
+    def test_close_without_writes_is_noop(self, journal_path):
+        """Test closing a backend that never opened its file."""
+        JournalStorage(journal_path).close()
+
+        assert not os.path.exists(journal_path)
+
+
+class TestStorageBackendInterface:
+    """Test suite for the abstract StorageBackend defaults."""
+
+    def test_base_backend_methods(self):
+        """Test the interface defaults of StorageBackend."""
+        backend = StorageBackend()
+
+        assert backend.needs_compaction() is False
+        backend.close()
+        with pytest.raises(NotImplementedError):
+            list(backend.replay())
+        with pytest.raises(NotImplementedError):
+            backend.append({})
+        with pytest.raises(NotImplementedError):
+            backend.append_many([{}])
+        with pytest.raises(NotImplementedError):
+            backend.compact([])
@@ -0,0 +1,154 @@
+"""
+Unit tests for TodoManager transactions.
+
+Target: 100% code coverage for transaction.py
+"""
+
+import pytest
+
+from todo_app.exceptions import (
+    InvalidTaskDataError,
+    TaskNotFoundException,
+    TransactionConflictError,
+)
+from todo_app.manager import TodoManager
+
+
+@pytest.fixture
+def manager():
+    """Return a manager with three pending tasks."""
+    manager = TodoManager()
+    for i in range(1, 4):
+        manager.add_task(title=f"Task {i}")
+    return manager
+
+
+class TestTransactionCommit:
+    """Test suite for changes applied when the block succeeds."""
+
+    def test_changes_are_invisible_until_commit(self, manager):
+        """Test that the manager only sees changes after the block exits."""
+        with manager.transaction() as tx:
+            task = tx.add_task(title="New", description="Details")
+            tx.update_task(1, title="Renamed")
+            tx.mark_complete(2)
+            tx.delete_task(3)
+
+            assert task.id == 4
+            assert manager.count_tasks() == 3
+            assert manager.get_task(1).title == "Task 1"
+            assert not manager.get_task(2).completed
+
+        assert [t.id for t in manager.list_tasks()] == [1, 2, 4]
+        assert manager.get_task(1).title == "Renamed"
+        assert [t.id for t in manager.list_tasks("completed")] == [2]
+        assert manager.get_task(4).description == "Details"
+        assert manager.stats().total == 3
+
+    def test_reads_see_pending_state(self, manager):
+        """Test that tx.get_task reflects earlier changes in the block."""
+        with manager.transaction() as tx:
+            assert tx.get_task(1) is manager.get_task(1)  # untouched: no copy
+            tx.toggle_complete(1)
+            tx.toggle_complete(1)
+            tx.toggle_complete(1)
+            tx.mark_incomplete(2)
+            tx.delete_task(3)
+
+            assert tx.get_task(1).completed is True
+            assert tx.get_task(2) is not manager.get_task(2)  # overlay copy
+            with pytest.raises(TaskNotFoundException):
+                tx.get_task(3)
+            with pytest.raises(TaskNotFoundException):
+                tx.mark_complete(3)
+
+        assert manager.get_task(1).completed is True
+
+    def test_commit_updates_existing_objects(self, manager):
+        """Test that commit mutates stored tasks in place."""
+        task = manager.get_task(1)
+
+        with manager.transaction() as tx:
+            tx.update_task(1, description="Now with details")
+
+        assert task.description == "Now with details"
+        assert manager.search("details") == [task]
+
+    def test_ids_of_tasks_added_and_deleted_are_not_reused(self, manager):
+        """Test that IDs allocated in a transaction stay consumed."""
+        with manager.transaction() as tx:
+            temp = tx.add_task(title="Temporary")
+            tx.delete_task(temp.id)
+
+        assert manager.add_task(title="Next").id == temp.id + 1
+
+    def test_concurrently_deleted_task_stays_deleted(self, manager):
+        """Test that commit does not resurrect a task deleted meanwhile."""
+        with manager.transaction() as tx:
+            tx.mark_complete(1)
+            manager.delete_task(1)
+
+        assert manager.count_tasks() == 2
+
+    def test_tasks_added_outside_keep_their_ids(self, manager):
+        """Test that commit renumbers added tasks after concurrent adds."""
+        with manager.transaction() as tx:
+            outside = manager.add_task(title="Outside")
+            inside = tx.add_task(title="Inside")
+            tx.mark_complete(inside.id)
+
+        assert (outside.id, inside.id) == (4, 5)
+        assert [(t.id, t.title, t.completed) for t in manager.list_tasks()][3:] == [
+            (4, "Outside", False),
+            (5, "Inside", True),
+        ]
+        assert [e.op for e in manager.changes.changes_since(3)] == ["add", "add"]
+        assert manager.add_task(title="Next").id == 6
+
+    def test_id_conflict_applies_nothing(self, manager):
+        """Test that an added ID already in use aborts the commit."""
+        with pytest.raises(TransactionConflictError, match=r"\[3\]"):
+            with manager.transaction() as tx:
+                tx.add_task(title="Clash")
+                tx.delete_task(1)
+                manager._next_id = 3
+
+        assert [t.id for t in manager.list_tasks()] == [1, 2, 3]
+        assert manager.get_task(3).title == "Task 3"
+
+
+class TestTransactionRollback:
+    """Test suite for changes discarded when the block raises."""
+
+    def test_validation_error_discards_everything(self, manager):
+        """Test that a failing change leaves the manager untouched."""
+        with pytest.raises(InvalidTaskDataError):
+            with manager.transaction() as tx:
+                tx.add_task(title="Kept?")
+                tx.update_task(1, title="Changed")
+                tx.delete_task(2)
+                tx.update_task(3, description="x" * 1001)
+
+        assert [t.title for t in manager.list_tasks()] == ["Task 1", "Task 2", "Task 3"]
+        assert manager.add_task(title="Next").id == 4
+
+    def test_any_exception_discards(self, manager):
+        """Test that arbitrary exceptions roll back too."""
+        with pytest.raises(RuntimeError):
+            with manager.transaction() as tx:
+                tx.mark_complete(1)
+                raise RuntimeError("abort")
+
+        assert manager.count_tasks("completed") == 0
+
+    def test_rollback_does_not_touch_stored_objects(self, manager):
+        """Test that overlay copies, not stored tasks, are modified."""
+        task = manager.get_task(1)
+
+        with pytest.raises(TaskNotFoundException):
+            with manager.transaction() as tx:
+                tx.update_task(1, title="Changed")
+                tx.toggle_complete(1)
+                tx.delete_task(99)
+
+        assert (task.title, task.completed) == ("Task 1", False)
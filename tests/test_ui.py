@@ -0,0 +1,284 @@
+"""
+Unit tests for the interactive console interface.
+
+Target: menu flows in ui.py, driven through a patched input()
+"""
+
+import os
+import re
+
+import pytest
+
+from todo_app import ui
+from todo_app.ui import TodoUI
+
+
+@pytest.fixture
+def console(monkeypatch):
+    """Return a TodoUI whose screen clears are recorded instead of run."""
+    clears = []
+    monkeypatch.setattr(os, "system", clears.append)
+    return TodoUI()
+
+
+def answer(monkeypatch, *replies: str) -> list[str]:
+    """Feed replies to input() and return the prompts it was called with."""
+    prompts = []
+    pending = iter(replies)
+
+    def fake_input(prompt: str = "") -> str:
+        prompts.append(prompt)
+        return next(pending)
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    return prompts
+
+
+def pages(output: str) -> list[int]:
+    """Return the page numbers shown, in order."""
+    return [int(number) for number in re.findall(r"Page (\d+)", output)]
+
+
+def add_tasks(console: TodoUI, count: int) -> None:
+    """Add count numbered tasks."""
+    for number in range(1, count + 1):
+        console.manager.add_task(title=f"Task {number}")
+
+
+class TestPaging:
+    """Test suite for paged task listings."""
+
+    def test_pages_forward_and_back(self, console, monkeypatch, capsys):
+        """Test moving through every page and back to the first."""
+        add_tasks(console, 25)
+        answer(monkeypatch, "", "2", "n", "n", "p", "p", "", "10")
+
+        console.run()
+
+        output = capsys.readouterr().out
+        assert pages(output) == [1, 2, 3, 2, 1]
+        assert "Task 21" in output
+        assert "Total: 25 tasks (0 completed, 25 pending)" in output
+
+    def test_next_stops_at_last_page(self, console, monkeypatch, capsys):
+        """Test that the last page offers no next page and n returns."""
+        add_tasks(console, 20)
+        prompts = answer(monkeypatch, "", "2", "n", "n", "10")
+
+        console.run()
+
+        assert pages(capsys.readouterr().out) == [1, 2]
+        last_page = prompts[3]
+        assert "p = previous page" in last_page
+        assert "n = next page" not in last_page
+        assert prompts[4].startswith("Enter your choice")
+
+    def test_previous_stops_at_first_page(self, console, monkeypatch, capsys):
+        """Test that the first page offers no previous page and p returns."""
+        add_tasks(console, 11)
+        prompts = answer(monkeypatch, "", "2", "p", "10")
+
+        console.run()
+
+        assert pages(capsys.readouterr().out) == [1]
+        assert "n = next page" in prompts[2]
+        assert "p = previous page" not in prompts[2]
+        assert prompts[3].startswith("Enter your choice")
+
+    def test_single_page_has_no_pager(self, console, monkeypatch, capsys):
+        """Test that a listing that fits one page just waits for Enter."""
+        add_tasks(console, 3)
+        console.manager.mark_complete(2)
+        prompts = answer(monkeypatch, "", "3", "", "4", "", "10")
+
+        console.run()
+
+        output = capsys.readouterr().out
+        assert pages(output) == []
+        assert "Total: 2 pending tasks" in output
+        assert "Total: 1 completed tasks" in output
+        assert prompts[2] == "\nPress Enter to continue..."
+
+    def test_empty_listing(self, console, monkeypatch, capsys):
+        """Test the message for a listing with no tasks."""
+        answer(monkeypatch, "", "2", "", "10")
+
+        console.run()
+
+        assert "No tasks found." in capsys.readouterr().out
+
+
+class TestMenus:
+    """Test suite for the task editing menus."""
+
+    def test_add_task(self, console, monkeypatch, capsys):
+        """Test adding tasks, re-prompting for a missing title."""
+        answer(
+            monkeypatch,
+            *("", "1", "Buy milk", "2 litres", ""),
+            *("1", "", "Walk", "", ""),
+            *("1", "x" * 201, "", ""),
+            "10",
+        )
+
+        console.run()
+
+        output = capsys.readouterr().out
+        assert [t.title for t in console.manager.list_tasks()] == ["Buy milk", "Walk"]
+        assert console.manager.get_task(1).description == "2 litres"
+        assert "This field is required" in output
+        assert "Error: Title must be" in output
+
+    def test_update_task(self, console, monkeypatch, capsys):
+        """Test updating a task and the invalid-ID and invalid-data errors."""
+        add_tasks(console, 1)
+        answer(
+            monkeypatch,
+            *("", "5", "1", "Renamed", "", ""),
+            *("5", "abc", ""),
+            *("5", "99", ""),
+            *("5", "1", "x" * 201, "", ""),
+            "10",
+        )
+
+        console.run()
+
+        output = capsys.readouterr().out
+        assert console.manager.get_task(1).title == "Renamed"
+        assert "Task updated successfully" in output
+        assert "Invalid task ID" in output
+        assert "Task with ID 99 not found" in output
+        assert "Error: Title must be" in output
+
+    def test_update_without_tasks(self, console, monkeypatch, capsys):
+        """Test the update menu with nothing to update."""
+        answer(monkeypatch, "", "5", "", "10")
+
+        console.run()
+
+        assert "No tasks to update." in capsys.readouterr().out
+
+    def test_mark_complete_and_incomplete(self, console, monkeypatch, capsys):
+        """Test toggling completion through the menus."""
+        add_tasks(console, 1)
+        answer(
+            monkeypatch,
+            *("", "6", "1", ""),
+            *("6", ""),
+            *("7", "1", ""),
+            *("7", ""),
+            "10",
+        )
+
+        console.run()
+
+        output = capsys.readouterr().out
+        assert not console.manager.get_task(1).completed
+        assert "Task marked as complete!" in output
+        assert "No pending tasks! All done!" in output
+        assert "Task marked as incomplete!" in output
+        assert "No completed tasks to mark as incomplete." in output
+
+    @pytest.mark.parametrize("menu", ["6", "7"])
+    def test_mark_errors(self, console, monkeypatch, capsys, menu):
+        """Test invalid and unknown IDs in the completion menus."""
+        add_tasks(console, 1)
+        if menu == "7":
+            console.manager.mark_complete(1)
+        answer(monkeypatch, "", menu, "abc", "", menu, "99", "", "10")
+
+        console.run()
+
+        output = capsys.readouterr().out
+        assert "Invalid task ID" in output
+        assert "Task with ID 99 not found" in output
+
+    def test_delete_task(self, console, monkeypatch, capsys):
+        """Test cancelling, confirming and failing deletions."""
+        add_tasks(console, 2)
+        console.manager.mark_complete(2)
+        answer(
+            monkeypatch,
+            *("", "8", "1", "n", ""),
+            *("8", "1", "y", ""),
+            *("8", "abc", ""),
+            *("8", "99", ""),
+            *("8", "2", "y", ""),
+            *("8", ""),
+            "10",
+        )
+
+        console.run()
+
+        output = capsys.readouterr().out
+        assert console.manager.count_tasks() == 0
+        assert "Deletion cancelled." in output
+        assert "Task 'Task 1' (ID: 1) deleted successfully!" in output
+        assert "Invalid task ID" in output
+        assert "Task with ID 99 not found" in output
+        assert "No tasks to delete." in output
+
+    def test_search(self, console, monkeypatch, capsys):
+        """Test that menu entry 9 lists matching tasks."""
+        console.manager.add_task(title="Buy oat milk", description="2 litres")
+        console.manager.add_task(title="Walk the dog")
+        console.manager.add_task(title="Milk the goat")
+        answer(monkeypatch, "", "9", "milk", "", "10")
+
+        console.run()
+
+        output = capsys.readouterr().out
+        assert "Buy oat milk" in output
+        assert "Milk the goat" in output
+        assert "Walk the dog" not in output
+        assert "2 matching tasks" in output
+
+    def test_search_without_matches(self, console, monkeypatch, capsys):
+        """Test the message for a search with no results."""
+        add_tasks(console, 2)
+        answer(monkeypatch, "", "9", "bread", "", "10")
+
+        console.run()
+
+        assert "No tasks matching 'bread'." in capsys.readouterr().out
+
+    def test_invalid_choice(self, console, monkeypatch, capsys):
+        """Test that an unknown menu choice is reported."""
+        answer(monkeypatch, "", "42", "", "10")
+
+        console.run()
+
+        output = capsys.readouterr().out
+        assert "Invalid choice" in output
+        assert "Thank you for using" in output
+
+
+class TestMain:
+    """Test suite for the ui entry point."""
+
+    def test_clears_screen(self, monkeypatch):
+        """Test that clear_screen runs the platform's clear command."""
+        commands = []
+        monkeypatch.setattr(os, "system", commands.append)
+
+        TodoUI().clear_screen()
+
+        assert commands == ["cls" if os.name == "nt" else "clear"]
+
+    @pytest.mark.parametrize(
+        ("error", "code", "message"),
+        [(KeyboardInterrupt, 0, "Goodbye"), (RuntimeError, 1, "unexpected error")],
+    )
+    def test_exit_codes(self, monkeypatch, capsys, error, code, message):
+        """Test that interrupts and crashes end the program cleanly."""
+
+        def fail(self):
+            raise error
+
+        monkeypatch.setattr(TodoUI, "run", fail)
+
+        with pytest.raises(SystemExit) as excinfo:
+            ui.main()
+
+        assert excinfo.value.code == code
+        assert message in capsys.readouterr().out
@@ -0,0 +1,288 @@
+"""
+Unit tests for the Flask web API.
+
+Target: 100% code coverage for web.py
+"""
+
+import gzip
+import socket
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+from todo_app.manager import TodoManager  # noqa: E402
+from todo_app.storage import JournalStorage  # noqa: E402
+from todo_app.web import MAX_PAGE_SIZE, create_app  # noqa: E402
+
+
+@pytest.fixture
+def manager():
+    """Return the manager served by the test app."""
+    return TodoManager()
+
+
+@pytest.fixture
+def client(manager):
+    """Return a test client for an app serving manager."""
+    return create_app(manager).test_client()
+
+
+class TestTaskEndpoints:
+    """Test suite for the CRUD endpoints."""
+
+    def test_create_and_get(self, client):
+        """Test that POST creates a task and GET returns it."""
+        response = client.post(
+            "/tasks", json={"title": "Buy milk", "description": "2 litres"}
+        )
+
+        assert response.status_code == 201
+        assert response.headers["Location"] == "/tasks/1"
+        assert response.json["title"] == "Buy milk"
+
+        task = client.get("/tasks/1").json
+        assert (task["id"], task["description"], task["completed"]) == (
+            1,
+            "2 litres",
+            False,
+        )
+
+    def test_create_validates_body(self, client):
+        """Test that invalid bodies are rejected with 400."""
+        assert client.post("/tasks", data="not json").status_code == 400
+        assert client.post("/tasks", json={"title": 5}).status_code == 400
+        response = client.post("/tasks", json={"title": ""})
+
+        assert response.status_code == 400
+        assert "error" in response.json
+
+    def test_update_toggle_delete(self, client, manager):
+        """Test PATCH, toggle and DELETE."""
+        manager.add_task(title="Old")
+
+        response = client.patch("/tasks/1", json={"title": "New"})
+        assert response.json["title"] == "New"
+        assert client.patch("/tasks/1", json={}).status_code == 400
+
+        assert client.post("/tasks/1/toggle").json["completed"] is True
+        assert client.delete("/tasks/1").status_code == 204
+        assert manager.count_tasks() == 0
+
+    def test_missing_task_returns_404(self, client):
+        """Test that unknown IDs return 404 with an error message."""
+        for response in (
+            client.get("/tasks/9"),
+            client.patch("/tasks/9", json={"title": "x"}),
+            client.post("/tasks/9/toggle"),
+            client.delete("/tasks/9"),
+        ):
+            assert response.status_code == 404
+            assert "not found" in response.json["error"]
+
+    def test_healthz(self, client):
+        """Test the liveness probe."""
+        assert client.get("/healthz").json == {"status": "ok"}
+
+
+class TestListEndpoint:
+    """Test suite for paged and filtered listing."""
+
+    def test_pages_and_filters(self, client, manager):
+        """Test limit/after paging and the status filter."""
+        for i in range(5):
+            manager.add_task(title=f"Task {i}")
+        manager.mark_complete(task_id=2)
+
+        first = client.get("/tasks?limit=2").json
+        assert [t["id"] for t in first["tasks"]] == [1, 2]
+        assert first["next_after"] == 2
+
+        last = client.get("/tasks?limit=2&after=4").json
+        assert [t["id"] for t in last["tasks"]] == [5]
+        assert last["next_after"] is None
+
+        done = client.get("/tasks?status=completed").json
+        assert [t["id"] for t in done["tasks"]] == [2]
+
+    def test_invalid_parameters(self, client):
+        """Test that bad status or limit values return 400."""
+        assert client.get("/tasks?status=archived").status_code == 400
+        assert client.get("/tasks?limit=0").status_code == 400
+        assert client.get(f"/tasks?limit={MAX_PAGE_SIZE + 1}").status_code == 400
+
+
+class TestDeltaEndpoint:
+    """Test suite for GET /tasks?since=<version>."""
+
+    def test_since_returns_changes(self, client, manager):
+        """Test that a client catches up with only the changes."""
+        client.post("/tasks", json={"title": "One"})
+        client.post("/tasks", json={"title": "Two"})
+        version = client.get("/tasks?since=0").json["version"]
+
+        client.patch("/tasks/2", json={"title": "Second"})
+        client.delete("/tasks/1")
+
+        body = client.get(f"/tasks?since={version}").json
+        assert body["version"] == 4
+        assert [task["title"] for task in body["changed"]] == ["Second"]
+        assert body["deleted"] == [1]
+
+    def test_expired_and_invalid_versions(self, client):
+        """Test that unknown versions ask for a resync and bad ones fail."""
+        response = client.get("/tasks?since=5")
+        assert response.status_code == 410
+        assert "ahead" in response.json["error"]
+        assert client.get("/tasks?since=-1").status_code == 400
+
+    def test_versions_before_restart_expire(self, tmp_path):
+        """Test that a client synced before a restart is told to resync."""
+        path = str(tmp_path / "tasks.journal")
+        manager = TodoManager(storage=JournalStorage(path))
+        client = create_app(manager).test_client()
+        client.post("/tasks", json={"title": "One"})
+        client.post("/tasks", json={"title": "Two"})
+        client.delete("/tasks/1")
+        manager.close()
+
+        client = create_app(TodoManager(storage=JournalStorage(path))).test_client()
+
+        assert client.get("/tasks?since=1").status_code == 410
+        body = client.get("/tasks?since=3").json
+        assert (body["version"], body["changed"], body["deleted"]) == (3, [], [])
+
+
+class TestEventStream:
+    """Test suite for GET /events."""
+
+    def test_stream_and_resume(self, client, manager):
+        """Test that events stream as they happen and resume by ID."""
+        manager.add_task(title="Before")
+        response = client.get("/events")
+        chunks = response.iter_encoded()
+
+        assert response.mimetype == "text/event-stream"
+        assert "ETag" not in response.headers
+        assert next(chunks).startswith(b"retry:")
+        client.post("/tasks", json={"title": "Live"})
+        assert next(chunks).startswith(b"id: 2\nevent: add\n")
+        response.close()
+
+        resumed = client.get("/events", headers={"Last-Event-ID": "0"})
+        chunks = resumed.iter_encoded()
+        next(chunks)
+        assert next(chunks).count(b"event: add") == 2
+        resumed.close()
+
+    def test_resume_across_restart(self, tmp_path):
+        """Test that a restarted server resumes or resets streams correctly."""
+        path = str(tmp_path / "tasks.journal")
+        manager = TodoManager(storage=JournalStorage(path))
+        manager.add_task(title="One")
+        manager.add_task(title="Two")
+        manager.close()
+        manager = TodoManager(storage=JournalStorage(path))
+        client = create_app(manager).test_client()
+
+        stale = client.get("/events", headers={"Last-Event-ID": "1"})
+        chunks = stale.iter_encoded()
+        next(chunks)
+        assert next(chunks).startswith(b"id: 2\nevent: reset\n")
+        stale.close()
+
+        current = client.get("/events", headers={"Last-Event-ID": "2"})
+        chunks = current.iter_encoded()
+        next(chunks)
+        manager.add_task(title="Three")
+        assert next(chunks).startswith(b"id: 3\nevent: add\n")
+        current.close()
+
+    def test_stream_limit(self, manager):
+        """Test that streams beyond the cap are refused until one closes."""
+        client = create_app(manager, max_streams=1).test_client()
+        first = client.get("/events")
+
+        refused = client.get("/events")
+        assert refused.status_code == 503
+        assert refused.headers["Retry-After"] == "5"
+        assert client.get("/tasks").status_code == 200
+
+        first.close()
+        second = client.get("/events")
+        assert second.status_code == 200
+        second.close()
+
+    def test_event_server(self, manager, monkeypatch):
+        """Test that EVENTS_PORT serves the manager's changes via asyncio."""
+        monkeypatch.setenv("EVENTS_PORT", "0")
+        app = create_app(manager)
+        server = app.extensions["todo_event_server"]
+        stream = socket.create_connection(("127.0.0.1", server.port), timeout=5)
+        stream.sendall(b"GET /events HTTP/1.1\r\nHost: x\r\n\r\n")
+        received = b""
+        while b"retry:" not in received:
+            received += stream.recv(4096)
+
+        app.test_client().post("/tasks", json={"title": "Live"})
+        while b"event: add" not in received:
+            received += stream.recv(4096)
+        stream.close()
+        server.close()
+
+        assert b'"title":"Live"' in received
+
+    def test_since_parameter(self, client, manager):
+        """Test that ?since= starts a stream after a synced version."""
+        manager.add_task(title="One")
+        manager.add_task(title="Two")
+        response = client.get("/events?since=1")
+        chunks = response.iter_encoded()
+        next(chunks)
+
+        assert next(chunks).startswith(b"id: 2\n")
+        response.close()
+
+
+class TestHttpOptimizations:
+    """Test suite for conditional GETs and compression."""
+
+    def test_etag_and_not_modified(self, client, manager):
+        """Test that If-None-Match returns 304 until the data changes."""
+        manager.add_task(title="Task")
+        etag = client.get("/tasks").headers["ETag"]
+
+        cached = client.get("/tasks", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.data == b""
+
+        manager.add_task(title="Another")
+        fresh = client.get("/tasks", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+
+    def test_gzip_large_responses(self, client, manager):
+        """Test that large JSON bodies are gzipped when accepted."""
+        for i in range(50):
+            manager.add_task(title=f"Task number {i}")
+
+        response = client.get("/tasks", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert b"Task number 49" in gzip.decompress(response.data)
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+        plain = client.get("/tasks")
+        assert "Content-Encoding" not in plain.headers
+
+    def test_small_responses_not_gzipped(self, client):
+        """Test that tiny bodies are sent uncompressed."""
+        response = client.get("/healthz", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+
+    def test_cors_headers(self, client):
+        """Test that CORS headers are added."""
+        response = client.get("/healthz", headers={"Origin": "http://example.com"})
+
+        assert response.headers["Access-Control-Allow-Origin"] == "http://example.com"